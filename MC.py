@@ -15,13 +15,18 @@ from rnd_uniform.uniform import r8vec_uniform_01, r8mat_uniform_01, r8_uniform_0
 from rnd_uniform.sample import triangle01_sample, cube01_sample, ball01_sample, annulus_sample
 from rnd_uniform.sample import circle01_sample_ergodic, circle01_sample_random
 from rnd_uniform.sample import hypercube01_sample, polygon_sample, ellipsoid_sample
-from base import plot2d, PlotBase, create_tempnum
+from base import plot2d, PlotBase, create_tempnum, set_headless
+from optparse import OptionParser
 
 
 class MonteCarlo (plot2d):
 
-    def __init__(self, aspect='equal'):
+    def __init__(self, aspect='equal', nmax=2**14, density_nmin=None, jobs=None):
         plot2d.__init__(self, aspect=aspect)
+        if density_nmin is not None:
+            self.density_nmin = density_nmin
+        if jobs is not None:
+            self.render_async(jobs)
         self.create_tempdir(-1)
 
         v0 = np.array([
@@ -48,7 +53,7 @@ class MonteCarlo (plot2d):
 
         seed = 123456789
         n = 2**5
-        while (n <= 2**14):
+        while (n <= nmax):
             print("n={:d}".format(n))
             self.PlotTest(*triangle01_sample(n, seed),
                           title="triangle")
@@ -70,25 +75,42 @@ class MonteCarlo (plot2d):
             self.PlotTest(*ellipsoid_sample(3, n, a, v1, r1, seed),
                           title="ellipoisd")
             n = 2 * n
+        self.render_wait()
 
     def PlotTest(self, x, seed, title=None):
         dim, num = x.shape
         titletxt = "{} n={:d}".format(title, num)
         if title == None:
-            pngname = create_tempnum(self.tempname, ext=".png")
+            pngname = self.tempname + ".png"
         else:
-            pngname = create_tempnum(self.tempname + "_" + title, ext=".png")
+            pngname = self.tempname + "_" + title + ".png"
 
         if dim == 2:
-            self.new_2Dfig()
-            self.axs.scatter(*x, s=0.5)
-            self.axs.set_title(titletxt)
-            self.SavePng(pngname)
+            self.scatter_frame(x, titletxt, pngname=pngname)
+        elif num >= self.density_nmin:
+            self.density_frame(x, titletxt, pngname=pngname)
         else:
+            if not self.headless:
+                pngname = create_tempnum(pngname[:-4], ext=".png")
             self.new_2Dfig()
             self.contourf_tri(*x, title=titletxt, pngname=pngname)
-        plt.close("all")
 
 
 if (__name__ == '__main__'):
-    obj = MonteCarlo()
+    parser = OptionParser()
+    parser.add_option("--headless", dest="headless", action="store_true",
+                      default=False,
+                      help="store the samples instead of plotting them; "
+                      "render them later with render.py")
+    parser.add_option("--nmax", dest="nmax", type="int", default=2**14,
+                      help="largest sample size")
+    parser.add_option("--density", dest="density", type="int", default=None,
+                      help="draw density images instead of markers "
+                      "from this sample size on")
+    parser.add_option("--jobs", dest="jobs", type="int", default=None,
+                      help="render the scatter plots in this many "
+                      "background processes")
+    opt, argc = parser.parse_args()
+    if opt.headless:
+        set_headless()
+    obj = MonteCarlo(nmax=opt.nmax, density_nmin=opt.density, jobs=opt.jobs)
@@ -1,24 +1,44 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.tri as tri
+import matplotlib
 import sys
 import pickle
 import json
 import time
 import os
+import re
 import glob
 import shutil
 import datetime
 import platform
-from scipy.spatial import ConvexHull, Delaunay
 from optparse import OptionParser
-from matplotlib import animation
-from mpl_toolkits.axes_grid1 import make_axes_locatable
-from mpl_toolkits.mplot3d import Axes3D
+from functools import lru_cache
+
+#
+#  Headless mode (MC_HEADLESS=1, or set_headless()) runs the numerical
+#  part only.  Nothing is rendered: the samples that would have been
+#  plotted are stored with results.ResultStore, and render.py plots them
+#  afterwards, in parallel and only for the n that are wanted.
+#
+HEADLESS = os.environ.get("MC_HEADLESS", "") not in ("", "0")
+#
+#  MC_RENDER_JOBS=N renders the frames of every PlotBase in N background
+#  processes, as PlotBase.render_async does.
+#
+RENDER_JOBS = int(os.environ.get("MC_RENDER_JOBS", "0") or 0)
+if HEADLESS:
+    matplotlib.use("Agg")
+
+from results import ResultStore
 
 import logging
 logging.getLogger('matplotlib').setLevel(logging.ERROR)
 
+#
+#  matplotlib.pyplot, scipy.spatial, matplotlib.animation and mpl_toolkits
+#  are imported by the methods that use them, so that importing base stays
+#  cheap.
+#
+
 
 def create_tempdir(flag=1):
     print(datetime.date.today())
@@ -35,11 +55,120 @@ def create_tempdir(flag=1):
     return tmpdir
 
 
+def set_headless(flag=True):
+    global HEADLESS
+    HEADLESS = flag
+    if flag:
+        matplotlib.use("Agg")
+
+
+#
+#  Numbered output files, <name>_NNN<ext>.  The last number of each name
+#  is kept in TEMPNUM, seeded once from the directory, so a save costs
+#  O(1) instead of a glob over the directory.  Each name is claimed by
+#  creating its file empty with O_EXCL, so that no other process sharing
+#  the directory, and no frame still in the render queue, gets the same
+#  number; a number whose file already exists is skipped.  The file is
+#  then written over by savefig, or removed by savefig_tempnum (and
+#  RenderQueue.collect) if that fails.  Headless runs never save, and
+#  never claim a name.
+#
+TEMPNUM = {}
+
+
+def tempnum_seed(prefix, ext):
+    dirname, name = os.path.split(prefix)
+    pattern = re.compile(re.escape(name) + r"_(\d+)" + re.escape(ext) + "$")
+    num = 0
+    if os.path.isdir(dirname or "."):
+        for filename in os.listdir(dirname or "."):
+            match = pattern.match(filename)
+            if match:
+                num = max(num, int(match.group(1)))
+    return num
+
+
 def create_tempnum(name, tmpdir="./", ext=".tar.gz"):
-    num = len(glob.glob(tmpdir + name + "*" + ext)) + 1
-    filename = '{}{}_{:03}{}'.format(tmpdir, name, num, ext)
-    #print(num, filename)
-    return filename
+    prefix = tmpdir + name
+    key = (os.path.abspath(prefix), ext)
+    if key not in TEMPNUM:
+        TEMPNUM[key] = tempnum_seed(prefix, ext)
+    while True:
+        TEMPNUM[key] += 1
+        filename = '{}_{:03}{}'.format(prefix, TEMPNUM[key], ext)
+        try:
+            os.close(os.open(filename,
+                             os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+        except FileExistsError:
+            continue
+        return filename
+
+
+def savefig_tempnum(fig, filename):
+    # write FIG over the empty file claimed by create_tempnum; if that
+    # fails, remove the empty file before passing the error on
+    try:
+        fig.savefig(filename)
+    except Exception:
+        if os.path.isfile(filename) and os.path.getsize(filename) == 0:
+            os.remove(filename)
+        raise
+
+
+def delaunay_tri(x, y):
+    # the Delaunay triangulation of the points (X,Y) as a
+    # matplotlib.tri.Triangulation, and the segments of its convex hull.
+    # The last few are cached by the point coordinates, so repeated plots
+    # of one sample set triangulate it once.
+    pnt = np.ascontiguousarray(np.array([x, y], dtype=np.float64).T)
+    return delaunay_tri_cached(pnt.tobytes(), pnt.shape[0])
+
+
+@lru_cache(maxsize=8)
+def delaunay_tri_cached(buf, n):
+    from scipy.spatial import Delaunay
+    from matplotlib.tri import Triangulation
+    pnt = np.frombuffer(buf, dtype=np.float64).reshape(n, 2)
+    dt = Delaunay(pnt)
+    tri = Triangulation(pnt[:, 0], pnt[:, 1], dt.simplices)
+    return tri, pnt[dt.convex_hull]
+
+
+def density_count(x, lim=None, bins=512, planes=None):
+    # bin X(DIM,N), or an iterable of X(DIM,K) chunks such as
+    # rnd_uniform.sample.sample_stream, into BINS x BINS counts for each
+    # coordinate plane (I,J) in PLANES, one chunk in memory at a time.
+    # LIM is [x0, x1, y0, y1, ...] per coordinate, by default the bounds
+    # of the first chunk; points outside it are dropped.
+    if isinstance(x, np.ndarray):
+        x = [x]
+    counts = None
+    n = 0
+    for xc in x:
+        xc = np.asarray(xc)
+        dim = xc.shape[0]
+        if counts is None:
+            if planes is None:
+                planes = [(0, 1)] if dim == 2 else \
+                    [(i, j) for i in range(dim) for j in range(i + 1, dim)]
+            if lim is None:
+                lo, hi = xc.min(axis=1), xc.max(axis=1)
+                lim = np.array([lo, hi]).T.ravel().tolist()
+            lo = np.array(lim[0::2], dtype=float)
+            hi = np.array(lim[1::2], dtype=float)
+            scale = bins / np.where(hi > lo, hi - lo, 1.0)
+            counts = np.zeros([len(planes), bins * bins], dtype=np.int64)
+        n += xc.shape[1]
+        inside = (lo[:dim, None] <= xc) & (xc <= hi[:dim, None])
+        idx = ((xc - lo[:dim, None]) * scale[:dim, None]).astype(np.intp)
+        np.minimum(idx, bins - 1, out=idx)
+        for p, (i, j) in enumerate(planes):
+            k = inside[i] & inside[j]
+            counts[p] += np.bincount(idx[j, k] * bins + idx[i, k],
+                                     minlength=bins * bins)
+    if counts is None:
+        return None, lim, planes, 0
+    return counts.reshape(len(planes), bins, bins), lim, planes, n
 
 
 class SetDir (object):
@@ -71,10 +200,183 @@ class SetDir (object):
 
 class PlotBase(SetDir):
 
+    # scatter_frame draws a density image instead of markers from this
+    # many points on
+    density_nmin = 2**17
+
     def __init__(self, aspect="equal"):
         SetDir.__init__(self)
         self.dim = 2
-        self.fig, self.axs = plt.subplots()
+        self.store = None
+        self.queue = None
+        # self.fig is made by new_fig, and reused by later new_fig calls;
+        # the frames of scatter_frame and density_frame keep their own
+        # figures in self.frames.  close() releases them all.
+        self.fig, self.axs = None, None
+        self.frames = {}
+        if RENDER_JOBS > 0:
+            self.render_async(RENDER_JOBS)
+
+    @property
+    def headless(self):
+        return HEADLESS
+
+    @property
+    def results(self):
+        # one store per output directory, made on first use
+        if self.store is None or self.store.dirname != self.tmpdir:
+            self.store = ResultStore(self.tmpdir, self.rootname)
+        return self.store
+
+    def render_async(self, processes=None):
+        # from now on scatter_frame and density_frame hand their frames to
+        # a render.RenderQueue and return at once; render_wait collects
+        # them.  Headless runs store the frames instead.
+        if HEADLESS or self.queue is not None:
+            return
+        from render import RenderQueue
+        self.queue = RenderQueue(processes)
+
+    def render_wait(self):
+        if self.queue is None:
+            return []
+        pngnames = self.queue.close()
+        self.queue = None
+        return pngnames
+
+    def scatter_frame(self, x, title="", pngname=None, lim=None, s=0.5, equal=False):
+        # one frame of a convergence series: scatter X(DIM,N) and save it
+        # as SavePng_Serial does.  The figure of the first frame is kept,
+        # and later frames only replace its points.  In headless mode the
+        # samples are stored instead, to be drawn later by render.py.
+        # Large samples, and chunk iterators, go to density_frame.
+        if not isinstance(x, np.ndarray) or x.shape[1] >= self.density_nmin:
+            return self.density_frame(x, title, pngname, lim)
+        if HEADLESS:
+            name = self.rootname
+            if pngname is not None:
+                name, _ = os.path.splitext(os.path.basename(pngname))
+            self.results.add({"kind": "scatter", "name": name,
+                              "title": title, "lim": lim, "s": s}, x)
+            return None
+        if self.queue is not None:
+            return self.queue.submit({"kind": "scatter", "x": x.copy(),
+                                      "title": title, "lim": lim, "s": s,
+                                      "equal": equal,
+                                      "pngname": self.serial_pngname(pngname)})
+
+        import matplotlib.pyplot as plt
+        dim = x.shape[0]
+        frame = self.frame_get(("scatter", dim))
+        if frame is None:
+            if dim == 3:
+                from mpl_toolkits.mplot3d import Axes3D
+                fig = plt.figure()
+                axs = fig.add_subplot(111, projection='3d')
+                axs.set_xlabel('x')
+                axs.set_ylabel('y')
+                axs.set_zlabel('z')
+            else:
+                fig, axs = plt.subplots()
+                axs.set_aspect("equal")
+                axs.xaxis.grid()
+                axs.yaxis.grid()
+            sc = axs.scatter(*x, s=s)
+        elif dim == 3:
+            # 3D collections have no public set_offsets: only the
+            # artist is replaced, the figure and axes are kept
+            fig, axs, sc = frame
+            sc.remove()
+            axs.set_autoscale_on(True)
+            sc = axs.scatter(*x, s=s, color="C0")
+        else:
+            fig, axs, sc = frame
+            sc.set_offsets(x.T)
+            sc.set_sizes([s])
+            axs.ignore_existing_data_limits = True
+            axs.update_datalim(x.T)
+        self.frames[("scatter", dim)] = (fig, axs, sc)
+
+        axs.set_title(title)
+        if lim is not None:
+            axs.set_xlim(lim[0], lim[1])
+            axs.set_ylim(lim[2], lim[3])
+        elif dim != 3:
+            axs.set_autoscale_on(True)
+            axs.autoscale_view()
+        if equal and dim == 3:
+            from render import set_axes_equal
+            set_axes_equal(axs)
+        pngname = self.serial_pngname(pngname)
+        savefig_tempnum(fig, pngname)
+        return pngname
+
+    def density_frame(self, x, title="", pngname=None, lim=None, bins=512, planes=None):
+        # the samples X(DIM,N), or a chunk iterator, binned with
+        # density_count and drawn as one image per coordinate plane, so
+        # the cost of the plot does not grow with N
+        counts, lim, planes, n = density_count(x, lim, bins, planes)
+        if counts is None:
+            return None
+        if HEADLESS:
+            name = self.rootname
+            if pngname is not None:
+                name, _ = os.path.splitext(os.path.basename(pngname))
+            self.results.add({"kind": "density", "name": name, "n": n,
+                              "title": title, "lim": lim, "planes": planes},
+                             counts, stats=False)
+            return None
+        if self.queue is not None:
+            return self.queue.submit({"kind": "density", "x": counts, "n": n,
+                                      "title": title, "lim": lim,
+                                      "planes": planes,
+                                      "pngname": self.serial_pngname(pngname)})
+
+        import matplotlib.pyplot as plt
+        from render import density_draw, density_image, density_extent, density_title
+        key = ("density", tuple(map(tuple, planes)))
+        frame = self.frame_get(key)
+        if frame is None:
+            fig = plt.figure(figsize=(5.0 * len(planes), 4.0))
+            images = density_draw(fig, counts, lim, planes, n, title)
+            self.frames[key] = (fig, None, images)
+        else:
+            fig, _, images = frame
+            for p, (i, j) in enumerate(planes):
+                ext = density_extent(lim, i, j)
+                images[p].set_data(density_image(counts[p], ext, n))
+                images[p].set_extent(ext)
+                images[p].autoscale()
+            density_title(fig, images, title)
+        pngname = self.serial_pngname(pngname)
+        savefig_tempnum(fig, pngname)
+        return pngname
+
+    def frame_get(self, key):
+        # the (fig, axs, artist) of a frame figure that is still open
+        import matplotlib.pyplot as plt
+        frame = self.frames.get(key)
+        if frame is None or not plt.fignum_exists(frame[0].number):
+            return None
+        return frame
+
+    def fig_reusable(self, name):
+        # self.fig can be cleared and reused for a plain single-axes plot
+        # of projection NAME ("rectilinear" or "3d")
+        import matplotlib.pyplot as plt
+        return (self.fig is not None and plt.fignum_exists(self.fig.number)
+                and self.fig.axes == [self.axs] and not self.fig.texts
+                and self.axs.name == name)
+
+    def close(self):
+        # close self.fig and the frame figures
+        import matplotlib.pyplot as plt
+        if self.fig is not None:
+            plt.close(self.fig)
+        for fig, axs, artist in self.frames.values():
+            plt.close(fig)
+        self.fig, self.axs = None, None
+        self.frames = {}
 
     def new_fig(self, aspect="equal", dim=None):
         if dim == None:
@@ -87,14 +389,29 @@ class PlotBase(SetDir):
             self.new_2Dfig(aspect=aspect)
 
     def new_2Dfig(self, aspect="equal"):
-        self.fig, self.axs = plt.subplots()
+        # clear and reuse self.fig when it is a plain 2D figure, rather
+        # than allocate a new one; otherwise close it and make a new one
+        import matplotlib.pyplot as plt
+        if self.fig_reusable("rectilinear"):
+            self.axs.cla()
+        else:
+            if self.fig is not None:
+                plt.close(self.fig)
+            self.fig, self.axs = plt.subplots()
         self.axs.set_aspect(aspect)
         self.axs.xaxis.grid()
         self.axs.yaxis.grid()
 
     def new_3Dfig(self, aspect="equal"):
-        self.fig = plt.figure()
-        self.axs = self.fig.add_subplot(111, projection='3d')
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D
+        if self.fig_reusable("3d"):
+            self.axs.cla()
+        else:
+            if self.fig is not None:
+                plt.close(self.fig)
+            self.fig = plt.figure()
+            self.axs = self.fig.add_subplot(111, projection='3d')
         #self.axs = self.fig.gca(projection='3d')
         # self.axs.set_aspect('equal')
 
@@ -107,12 +424,16 @@ class PlotBase(SetDir):
         self.axs.zaxis.grid()
 
     def SavePng(self, pngname=None):
+        if HEADLESS:
+            return pngname
         if pngname == None:
             pngname = self.tmpdir + self.rootname + ".png"
-        self.fig.savefig(pngname)
+        savefig_tempnum(self.fig, pngname)
         return pngname
 
-    def SavePng_Serial(self, pngname=None):
+    def serial_pngname(self, pngname=None):
+        # the next numbered name for PNGNAME, as SavePng_Serial uses,
+        # claimed as an empty file by create_tempnum
         if pngname == None:
             pngname = self.rootname
             dirname = self.tmpdir
@@ -120,11 +441,17 @@ class PlotBase(SetDir):
             dirname = os.path.dirname(pngname) + "/"
             basename = os.path.basename(pngname)
             pngname, extname = os.path.splitext(basename)
-        pngname = create_tempnum(pngname, dirname, ".png")
-        self.fig.savefig(pngname)
+        return create_tempnum(pngname, dirname, ".png")
+
+    def SavePng_Serial(self, pngname=None):
+        if HEADLESS:
+            return pngname
+        pngname = self.serial_pngname(pngname)
+        savefig_tempnum(self.fig, pngname)
         return pngname
 
     def Show(self):
+        import matplotlib.pyplot as plt
         try:
             plt.show()
         except AttributeError:
@@ -148,6 +475,7 @@ class plot2d (PlotBase):
         return axs
 
     def div_axs(self):
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
         self.div = make_axes_locatable(self.axs)
         # self.axs.set_aspect('equal')
 
@@ -193,7 +521,21 @@ class plot2d (PlotBase):
             self.SavePng(pngname)
 
     def contourf_tri(self, x, y, z, lim=[-1, 1, -1, 1], title="", pngname=None):
-        self.axs.tricontourf(x, y, z, cmap="jet")
+        if HEADLESS:
+            name = self.rootname
+            if pngname is not None:
+                name, _ = os.path.splitext(os.path.basename(pngname))
+            self.results.add({"kind": "contourf_tri", "name": name,
+                              "title": title, "lim": lim},
+                             np.array([x, y, z]))
+            return None
+
+        # one triangulation serves the contour and the edge overlays, and
+        # one figure the three PNGs: the layers are added, and the contour
+        # taken away again, between the saves
+        from matplotlib.collections import LineCollection
+        tri, hull = delaunay_tri(x, y)
+        cs = self.axs.tricontourf(tri, z, cmap="jet")
         self.axs.set_title(title)
         self.axs.set_xlim(lim[0], lim[1])
         self.axs.set_ylim(lim[2], lim[3])
@@ -206,31 +548,18 @@ class plot2d (PlotBase):
         self.axs.scatter(x, y, 5.0)
         self.SavePng(png_root + "_dot.png")
 
-        pnt = np.array([x, y]).T
-        cov = ConvexHull(pnt)
-        tri = Delaunay(pnt)
-        for idx in tri.simplices:
-            xi = pnt[idx, 0]
-            yi = pnt[idx, 1]
-            self.axs.plot(xi, yi, "k", lw=0.5)
-        self.axs.plot(pnt[cov.vertices, 0],
-                      pnt[cov.vertices, 1], "k", lw=1.0)
+        edge = self.axs.triplot(tri, "k-", lw=0.5)[0]
+        edge_hull = LineCollection(hull, colors="k", linewidths=1.0)
+        self.axs.add_collection(edge_hull, autolim=False)
         self.SavePng(png_root + "_grd.png")
 
-        self.new_2Dfig()
-        self.axs.set_title(title)
-        self.axs.scatter(x, y, 5.0)
-        self.axs.set_xlim(lim[0], lim[1])
-        self.axs.set_ylim(lim[2], lim[3])
-        for idx in tri.simplices:
-            xi = pnt[idx, 0]
-            yi = pnt[idx, 1]
-            self.axs.plot(xi, yi, "k", lw=0.75)
-        self.axs.plot(pnt[cov.vertices, 0],
-                      pnt[cov.vertices, 1], "k", lw=1.5)
+        cs.remove()
+        edge.set_linewidth(0.75)
+        edge_hull.set_linewidth(1.5)
         self.SavePng(png_root + "_grid.png")
 
     def contourf_div(self, mesh, func, loc=[0, 0], txt="", title="name", pngname=None, level=None):
+        import matplotlib.pyplot as plt
         sx, sy = loc
         nx, ny = func.shape
         xs, ys = mesh[0][0, 0], mesh[1][0, 0]
@@ -258,6 +587,7 @@ class plot2d (PlotBase):
             self.SavePng(pngname)
 
     def contourf_div_auto(self, mesh, func, loc=[0, 0], txt="", title="name", pngname=None, level=None):
+        import matplotlib.pyplot as plt
         sx, sy = loc
         nx, ny = func.shape
         xs, ys = mesh[0][0, 0], mesh[1][0, 0]
@@ -294,34 +624,9 @@ class plot3d (PlotBase):
         self.new_fig()
 
     def set_axes_equal(self):
-        '''
-        Make axes of 3D plot have equal scale so that spheres appear as spheres,
-        cubes as cubes, etc..  This is one possible solution to Matplotlib's
-        ax.set_aspect('equal') and ax.axis('equal') not working for 3D.
-
-        Input
-          ax: a matplotlib axis, e.g., as output from plt.gca().
-        '''
-
-        x_limits = self.axs.get_xlim3d()
-        y_limits = self.axs.get_ylim3d()
-        z_limits = self.axs.get_zlim3d()
-
-        x_range = abs(x_limits[1] - x_limits[0])
-        y_range = abs(y_limits[1] - y_limits[0])
-        z_range = abs(z_limits[1] - z_limits[0])
-
-        x_middle = np.mean(x_limits)
-        y_middle = np.mean(y_limits)
-        z_middle = np.mean(z_limits)
-
-        # The plot bounding box is a sphere in the sense of the infinity
-        # norm, hence I call half the max range the plot radius.
-        plot_radius = 0.5 * max([x_range, y_range, z_range])
-
-        self.axs.set_xlim3d([x_middle - plot_radius, x_middle + plot_radius])
-        self.axs.set_ylim3d([y_middle - plot_radius, y_middle + plot_radius])
-        self.axs.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
+        # equal scales on self.axs; see render.set_axes_equal
+        from render import set_axes_equal
+        set_axes_equal(self.axs)
 
     def plot_ball(self, rxyz=[1, 1, 1]):
         u = np.linspace(0, 1, 10) * 2 * np.pi
@@ -354,12 +659,15 @@ class LineDrawer(object):
         self.init_fig()
 
     def run_base(self):
+        from matplotlib import animation
         self.fig.canvas.mpl_connect('button_press_event', self.onclick)
         self.fig.canvas.mpl_connect('key_press_event', self.onkey)
         animation.FuncAnimation(
             self.fig, self.anim_animate, init_func=self.anim_init, frames=30, interval=100, blit=True)
 
     def init_fig(self):
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
         self.fig, self.axs = plt.subplots()
         self.axs.set_aspect('equal')
         self.axs.xaxis.grid()
@@ -438,6 +746,7 @@ class LineDrawer(object):
         return self.traj_line, self.record_line, self.empty
 
     def show(self):
+        import matplotlib.pyplot as plt
         try:
             plt.show()
         except AttributeError:
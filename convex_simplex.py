@@ -8,6 +8,7 @@ from optparse import OptionParser
 
 sys.path.append(os.path.join("./"))
 from base import plot2d, plot3d
+from rnd_uniform.uniform import r8vec_uniform_01
 
 import logging
 logging.getLogger('matplotlib').setLevel(logging.ERROR)
@@ -59,6 +60,73 @@ class ConvexArea2D (plot2d):
             self.axs.plot(x, y, 'b--', lw=0.2)
 
 
+class ConvexHullDomain (object):
+
+    # Convex hull of a point cloud as a domain to sample and integrate over.
+    #
+    # The hull is split once into Delaunay simplices.  A sample picks a
+    # simplex with probability proportional to its volume and puts a
+    # Dirichlet(1, ..., 1) point in it, so every sample lands in the hull.
+    # Point queries use the halfspaces (equations) of the hull.
+
+    def __init__(self, pnt, chunk=2**20):
+        self.pnt = np.asarray(pnt, dtype=np.float64)
+        self.dim = self.pnt.shape[1]
+        self.chunk = chunk
+        self.cov = ConvexHull(self.pnt)
+        self.tri = Delaunay(self.pnt)
+
+        self.vtx = self.pnt[self.tri.simplices]
+        edge = self.vtx[:, 1:, :] - self.vtx[:, 0:1, :]
+        fact = np.prod(np.arange(1, self.dim + 1, dtype=np.float64))
+        self.simplex_volume = np.abs(np.linalg.det(edge)) / fact
+        self.volume = np.sum(self.simplex_volume)
+        self.cdf = np.cumsum(self.simplex_volume) / self.volume
+
+    def sample(self, n, seed=123456789):
+        # n uniform points of the hull as X(M,N), like the rnd_uniform
+        # samplers, and the updated seed
+        m = self.dim
+        x = np.empty([m, n])
+        for i0 in range(0, n, self.chunk):
+            k = min(self.chunk, n - i0)
+            u, seed = r8vec_uniform_01((m + 2) * k, seed)
+            idx = np.minimum(np.searchsorted(self.cdf, u[0:k]),
+                             self.cdf.shape[0] - 1)
+            w = - np.log(u[k:].reshape(m + 1, k))
+            w = w / np.sum(w, axis=0)
+            x[:, i0:i0 + k] = np.einsum('jk,kji->ik', w, self.vtx[idx])
+        return x, seed
+
+    def contains(self, x, tol=1.0E-12):
+        # True for the columns of X(M,N) inside the hull.  The distances
+        # to all facets are formed for a block of columns at a time, of
+        # about chunk values in all
+        x = np.asarray(x, dtype=np.float64).reshape(self.dim, -1)
+        normal = self.cov.equations[:, 0:-1]
+        offset = self.cov.equations[:, -1:]
+        step = max(1, self.chunk // normal.shape[0])
+        inside = np.empty(x.shape[1], dtype=bool)
+        for i0 in range(0, x.shape[1], step):
+            d = normal @ x[:, i0:i0 + step] + offset
+            inside[i0:i0 + step] = np.all(d <= tol, axis=0)
+        return inside
+
+    def integral(self, func, n, seed=123456789):
+        # Monte Carlo integral of func X(M,K) -> (K,) over the hull,
+        # with its standard error and the updated seed
+        s1 = 0.0
+        s2 = 0.0
+        for i0 in range(0, n, self.chunk):
+            x, seed = self.sample(min(self.chunk, n - i0), seed)
+            f = func(x)
+            s1 = s1 + np.sum(f)
+            s2 = s2 + np.sum(f * f)
+        mean = s1 / n
+        var = max(s2 / n - mean * mean, 0.0)
+        return self.volume * mean, self.volume * np.sqrt(var / n), seed
+
+
 if __name__ == '__main__':
     argvs = sys.argv
     parser = OptionParser()
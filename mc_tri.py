@@ -58,19 +58,17 @@ class MonteCarlo (plot2d):
         dim, num = x.shape
         titletxt = "{} n={:d}".format(title, num)
         if title == None:
-            pngname = create_tempnum(self.tempname, ext=".png")
+            pngname = self.tempname + ".png"
         else:
-            pngname = create_tempnum(self.tempname + "_" + title, ext=".png")
+            pngname = self.tempname + "_" + title + ".png"
 
         if dim == 2:
-            self.new_2Dfig()
-            self.axs.scatter(*x, s=0.5)
-            self.axs.set_title(titletxt)
-            self.SavePng(pngname)
+            self.scatter_frame(x, titletxt, pngname=pngname)
         else:
+            if not self.headless:
+                pngname = create_tempnum(pngname[:-4], ext=".png")
             self.new_2Dfig()
             self.contourf_tri(*x, title=titletxt, pngname=pngname)
-        plt.close("all")
 
 
 if (__name__ == '__main__'):
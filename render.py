@@ -0,0 +1,220 @@
+import numpy as np
+import sys
+import os
+import time
+import atexit
+from multiprocessing import Pool
+from optparse import OptionParser
+
+sys.path.append(os.path.join("./"))
+from results import load_results, load_samples
+
+
+def density_image(counts, ext, n):
+    # COUNTS scaled to a probability density over the extent EXT, with
+    # the empty bins left blank
+    ny, nx = counts.shape
+    area = (ext[1] - ext[0]) * (ext[3] - ext[2]) / (nx * ny)
+    img = counts / (max(n, 1) * area)
+    img[counts == 0] = float("nan")
+    return img
+
+
+def density_extent(lim, i, j):
+    return [lim[2 * i], lim[2 * i + 1], lim[2 * j], lim[2 * j + 1]]
+
+
+def density_draw(fig, counts, lim, planes, n, title=""):
+    # one image per plane, COUNTS[P] binned as in base.density_count;
+    # the images are returned, so that a later frame can set_data them
+    images = []
+    for p, (i, j) in enumerate(planes):
+        axs = fig.add_subplot(1, len(planes), p + 1)
+        ext = density_extent(lim, i, j)
+        im = axs.imshow(density_image(counts[p], ext, n), origin="lower",
+                        extent=ext, aspect="equal",
+                        interpolation="nearest", cmap="viridis")
+        axs.set_xlabel("xyz"[i] if i < 3 else "x{}".format(i))
+        axs.set_ylabel("xyz"[j] if j < 3 else "x{}".format(j))
+        fig.colorbar(im, ax=axs, shrink=0.8)
+        images.append(im)
+    density_title(fig, images, title)
+    fig.tight_layout()
+    return images
+
+
+def density_title(fig, images, title):
+    if len(images) == 1:
+        images[0].axes.set_title(title)
+    else:
+        fig.suptitle(title)
+
+
+def set_axes_equal(axs):
+    '''
+    Make axes of 3D plot have equal scale so that spheres appear as spheres,
+    cubes as cubes, etc..  This is one possible solution to Matplotlib's
+    ax.set_aspect('equal') and ax.axis('equal') not working for 3D.
+
+    Input
+      axs: a matplotlib 3D axis.
+    '''
+
+    x_limits = axs.get_xlim3d()
+    y_limits = axs.get_ylim3d()
+    z_limits = axs.get_zlim3d()
+
+    x_range = abs(x_limits[1] - x_limits[0])
+    y_range = abs(y_limits[1] - y_limits[0])
+    z_range = abs(z_limits[1] - z_limits[0])
+
+    x_middle = np.mean(x_limits)
+    y_middle = np.mean(y_limits)
+    z_middle = np.mean(z_limits)
+
+    # The plot bounding box is a sphere in the sense of the infinity
+    # norm, hence I call half the max range the plot radius.
+    plot_radius = 0.5 * max([x_range, y_range, z_range])
+
+    axs.set_xlim3d([x_middle - plot_radius, x_middle + plot_radius])
+    axs.set_ylim3d([y_middle - plot_radius, y_middle + plot_radius])
+    axs.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
+
+
+def render_record(record):
+    # draw one frame with the Agg canvas, from its stored samples or from
+    # the array in record["x"].  Workers build the Figure directly and
+    # never touch pyplot, so a forked worker does not share the GUI
+    # backend of the parent.
+    from matplotlib.figure import Figure
+
+    if "x" in record:
+        x = record["x"]
+    else:
+        x = load_samples(record)
+    if record["kind"] == "density":
+        planes = record["planes"]
+        fig = Figure(figsize=(5.0 * len(planes), 4.0))
+        density_draw(fig, x, record["lim"], planes, record["n"],
+                     record.get("title", ""))
+        return render_save(fig, record)
+
+    dim = x.shape[0]
+    fig = Figure()
+    if record["kind"] == "contourf_tri":
+        axs = fig.add_subplot(111)
+        axs.tricontourf(*x, cmap="jet")
+    elif dim == 3:
+        axs = fig.add_subplot(111, projection="3d")
+        axs.set_xlabel('x')
+        axs.set_ylabel('y')
+        axs.set_zlabel('z')
+        axs.scatter(*x, s=record.get("s", 0.5))
+        if record.get("equal"):
+            set_axes_equal(axs)
+    else:
+        axs = fig.add_subplot(111)
+        axs.set_aspect("equal")
+        axs.xaxis.grid()
+        axs.yaxis.grid()
+        axs.scatter(*x, s=record.get("s", 0.5))
+    axs.set_title(record.get("title", ""))
+    lim = record.get("lim")
+    if lim is not None:
+        axs.set_xlim(lim[0], lim[1])
+        axs.set_ylim(lim[2], lim[3])
+    return render_save(fig, record)
+
+
+def render_save(fig, record):
+    pngname = record.get("pngname")
+    if pngname is None:
+        pngname = os.path.join(record["dirname"], "{}_{:03}.png".format(
+            record.get("name", "frame"), record["index"]))
+    fig.savefig(pngname)
+    return pngname
+
+
+class RenderQueue (object):
+
+    # Renders frames in a process pool while the caller goes on computing.
+    #
+    # submit() takes a record as render_record does, with the samples or
+    # density counts in record["x"] and the output file in
+    # record["pngname"], and returns at once.  At most PENDING frames per
+    # worker wait in the queue, so a fast loop cannot pile up samples in
+    # memory.  close() waits for the frames and returns their file names;
+    # it also runs at exit.
+
+    def __init__(self, processes=None, pending=4):
+        self.pool = Pool(processes)
+        self.pending = pending * (processes or os.cpu_count() or 1)
+        self.jobs = []
+        self.done = []
+        atexit.register(self.close)
+
+    def submit(self, record):
+        while len(self.jobs) >= self.pending:
+            self.collect()
+        job = self.pool.apply_async(render_record, (record,))
+        self.jobs.append((job, record.get("pngname")))
+        return record.get("pngname")
+
+    def collect(self):
+        # wait for the oldest frame; if it failed, remove the empty file
+        # reserved for it before passing the error on
+        job, pngname = self.jobs.pop(0)
+        try:
+            self.done.append(job.get())
+        except Exception:
+            if pngname is not None and os.path.isfile(pngname) \
+                    and os.path.getsize(pngname) == 0:
+                os.remove(pngname)
+            raise
+
+    def wait(self):
+        while self.jobs:
+            self.collect()
+        done, self.done = self.done, []
+        return done
+
+    def close(self):
+        if self.pool is None:
+            return []
+        done = self.wait()
+        self.pool.close()
+        self.pool.join()
+        self.pool = None
+        atexit.unregister(self.close)
+        return done
+
+
+def render_results(filename, n=None, processes=None):
+    # render the stored frames of a results file or directory, only those
+    # with a sample size in N if it is given, with PROCESSES workers
+    records = [r for r in load_results(filename) if "file" in r]
+    if n is not None:
+        records = [r for r in records if r["n"] in n]
+    if processes == 1 or len(records) <= 1:
+        return [render_record(r) for r in records]
+    with Pool(processes) as pool:
+        return pool.map(render_record, records, chunksize=1)
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage="%prog [options] results.jsonl|dir ...")
+    parser.add_option("--n", dest="n", default=None,
+                      help="comma separated sample sizes to render")
+    parser.add_option("--jobs", dest="jobs", type="int", default=None,
+                      help="number of worker processes")
+    opt, argc = parser.parse_args()
+
+    n = None
+    if opt.n is not None:
+        n = [int(v) for v in opt.n.split(",")]
+
+    t0 = time.time()
+    for filename in argc:
+        for pngname in render_results(filename, n, opt.jobs):
+            print(pngname)
+    print("render time {:.2f} s".format(time.time() - t0))
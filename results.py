@@ -0,0 +1,74 @@
+import numpy as np
+import json
+import os
+
+
+def results_default(obj):
+    # numpy scalars and arrays in a record are written as plain JSON
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(repr(obj))
+
+
+class ResultStore (object):
+
+    # Machine readable results of a run.
+    #
+    # Each add() appends one JSON line to <name>_results.jsonl in dirname.
+    # Sample arrays go to <name>_NNN.npy next to it, and the record keeps
+    # the file name, so that plots can be made later from the stored runs.
+    # With stats=False the array is stored as it is (a density image, say)
+    # and the record keeps its own n.
+
+    def __init__(self, dirname, name):
+        self.dirname = dirname
+        self.name = name
+        self.filename = os.path.join(dirname, name + "_results.jsonl")
+        self.num = 0
+        if os.path.isfile(self.filename):
+            with open(self.filename) as fp:
+                self.num = sum(1 for line in fp)
+
+    def add(self, record, x=None, stats=True):
+        record = dict(record)
+        self.num += 1
+        record["index"] = self.num
+        if x is not None:
+            x = np.asarray(x)
+            npyname = "{}_{:03}.npy".format(self.name, self.num)
+            np.save(os.path.join(self.dirname, npyname), x)
+            record["file"] = npyname
+        if x is not None and stats:
+            record["dim"], record["n"] = x.shape
+            record["mean"] = np.mean(x, axis=1)
+            record["std"] = np.std(x, axis=1)
+        with open(self.filename, "a") as fp:
+            fp.write(json.dumps(record, default=results_default) + "\n")
+        return record
+
+
+def load_results(filename):
+    # the records of a <name>_results.jsonl file, or of every such file
+    # in a directory
+    if os.path.isdir(filename):
+        records = []
+        for name in sorted(os.listdir(filename)):
+            if name.endswith("_results.jsonl"):
+                records += load_results(os.path.join(filename, name))
+        return records
+
+    dirname = os.path.dirname(filename)
+    records = []
+    with open(filename) as fp:
+        for line in fp:
+            if line.strip():
+                record = json.loads(line)
+                record["dirname"] = dirname
+                records.append(record)
+    return records
+
+
+def load_samples(record):
+    return np.load(os.path.join(record["dirname"], record["file"]))
@@ -0,0 +1,99 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.monomial import monomial_values
+
+
+def control_variate_integral(f, x, e, exact, volume):
+
+    #
+    # CONTROL_VARIATE_INTEGRAL estimates an integral with monomial control variates.
+    #
+    #  Discussion:
+    #
+    #    F holds the integrand at N uniform points X of a domain of known
+    #    VOLUME, and E lists K monomials whose exact integrals EXACT are
+    #    known, such as those of BALL01_MONOMIAL_INTEGRAL.  With the
+    #    monomial values G(N,K) and their exact means MU = EXACT / VOLUME,
+    #    the coefficients BETA of the least squares fit
+    #
+    #      F ~ C + ( G - MU ) BETA
+    #
+    #    are the estimated optimal control variate weights, and the
+    #    intercept C is the estimate of the mean of F.  It is the plain
+    #    mean with the monomials' sampling errors taken out:
+    #
+    #      C = mean ( F ) - ( mean ( G ) - MU ) BETA.
+    #
+    #    The error is that of C in the fit, from the residual variance.
+    #    It is close to the residual standard deviation over sqrt ( N ),
+    #    so the variance is reduced by the fraction of var ( F ) that the
+    #    monomials explain.  Fitting BETA on the same samples adds a bias
+    #    of order K / N, negligible for N >> K.
+    #
+    #  Reference:
+    #
+    #    Stephen Lavenberg, Peter Welch,
+    #    A Perspective on the Use of Control Variables to Increase the
+    #    Efficiency of Monte Carlo Simulations,
+    #    Management Science,
+    #    Volume 27, Number 3, 1981, pages 322-335.
+    #
+    #  Parameters:
+    #
+    #    Input, real F(N), the integrand values.
+    #
+    #    Input, real X(M,N), the sample points.
+    #
+    #    Input, integer E(K,M), the exponents of the control monomials,
+    #    for example from MONOMIAL_EXPONENTS.
+    #
+    #    Input, real EXACT(K), the exact integrals of the monomials.
+    #
+    #    Input, real VOLUME, the volume of the domain.
+    #
+    #    Output, real INTEGRAL, the estimate of the integral of F.
+    #
+    #    Output, real ERROR, the standard error of INTEGRAL.
+    #
+    #    Output, real BETA(K), the control variate coefficients.
+    #
+    f = np.asarray(f, dtype=np.float64)
+    n = f.shape[0]
+    mu = np.asarray(exact, dtype=np.float64) / volume
+    k = mu.shape[0]
+
+    if (n <= k + 1):
+        print('')
+        print('CONTROL_VARIATE_INTEGRAL - Fatal error!')
+        print('  Need more than K + 1 = %d samples, not N = %d.' % (k + 1, n))
+        exit('CONTROL_VARIATE_INTEGRAL - Fatal error!')
+
+    a = np.empty([n, k + 1])
+    a[:, 0] = 1.0
+    a[:, 1:] = monomial_values(e, x) - mu
+    #
+    #  Scale the columns so that high degree monomials do not spoil the
+    #  conditioning of the fit.
+    #
+    scale = np.sqrt(np.sum(a * a, axis=0))
+    scale[scale == 0.0] = 1.0
+    q, r = np.linalg.qr(a / scale)
+    coef = np.linalg.solve(r, q.T @ f)
+    residual = f - (a / scale) @ coef
+    s2 = np.sum(residual * residual) / float(n - k - 1)
+    r_inv = np.linalg.inv(r)
+    var_c = s2 * np.sum(r_inv[0, :] ** 2) / scale[0] ** 2
+
+    coef = coef / scale
+    mean = coef[0]
+    beta = coef[1:]
+
+    return volume * mean, volume * np.sqrt(var_c), beta
@@ -0,0 +1,338 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+from functools import lru_cache
+from itertools import product
+from math import factorial, pi
+
+sys.path.append(os.path.join('../'))
+
+
+def cubature_freeze(x, w):
+
+    #
+    # CUBATURE_FREEZE makes a cached rule read only.
+    #
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    w = np.ascontiguousarray(w, dtype=np.float64)
+    x.setflags(write=False)
+    w.setflags(write=False)
+
+    return x, w
+
+
+def compositions(total, parts):
+
+    #
+    # COMPOSITIONS lists the ways to write TOTAL as PARTS nonnegative integers.
+    #
+    #  Parameters:
+    #
+    #    Input, integer TOTAL, PARTS.
+    #
+    #    Output, integer C(K,PARTS), one composition per row.
+    #
+    if (parts == 1):
+        return np.array([[total]], dtype=np.int64)
+
+    c = []
+    for first in range(total, -1, -1):
+        rest = compositions(total - first, parts - 1)
+        c.append(np.hstack([np.full([rest.shape[0], 1], first), rest]))
+
+    return np.vstack(c)
+
+
+@lru_cache(maxsize=None)
+def hypercube01_rule(m, degree):
+
+    #
+    # HYPERCUBE01_RULE is a tensor Gauss-Legendre rule for the unit hypercube.
+    #
+    #  Discussion:
+    #
+    #    K = ceil ( ( DEGREE + 1 ) / 2 ) points per coordinate integrate
+    #    every monomial with all exponents up to DEGREE exactly, with
+    #    K^M points.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer DEGREE, the polynomial degree.
+    #
+    #    Output, real X(M,K^M), W(K^M), the rule, cached and read only.
+    #
+    k = max(1, (degree + 2) // 2)
+    t, s = np.polynomial.legendre.leggauss(k)
+    t = 0.5 * (t + 1.0)
+    s = 0.5 * s
+
+    x = np.array(list(product(t, repeat=m))).T.reshape(m, -1)
+    w = np.prod(np.array(list(product(s, repeat=m))), axis=1)
+
+    return cubature_freeze(x, w)
+
+
+@lru_cache(maxsize=None)
+def simplex_unit_rule(m, degree):
+
+    #
+    # SIMPLEX_UNIT_RULE is a Grundmann-Moller rule for the unit simplex.
+    #
+    #  Discussion:
+    #
+    #    The unit simplex is 0 <= X(I), sum ( X(I) ) <= 1.  With
+    #    DEGREE = 2 S + 1, and D = DEGREE, the rule is
+    #
+    #      sum ( 0 <= I <= S ) (-1)^I 2^(-2S) ( D + M - 2I )^D / ( I! ( D + M - I )! )
+    #        * sum ( |B| = S - I ) F ( ( 2 B + 1 ) / ( D + M - 2I ) )
+    #
+    #    over the barycentric multi-indices B of M + 1 entries.  Some
+    #    weights are negative.
+    #
+    #  Reference:
+    #
+    #    Axel Grundmann, Michael Moller,
+    #    Invariant Integration Formulas for the N-Simplex by Combinatorial
+    #    Methods,
+    #    SIAM Journal on Numerical Analysis,
+    #    Volume 15, Number 2, 1978, pages 282-290.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer DEGREE, the polynomial degree, rounded up to odd.
+    #
+    #    Output, real X(M,K), W(K), the rule, cached and read only.
+    #
+    s = max(0, degree // 2)
+    d = 2 * s + 1
+
+    x = []
+    w = []
+    for i in range(0, s + 1):
+        weight = (-1.0) ** i * 2.0 ** (- 2 * s) * float(d + m - 2 * i) ** d \
+            / (factorial(i) * factorial(d + m - i))
+        beta = compositions(s - i, m + 1)
+        x.append((2.0 * beta[:, 1:] + 1.0) / float(d + m - 2 * i))
+        w.append(np.full(beta.shape[0], weight))
+
+    x = np.vstack(x).T
+    w = np.concatenate(w)
+
+    return cubature_freeze(x, w)
+
+
+@lru_cache(maxsize=None)
+def annulus_rule(r1, r2, degree):
+
+    #
+    # ANNULUS_RULE is a polar product rule for an annulus about the origin.
+    #
+    #  Discussion:
+    #
+    #    A monomial of degree D is R^D times a trigonometric polynomial of
+    #    degree D, so Gauss-Legendre in R, with the area element R, and
+    #    D + 1 equally spaced angles integrate it exactly.
+    #
+    #    R1 = 0 gives the disk.
+    #
+    #  Parameters:
+    #
+    #    Input, real R1, R2, the inner and outer radii.
+    #
+    #    Input, integer DEGREE, the polynomial degree.
+    #
+    #    Output, real X(2,K), W(K), the rule, cached and read only.
+    #
+    kr = max(1, (degree + 3) // 2)
+    t, s = np.polynomial.legendre.leggauss(kr)
+    r = r1 + 0.5 * (r2 - r1) * (t + 1.0)
+    wr = 0.5 * (r2 - r1) * s * r
+
+    kt = degree + 1
+    theta = 2.0 * pi * np.arange(kt) / kt
+    wt = np.full(kt, 2.0 * pi / kt)
+
+    rr, tt = np.meshgrid(r, theta, indexing='ij')
+    x = np.array([(rr * np.cos(tt)).ravel(), (rr * np.sin(tt)).ravel()])
+    w = np.outer(wr, wt).ravel()
+
+    return cubature_freeze(x, w)
+
+
+@lru_cache(maxsize=None)
+def sphere01_rule(degree):
+
+    #
+    # SPHERE01_RULE is a product rule for the surface of the unit sphere.
+    #
+    #  Discussion:
+    #
+    #    Gauss-Legendre in Z = cos ( PHI ) and DEGREE + 1 equally spaced
+    #    longitudes integrate the monomials of degree DEGREE exactly.
+    #
+    #  Parameters:
+    #
+    #    Input, integer DEGREE, the polynomial degree.
+    #
+    #    Output, real X(3,K), W(K), the rule, cached and read only.
+    #
+    kz = max(1, (degree + 2) // 2)
+    z, wz = np.polynomial.legendre.leggauss(kz)
+
+    kt = degree + 1
+    theta = 2.0 * pi * np.arange(kt) / kt
+    wt = np.full(kt, 2.0 * pi / kt)
+
+    zz, tt = np.meshgrid(z, theta, indexing='ij')
+    rho = np.sqrt(1.0 - zz * zz)
+    x = np.array([(rho * np.cos(tt)).ravel(), (rho * np.sin(tt)).ravel(),
+                  zz.ravel()])
+    w = np.outer(wz, wt).ravel()
+
+    return cubature_freeze(x, w)
+
+
+@lru_cache(maxsize=None)
+def ball01_rule(degree):
+
+    #
+    # BALL01_RULE is a product rule for the unit ball.
+    #
+    #  Discussion:
+    #
+    #    Gauss-Legendre in R, with the volume element R^2, times
+    #    SPHERE01_RULE.
+    #
+    #  Parameters:
+    #
+    #    Input, integer DEGREE, the polynomial degree.
+    #
+    #    Output, real X(3,K), W(K), the rule, cached and read only.
+    #
+    kr = max(1, (degree + 4) // 2)
+    t, s = np.polynomial.legendre.leggauss(kr)
+    r = 0.5 * (t + 1.0)
+    wr = 0.5 * s * r * r
+
+    xs, ws = sphere01_rule(degree)
+    x = (r[:, None, None] * xs[None, :, :]).transpose(1, 0, 2).reshape(3, -1)
+    w = np.outer(wr, ws).ravel()
+
+    return cubature_freeze(x, w)
+
+
+@lru_cache(maxsize=None)
+def circle01_rule(degree):
+
+    #
+    # CIRCLE01_RULE is the equally spaced rule on the unit circle.
+    #
+    #  Parameters:
+    #
+    #    Input, integer DEGREE, the polynomial degree.
+    #
+    #    Output, real X(2,K), W(K), the rule, cached and read only.
+    #
+    k = degree + 1
+    theta = 2.0 * pi * np.arange(k) / k
+    x = np.array([np.cos(theta), np.sin(theta)])
+    w = np.full(k, 2.0 * pi / k)
+
+    return cubature_freeze(x, w)
+
+
+def cubature_rule(domain, degree):
+
+    #
+    # CUBATURE_RULE returns a cached cubature rule for a named domain.
+    #
+    #  Discussion:
+    #
+    #    The domains are
+    #
+    #      'line01', 'square01', 'cube01'   Gauss-Legendre products,
+    #      'triangle01', 'tetrahedron01'     Grundmann-Moller,
+    #      'disk01', 'ball01'                polar products,
+    #      'circle01', 'sphere01'            curve and surface rules,
+    #
+    #    and, with their parameters in a tuple,
+    #
+    #      ( 'hypercube01', M ), ( 'simplex_unit', M ), ( 'annulus', R1, R2 ).
+    #
+    #    Each rule is exact for polynomials of total degree DEGREE (of
+    #    each exponent up to DEGREE for the boxes).  It is computed once
+    #    per ( DOMAIN, DEGREE ) and shared, read only, by later calls.
+    #
+    #  Parameters:
+    #
+    #    Input, DOMAIN, the domain name, or a tuple as above.
+    #
+    #    Input, integer DEGREE, the polynomial degree.
+    #
+    #    Output, real X(M,K), W(K), the points and weights.
+    #
+    if (isinstance(domain, tuple)):
+        name, args = domain[0], domain[1:]
+    else:
+        name, args = domain, ()
+
+    if (name == 'line01'):
+        return hypercube01_rule(1, degree)
+    elif (name == 'square01'):
+        return hypercube01_rule(2, degree)
+    elif (name == 'cube01'):
+        return hypercube01_rule(3, degree)
+    elif (name == 'hypercube01'):
+        return hypercube01_rule(int(args[0]), degree)
+    elif (name == 'triangle01'):
+        return simplex_unit_rule(2, degree)
+    elif (name == 'tetrahedron01'):
+        return simplex_unit_rule(3, degree)
+    elif (name == 'simplex_unit'):
+        return simplex_unit_rule(int(args[0]), degree)
+    elif (name == 'disk01'):
+        return annulus_rule(0.0, 1.0, degree)
+    elif (name == 'annulus'):
+        return annulus_rule(float(args[0]), float(args[1]), degree)
+    elif (name == 'ball01'):
+        return ball01_rule(degree)
+    elif (name == 'circle01'):
+        return circle01_rule(degree)
+    elif (name == 'sphere01'):
+        return sphere01_rule(degree)
+
+    print('')
+    print('CUBATURE_RULE - Fatal error!')
+    print('  Unknown domain "%s".' % (name))
+    exit('CUBATURE_RULE - Fatal error!')
+
+
+def cubature_integral(func, domain, degree):
+
+    #
+    # CUBATURE_INTEGRAL applies a cached cubature rule to a function.
+    #
+    #  Discussion:
+    #
+    #    FUNC is called once, on all the points of the rule.
+    #
+    #  Parameters:
+    #
+    #    Input, function FUNC(X(M,K)) -> F(K), the integrand.
+    #
+    #    Input, DOMAIN, DEGREE, as for CUBATURE_RULE.
+    #
+    #    Output, real INTEGRAL, the estimate.
+    #
+    x, w = cubature_rule(domain, degree)
+
+    return np.dot(w, func(x))
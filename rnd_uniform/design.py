@@ -0,0 +1,419 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.uniform import r8vec_uniform_01, r8mat_uniform_01
+
+
+def hypercube01_stratified(m, n, seed, strata, strata_dim=None):
+
+    #
+    # HYPERCUBE01_STRATIFIED makes a stratified sample of the unit hypercube.
+    #
+    #  Discussion:
+    #
+    #    The first MS = STRATA_DIM coordinates are cut into STRATA equal
+    #    intervals, which gives H = STRATA^MS equal cells, and each cell
+    #    gets J = N / H uniform points.  The other M - MS coordinates
+    #    are plain uniforms, so in high dimension only the leading ones
+    #    need be stratified.
+    #
+    #    Point I lies in cell I // J, whose base STRATA digits are the
+    #    cell indices along the stratified coordinates, so the whole
+    #    sample is one vectorized transform of a uniform matrix.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer N, the number of points, a multiple of
+    #    STRATA^STRATA_DIM.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, integer STRATA, the number of intervals per coordinate.
+    #
+    #    Input, integer STRATA_DIM, the number of stratified coordinates,
+    #    by default M.
+    #
+    #    Output, real X(M,N), the points, cell by cell.
+    #
+    if (strata_dim is None):
+        strata_dim = m
+    strata_dim = min(strata_dim, m)
+    cell_num = strata ** strata_dim
+
+    if (strata < 1 or n % cell_num != 0):
+        print('')
+        print('HYPERCUBE01_STRATIFIED - Fatal error!')
+        print('  N = %d is not a multiple of STRATA^STRATA_DIM = %d.'
+              % (n, cell_num))
+        exit('HYPERCUBE01_STRATIFIED - Fatal error!')
+
+    x, seed = r8mat_uniform_01(m, n, seed)
+
+    cell = np.arange(n) // (n // cell_num)
+    for i in range(0, strata_dim):
+        x[i, :] = (cell % strata + x[i, :]) / strata
+        cell = cell // strata
+
+    return x, seed
+
+
+def stratified_estimate(f, x, strata, strata_dim=None):
+
+    #
+    # STRATIFIED_ESTIMATE estimates a mean from a stratified sample.
+    #
+    #  Discussion:
+    #
+    #    X is a sample from HYPERCUBE01_STRATIFIED, and F the integrand
+    #    values there.  The cells are equal, and so are the N(h) points
+    #    in each cell h, so the weight of a cell is W(h) = N(h) / N and
+    #
+    #      MEAN     = sum ( h ) W(h) * mean ( F in h )
+    #      VARIANCE = sum ( h ) W(h)^2 * S(h)^2 / N(h)
+    #
+    #    with S(h)^2 the unbiased sample variance in cell h.  This is the
+    #    variance of MEAN itself, and is smaller than var ( F ) / N by
+    #    the spread of the cell means.
+    #
+    #    With one point per cell S(h) is not defined, and neighbouring
+    #    cells are paired, the last pair taking three cells when the
+    #    number of cells is odd.  This overstates the variance, by up to the
+    #    spread of the paired cell means, so the error stays on the safe side.
+    #
+    #  Parameters:
+    #
+    #    Input, real F(N), the integrand values.
+    #
+    #    Input, real X(M,N), the points.
+    #
+    #    Input, integer STRATA, STRATA_DIM, as for HYPERCUBE01_STRATIFIED.
+    #
+    #    Output, real MEAN, the estimate of the mean of F.
+    #
+    #    Output, real ERROR, the standard error of MEAN.
+    #
+    f = np.asarray(f, dtype=np.float64)
+    m = x.shape[0]
+    if (strata_dim is None):
+        strata_dim = m
+    strata_dim = min(strata_dim, m)
+
+    cell = np.zeros(x.shape[1], dtype=np.int64)
+    for i in range(strata_dim - 1, -1, -1):
+        index = np.clip((x[i, :] * strata).astype(np.int64), 0, strata - 1)
+        cell = cell * strata + index
+    cell_num = strata ** strata_dim
+
+    count = np.bincount(cell, minlength=cell_num)
+    if (np.min(count) < 2 and 1 < cell_num):
+        cell = np.minimum(cell // 2, cell_num // 2 - 1)
+        cell_num = cell_num // 2
+        count = np.bincount(cell, minlength=cell_num)
+    used = (0 < count)
+    count_used = count[used]
+
+    s1 = np.bincount(cell, weights=f, minlength=cell_num)[used]
+    s2 = np.bincount(cell, weights=f * f, minlength=cell_num)[used]
+    mean_h = s1 / count_used
+    var_h = (s2 - count_used * mean_h * mean_h) \
+        / np.maximum(count_used - 1, 1)
+    var_h = np.maximum(var_h, 0.0)
+
+    weight = count_used / float(f.shape[0])
+    mean = np.sum(weight * mean_h)
+    error = np.sqrt(np.sum(weight * weight * var_h / count_used))
+
+    return mean, error
+
+
+def permutation_keys(k, seed):
+
+    #
+    # PERMUTATION_KEYS makes keys for PERMUTATION_INDEX.
+    #
+    #  Parameters:
+    #
+    #    Input, integer K, the number of keys.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Output, integer KEY(K,4), four 62 bit round keys for each of
+    #    K permutations.
+    #
+    u, seed = r8vec_uniform_01(8 * k, seed)
+    u = (u * 2147483648.0).astype(np.uint64).reshape(k, 4, 2)
+    key = (u[:, :, 0] << np.uint64(31)) | u[:, :, 1]
+
+    return key, seed
+
+
+def permutation_index(i, n, key):
+
+    #
+    # PERMUTATION_INDEX applies a keyed random permutation of 0, ..., N-1.
+    #
+    #  Discussion:
+    #
+    #    A four round Feistel network on 2*H bits, 4^H >= N, is a bijection
+    #    of 0, ..., 4^H-1.  Its round function is the multiply-shift hash,
+    #    the top H bits of ( R xor KEY ) * an odd constant.  Values that
+    #    land at or beyond N are sent round again ("cycle walking") until
+    #    they fall below N, which takes fewer than four rounds on average.
+    #
+    #    Any entries of the permutation can so be found without the rest,
+    #    which lets a Latin hypercube of 10^7 points be made chunk by chunk
+    #    instead of sorting N keys per coordinate.
+    #
+    #  Reference:
+    #
+    #    John Black, Phillip Rogaway,
+    #    Ciphers with Arbitrary Finite Domains,
+    #    CT-RSA 2002, Lecture Notes in Computer Science,
+    #    Volume 2271, 2002, pages 114-130.
+    #
+    #  Parameters:
+    #
+    #    Input, integer I(*), indices between 0 and N-1.
+    #
+    #    Input, integer N, the size of the permutation.
+    #
+    #    Input, integer KEY(4), the round keys, from PERMUTATION_KEYS.
+    #
+    #    Output, integer P(*), the permuted indices.
+    #
+    half = max(1, (int(n - 1).bit_length() + 1) // 2)
+    mask = np.uint64((1 << half) - 1)
+    shift = np.uint64(half)
+    top = np.uint64(64 - half)
+    odd = np.uint64(0x9E3779B97F4A7C15)
+    key = np.asarray(key, dtype=np.uint64)
+
+    def feistel(v):
+        left = v >> shift
+        right = v & mask
+        for r in range(0, 4):
+            h = ((right ^ key[r]) * odd) >> top
+            left, right = right, left ^ h
+        return (left << shift) | right
+
+    nn = np.uint64(n)
+    with np.errstate(over='ignore'):
+        p = feistel(np.asarray(i, dtype=np.uint64))
+        walk = np.flatnonzero(nn <= p)
+        while (0 < walk.shape[0]):
+            q = feistel(p[walk])
+            p[walk] = q
+            walk = walk[nn <= q]
+
+    return p.astype(np.int64)
+
+
+def latin_hypercube(m, n, seed, chunk=2**20):
+
+    #
+    # LATIN_HYPERCUBE makes a Latin hypercube sample of the unit hypercube.
+    #
+    #  Discussion:
+    #
+    #    Each coordinate is cut into N equal intervals, and each interval
+    #    holds exactly one point:
+    #
+    #      X(I,J) = ( P_I(J) + U(I,J) ) / N
+    #
+    #    with P_I a random permutation and U uniform.  The main effect
+    #    of each coordinate is then integrated almost exactly, which for
+    #    nearly additive integrands removes most of the variance.
+    #
+    #    The permutations come from PERMUTATION_INDEX, so the points are
+    #    made CHUNK at a time, with no work array of size N.
+    #
+    #  Reference:
+    #
+    #    Michael McKay, William Conover, Richard Beckman,
+    #    A Comparison of Three Methods for Selecting Values of Input
+    #    Variables in the Analysis of Output from a Computer Code,
+    #    Technometrics,
+    #    Volume 21, Number 2, 1979, pages 239-245.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, integer CHUNK, the number of points made at once.
+    #
+    #    Output, real X(M,N), the points.
+    #
+    key, seed = permutation_keys(m, seed)
+
+    x = np.zeros([m, n])
+    for j0 in range(0, n, chunk):
+        k = min(chunk, n - j0)
+        j = np.arange(j0, j0 + k)
+        u, seed = r8mat_uniform_01(m, k, seed)
+        for i in range(0, m):
+            x[i, j0:j0 + k] = (permutation_index(j, n, key[i]) + u[i, :]) / n
+
+    return x, seed
+
+
+def orthogonal_array_lhs(m, p, seed):
+
+    #
+    # ORTHOGONAL_ARRAY_LHS makes an orthogonal-array based Latin hypercube.
+    #
+    #  Discussion:
+    #
+    #    For a prime P, the Bose array has N = P^2 rows (A,B) and the
+    #    P+1 columns
+    #
+    #      B,  A,  A + B,  A + 2 B,  ...,  A + (P-1) B   (mod P),
+    #
+    #    so any two columns take every pair of levels exactly once.  The
+    #    levels of each column are shuffled, and the P rows at a level
+    #    are spread over its P sub-intervals in random order.  The result
+    #    is a Latin hypercube that is also stratified on every 2D face
+    #    into P x P cells, which also balances the two-factor interactions.
+    #
+    #  Reference:
+    #
+    #    Boxin Tang,
+    #    Orthogonal Array-Based Latin Hypercubes,
+    #    Journal of the American Statistical Association,
+    #    Volume 88, Number 424, 1993, pages 1392-1397.
+    #
+    #    Art Owen,
+    #    Orthogonal arrays for computer experiments, integration and
+    #    visualization,
+    #    Statistica Sinica,
+    #    Volume 2, 1992, pages 439-452.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension, at most P+1.
+    #
+    #    Input, integer P, a prime.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Output, real X(M,P*P), the points.
+    #
+    prime = (2 <= p) and all(p % q != 0 for q in range(2, int(p ** 0.5) + 1))
+    if (not prime or p + 1 < m):
+        print('')
+        print('ORTHOGONAL_ARRAY_LHS - Fatal error!')
+        print('  Need a prime P with M <= P + 1, not P = %d, M = %d.' % (p, m))
+        exit('ORTHOGONAL_ARRAY_LHS - Fatal error!')
+
+    n = p * p
+    a = np.arange(n) // p
+    b = np.arange(n) % p
+
+    u, seed = r8mat_uniform_01(m, n, seed)
+    r, seed = r8mat_uniform_01(m, n, seed)
+    s, seed = r8mat_uniform_01(m, p, seed)
+
+    x = np.zeros([m, n])
+    for i in range(0, m):
+        if (i == 0):
+            level = b
+        else:
+            level = (a + (i - 1) * b) % p
+        level = np.argsort(s[i, :])[level]
+        order = np.lexsort((r[i, :], level))
+        sub = np.empty(n, dtype=np.int64)
+        sub[order] = np.arange(n) % p
+        x[i, :] = (level * p + sub + u[i, :]) / n
+
+    return x, seed
+
+
+def antithetic_uniform(m, n, seed):
+
+    #
+    # ANTITHETIC_UNIFORM makes antithetic pairs of uniform points.
+    #
+    #  Discussion:
+    #
+    #    N/2 uniform points U are made, and the other N/2 are their
+    #    reflections 1 - U, so column J and column J + N/2 form a pair.
+    #    A sampler that maps uniforms monotonically turns the pairs into
+    #    negatively correlated points, at half the random number cost.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer N, the number of points, which must be even.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Output, real U(M,N), the points.
+    #
+    if (n % 2 != 0):
+        print('')
+        print('ANTITHETIC_UNIFORM - Fatal error!')
+        print('  N = %d is not even.' % (n))
+        exit('ANTITHETIC_UNIFORM - Fatal error!')
+
+    h = n // 2
+    u = np.zeros([m, n])
+    u[:, 0:h], seed = r8mat_uniform_01(m, h, seed)
+    u[:, h:n] = 1.0 - u[:, 0:h]
+
+    return u, seed
+
+
+def antithetic_estimate(f):
+
+    #
+    # ANTITHETIC_ESTIMATE estimates a mean from antithetic pairs.
+    #
+    #  Discussion:
+    #
+    #    F(J) and F(J+N/2) are the integrand values at an antithetic pair,
+    #    as made by ANTITHETIC_UNIFORM.  The pair means G(J) are independent,
+    #    so
+    #
+    #      MEAN  = mean ( G )
+    #      ERROR = std ( G ) / sqrt ( N/2 )
+    #
+    #    which includes the covariance inside the pairs.  Treating the N
+    #    values as independent would ignore it and misstate the error.
+    #
+    #  Parameters:
+    #
+    #    Input, real F(N), the integrand values.
+    #
+    #    Output, real MEAN, the estimate of the mean of F.
+    #
+    #    Output, real ERROR, the standard error of MEAN.
+    #
+    f = np.asarray(f, dtype=np.float64)
+    h = f.shape[0] // 2
+    g = 0.5 * (f[0:h] + f[h:2 * h])
+
+    mean = np.mean(g)
+    if (1 < h):
+        error = np.std(g, ddof=1) / np.sqrt(h)
+    else:
+        error = 0.0
+
+    return mean, error
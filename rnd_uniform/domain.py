@@ -0,0 +1,404 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+from math import gamma, pi
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.uniform import r8po_fa, uniform_in_sphere01_map
+from rnd_uniform.sample import hypercube01_sample, simplex_unit_sample, \
+    hypersphere01_sample, annulus_sample, circle01_sample_random, \
+    wedge01_sample, pyramid01_sample, ball01_sample, ellipsoid_sample
+from rnd_uniform.monomial import monomial_exponent_check, \
+    hypercube01_monomial_integral, hypersphere01_monomial_integral, \
+    hyperball01_monomial_integral, ball01_monomial_integral, \
+    disk01_monomial_integral, disk01_quarter_monomial_integral, \
+    simplex_unit_monomial_integral, pyramid01_integral, \
+    wedge01_monomial_integral
+from rnd_uniform.polygon import multipolygon_triangulate, multipolygon_area, \
+    multipolygon_monomial_integral, multipolygon_sample
+
+
+class Domain (object):
+
+    #
+    # DOMAIN is an integration region with a uniform sampler.
+    #
+    #  Discussion:
+    #
+    #    NAME and the spatial dimension M identify the domain, and
+    #
+    #      SAMPLE(N, SEED) -> (X(M,N), SEED) draws uniform points,
+    #      MEASURE is its length, area or volume,
+    #      EXACT_MONOMIAL_INTEGRAL(E(M)) -> VALUE integrates a monomial.
+    #
+    #    Domains are made by DOMAIN_GET, which knows the names of
+    #    DOMAIN_REGISTRY.
+    #
+
+    def __init__(self, name, m, sample, measure, exact_monomial_integral):
+        self.name = name
+        self.m = m
+        self.sample = sample
+        self.measure = measure
+        self.exact_monomial_integral = exact_monomial_integral
+
+    def exact_monomial_integrals(self, e):
+
+        #
+        # EXACT_MONOMIAL_INTEGRALS integrates the monomials E(K,M).
+        #
+        return np.array([self.exact_monomial_integral(ei)
+                         for ei in np.atleast_2d(e)])
+
+    def monte_carlo_integral(self, func, n, seed, chunk=2**20):
+
+        #
+        # MONTE_CARLO_INTEGRAL estimates the integral of FUNC(X(M,K)) -> F(K).
+        #
+        #  Parameters:
+        #
+        #    Output, real INTEGRAL, ERROR, the estimate and its standard
+        #    error, and integer SEED, the updated seed.
+        #
+        s1 = 0.0
+        s2 = 0.0
+        for j0 in range(0, n, chunk):
+            k = min(chunk, n - j0)
+            x, seed = self.sample(k, seed)
+            fx = func(x)
+            s1 = s1 + np.sum(fx)
+            s2 = s2 + np.sum(fx * fx)
+
+        mean = s1 / n
+        var = max(s2 / n - mean * mean, 0.0)
+
+        return self.measure * mean, \
+            self.measure * np.sqrt(var / max(n - 1, 1)), seed
+
+    def __repr__(self):
+        return 'Domain(%s, m=%d, measure=%g)' % (self.name, self.m,
+                                                  self.measure)
+
+
+def affine_monomial_integral(e, v, b, exact):
+
+    #
+    # AFFINE_MONOMIAL_INTEGRAL integrates a monomial over an affine image.
+    #
+    #  Discussion:
+    #
+    #    The domain is { V + B * Y : Y in D }, where EXACT integrates the
+    #    monomials over D.  The monomial
+    #
+    #      prod ( X(I)^E(I) ) = prod ( ( V(I) + B(I,:) * Y )^E(I) )
+    #
+    #    is expanded in Y, and the integral is | det ( B ) | times the sum
+    #    of the integrals of the terms.
+    #
+    #  Parameters:
+    #
+    #    Input, integer E(M), the exponents.
+    #
+    #    Input, real V(M), B(M,M), the map.
+    #
+    #    Input, function EXACT(K(M)) -> VALUE, the integrals over D.
+    #
+    #    Output, real VALUE, the integral.
+    #
+    e = np.asarray(e, dtype=np.int64)
+    v = np.asarray(v, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    m = e.shape[0]
+
+    poly = {(0,) * m: 1.0}
+
+    for i in range(0, m):
+        for p in range(0, e[i]):
+            new = {}
+            for k, c in poly.items():
+                if (v[i] != 0.0):
+                    new[k] = new.get(k, 0.0) + c * v[i]
+                for j in range(0, m):
+                    if (b[i, j] != 0.0):
+                        kj = k[0:j] + (k[j] + 1,) + k[j + 1:]
+                        new[kj] = new.get(kj, 0.0) + c * b[i, j]
+            poly = new
+
+    value = 0.0
+    for k, c in poly.items():
+        value = value + c * exact(np.array(k))
+
+    return abs(np.linalg.det(b)) * value
+
+
+def hyperball01_volume(m):
+
+    #
+    # HYPERBALL01_VOLUME is the volume of the unit ball in M dimensions.
+    #
+    return pi ** (0.5 * m) / gamma(0.5 * m + 1.0)
+
+
+def line01_domain():
+    return Domain('line01', 1,
+                  lambda n, seed: hypercube01_sample(1, n, seed), 1.0,
+                  lambda e: hypercube01_monomial_integral(1, e))
+
+
+def circle01_domain():
+    return Domain('circle01', 2, circle01_sample_random, 2.0 * pi,
+                  lambda e: hypersphere01_monomial_integral(2, e))
+
+
+def disk01_domain():
+    return Domain('disk01', 2,
+                  lambda n, seed: annulus_sample([0.0, 0.0], 0.0, 1.0,
+                                                 n, seed),
+                  pi, disk01_monomial_integral)
+
+
+def disk01_quarter_domain():
+
+    def sample(n, seed):
+        x, seed = annulus_sample([0.0, 0.0], 0.0, 1.0, n, seed)
+        return np.abs(x), seed
+
+    return Domain('disk01_quarter', 2, sample, 0.25 * pi,
+                  disk01_quarter_monomial_integral)
+
+
+def annulus_domain(pc, r1, r2):
+
+    #
+    # ANNULUS_DOMAIN is the annulus R1 <= | X - PC | <= R2.
+    #
+    pc = np.asarray(pc, dtype=np.float64)
+
+    def exact0(k):
+        d = int(np.sum(k))
+        return hypersphere01_monomial_integral(2, k) \
+            * (r2 ** (d + 2) - r1 ** (d + 2)) / float(d + 2)
+
+    return Domain('annulus', 2,
+                  lambda n, seed: annulus_sample(pc, r1, r2, n, seed),
+                  pi * (r2 * r2 - r1 * r1),
+                  lambda e: affine_monomial_integral(e, pc, np.eye(2), exact0))
+
+
+def simplex_domain(m, v=None):
+
+    #
+    # SIMPLEX_DOMAIN is the simplex with vertices V(M+1,M), by default the unit simplex.
+    #
+    if (v is None):
+        return Domain('simplex', m,
+                      lambda n, seed: simplex_unit_sample(m, n, seed),
+                      1.0 / gamma(m + 1.0),
+                      lambda e: simplex_unit_monomial_integral(m, e))
+
+    v = np.asarray(v, dtype=np.float64)
+    v0 = v[0, :]
+    b = (v[1:, :] - v0).T
+
+    def sample(n, seed):
+        y, seed = simplex_unit_sample(m, n, seed)
+        return v0[:, None] + b @ y, seed
+
+    return Domain('simplex', m, sample,
+                  abs(np.linalg.det(b)) / gamma(m + 1.0),
+                  lambda e: affine_monomial_integral(
+                      e, v0, b,
+                      lambda k: simplex_unit_monomial_integral(m, k)))
+
+
+def triangle_domain(v):
+
+    #
+    # TRIANGLE_DOMAIN is the triangle with vertices V(3,2).
+    #
+    d = simplex_domain(2, v)
+    d.name = 'triangle'
+
+    return d
+
+
+def triangle01_domain():
+    d = simplex_domain(2)
+    d.name = 'triangle01'
+    return d
+
+
+def tetrahedron01_domain():
+    d = simplex_domain(3)
+    d.name = 'tetrahedron01'
+    return d
+
+
+def hypercube01_domain(m):
+    return Domain('hypercube01', m,
+                  lambda n, seed: hypercube01_sample(m, n, seed), 1.0,
+                  lambda e: hypercube01_monomial_integral(m, e))
+
+
+def square01_domain():
+    d = hypercube01_domain(2)
+    d.name = 'square01'
+    return d
+
+
+def cube01_domain():
+    d = hypercube01_domain(3)
+    d.name = 'cube01'
+    return d
+
+
+def wedge01_domain():
+    return Domain('wedge01', 3, wedge01_sample, 1.0,
+                  wedge01_monomial_integral)
+
+
+def pyramid01_domain():
+    return Domain('pyramid01', 3, pyramid01_sample, 4.0 / 3.0,
+                  pyramid01_integral)
+
+
+def ball01_domain():
+    return Domain('ball01', 3, ball01_sample, 4.0 * pi / 3.0,
+                  ball01_monomial_integral)
+
+
+def hyperball01_domain(m):
+    return Domain('hyperball01', m,
+                  lambda n, seed: uniform_in_sphere01_map(m, n, seed),
+                  hyperball01_volume(m),
+                  lambda e: hyperball01_monomial_integral(m, e))
+
+
+def hypersphere01_domain(m):
+    return Domain('hypersphere01', m,
+                  lambda n, seed: hypersphere01_sample(m, n, seed),
+                  m * hyperball01_volume(m),
+                  lambda e: hypersphere01_monomial_integral(m, e))
+
+
+def sphere01_domain():
+    d = hypersphere01_domain(3)
+    d.name = 'sphere01'
+    return d
+
+
+def ellipsoid_domain(m, a, v, r):
+
+    #
+    # ELLIPSOID_DOMAIN is the ellipsoid ( X - V )' * A * ( X - V ) <= R^2.
+    #
+    #  Discussion:
+    #
+    #    With A = U' * U, it is the image of the unit ball under
+    #    X = V + R * inverse ( U ) * Y.
+    #
+    a = np.asarray(a, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    b = r * np.linalg.inv(r8po_fa(m, a))
+
+    return Domain('ellipsoid', m,
+                  lambda n, seed: ellipsoid_sample(m, n, a, v, r, seed),
+                  hyperball01_volume(m) * abs(np.linalg.det(b)),
+                  lambda e: affine_monomial_integral(
+                      e, v, b,
+                      lambda k: hyperball01_monomial_integral(m, k)))
+
+
+def ellipse_domain(a, v, r):
+    d = ellipsoid_domain(2, a, v, r)
+    d.name = 'ellipse'
+    return d
+
+
+def polygon_domain(v):
+
+    #
+    # POLYGON_DOMAIN is the polygon with vertices V(NV,2).
+    #
+    #  Discussion:
+    #
+    #    The polygon is triangulated once, here, and every call to SAMPLE
+    #    reuses the triangulation.
+    #
+    parts = [[np.asarray(v, dtype=np.float64)]]
+    triangulation = multipolygon_triangulate(parts)
+
+    def exact(e):
+        monomial_exponent_check('POLYGON_DOMAIN', e)
+        return multipolygon_monomial_integral(parts, e)
+
+    return Domain('polygon', 2,
+                  lambda n, seed: multipolygon_sample(parts, n, seed,
+                                                      triangulation),
+                  multipolygon_area(parts), exact)
+
+
+#
+#  DOMAIN_REGISTRY maps a name to the function that makes the domain,
+#  with the arguments of that function.
+#
+DOMAIN_REGISTRY = {
+    'line01': line01_domain,
+    'circle01': circle01_domain,
+    'disk01': disk01_domain,
+    'disk01_quarter': disk01_quarter_domain,
+    'annulus': annulus_domain,
+    'triangle': triangle_domain,
+    'triangle01': triangle01_domain,
+    'square01': square01_domain,
+    'cube01': cube01_domain,
+    'hypercube01': hypercube01_domain,
+    'simplex': simplex_domain,
+    'tetrahedron01': tetrahedron01_domain,
+    'wedge01': wedge01_domain,
+    'pyramid01': pyramid01_domain,
+    'ball01': ball01_domain,
+    'hyperball01': hyperball01_domain,
+    'sphere01': sphere01_domain,
+    'hypersphere01': hypersphere01_domain,
+    'ellipse': ellipse_domain,
+    'ellipsoid': ellipsoid_domain,
+    'polygon': polygon_domain,
+}
+
+
+def domain_get(name, *args):
+
+    #
+    # DOMAIN_GET makes a domain by name.
+    #
+    #  Discussion:
+    #
+    #    For example
+    #
+    #      DOMAIN_GET ( 'disk01' )
+    #      DOMAIN_GET ( 'hypercube01', 6 )
+    #      DOMAIN_GET ( 'annulus', PC, R1, R2 )
+    #      DOMAIN_GET ( 'ellipsoid', M, A, V, R )
+    #      DOMAIN_GET ( 'polygon', V )
+    #
+    #  Parameters:
+    #
+    #    Input, string NAME, a key of DOMAIN_REGISTRY.
+    #
+    #    Input, ARGS, the parameters of the domain, if any.
+    #
+    #    Output, Domain D, the domain.
+    #
+    if (name not in DOMAIN_REGISTRY):
+        print('')
+        print('DOMAIN_GET - Fatal error!')
+        print('  Unknown domain "%s".' % (name))
+        exit('DOMAIN_GET - Fatal error!')
+
+    return DOMAIN_REGISTRY[name](*args)
@@ -0,0 +1,194 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+from math import lgamma, log, pi
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.uniform import r8vec_uniform_01, r8mat_normal_01
+
+
+class Proposal (object):
+
+    #
+    # PROPOSAL is a sampling density over a domain.
+    #
+    #  Discussion:
+    #
+    #    SAMPLE(N, SEED) -> (X(M,N), SEED) draws points, and
+    #    LOG_DENSITY(X(M,N)) -> LOGQ(N) is the log of their density,
+    #    which must be positive wherever the integrand is nonzero.
+    #
+
+    def __init__(self, m, sample, log_density):
+        self.m = m
+        self.sample = sample
+        self.log_density = log_density
+
+
+def uniform_proposal(m, sample, volume):
+
+    #
+    # UNIFORM_PROPOSAL is the uniform density of a domain with a sampler.
+    #
+    #  Discussion:
+    #
+    #    For example, UNIFORM_PROPOSAL ( 3, BALL01_SAMPLE, 4 PI / 3 ).
+    #    With it, IMPORTANCE_INTEGRAL is plain Monte Carlo.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, function SAMPLE(N, SEED), a uniform sampler of the domain.
+    #
+    #    Input, real VOLUME, the volume of the domain.
+    #
+    #    Output, Proposal P, the proposal.
+    #
+    log_volume = log(volume)
+
+    def log_density(x):
+        return np.full(x.shape[1], - log_volume)
+
+    return Proposal(m, sample, log_density)
+
+
+def hyperball01_radial_proposal(m, alpha):
+
+    #
+    # HYPERBALL01_RADIAL_PROPOSAL is a radial power law density in the unit hyperball.
+    #
+    #  Discussion:
+    #
+    #    A uniform point of the unit hyperball has radius U^(1/M).  Using
+    #    the radius R = U^(1/ALPHA) instead, with a uniform direction,
+    #    gives the density
+    #
+    #      q(x) = ALPHA * R^(ALPHA-M) / S(M),  S(M) = 2 PI^(M/2) / Gamma(M/2)
+    #
+    #    the area of the unit sphere.  ALPHA = M is uniform, ALPHA < M
+    #    puts more points near the center, for integrands that are nearly
+    #    singular there, and ALPHA > M puts more near the surface.
+    #
+    #    An integrand that behaves like R^(-B) near the center has a finite
+    #    variance under this proposal only if ALPHA < 2 ( M - B ), and
+    #    ALPHA = M - B makes F / q constant in R.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension, 2 for DISK01 and 3 for
+    #    BALL01.
+    #
+    #    Input, real ALPHA, the power, positive.
+    #
+    #    Output, Proposal P, the proposal.
+    #
+    if (alpha <= 0.0):
+        print('')
+        print('HYPERBALL01_RADIAL_PROPOSAL - Fatal error!')
+        print('  ALPHA must be positive.')
+        exit('HYPERBALL01_RADIAL_PROPOSAL - Fatal error!')
+
+    log_area = log(2.0) + 0.5 * m * log(pi) - lgamma(0.5 * m)
+
+    def sample(n, seed):
+        z, seed = r8mat_normal_01(m, n, seed)
+        u, seed = r8vec_uniform_01(n, seed)
+        r = u ** (1.0 / alpha)
+        x = z * (r / np.sqrt(np.sum(z * z, axis=0)))
+        return x, seed
+
+    def log_density(x):
+        r = np.sqrt(np.sum(x * x, axis=0))
+        with np.errstate(divide='ignore'):
+            return log(alpha) + (alpha - m) * np.log(r) - log_area
+
+    return Proposal(m, sample, log_density)
+
+
+def importance_integral(func, proposal, n, seed, chunk=2**20):
+
+    #
+    # IMPORTANCE_INTEGRAL estimates an integral by importance sampling.
+    #
+    #  Discussion:
+    #
+    #    With X drawn from the proposal density q,
+    #
+    #      INTEGRAL = mean ( F(X) / q(X) )
+    #      ERROR    = std ( F(X) / q(X) ) / sqrt ( N )
+    #
+    #    In the same pass, the weights are summed to judge the proposal.
+    #    With W = | F(X) | / q(X), which a perfect proposal makes constant,
+    #
+    #      ESS         = ( sum W )^2 / sum ( W^2 ), the effective sample size;
+    #      W_MAX       = max ( W ) / sum ( W ), the largest weight share;
+    #
+    #    and with V = 1 / q(X), the weights towards the uniform density,
+    #
+    #      ESS_UNIFORM = ( sum V )^2 / sum ( V^2 ), how well the proposal
+    #                    covers the whole domain;
+    #      VOLUME      = mean ( V ), which should match the domain volume.
+    #
+    #    A small ESS, or a large W_MAX, means that a few points carry the
+    #    estimate, and ERROR is then not to be trusted.
+    #
+    #    The points are made CHUNK at a time.
+    #
+    #  Parameters:
+    #
+    #    Input, function FUNC(X(M,K)) -> F(K), the integrand.
+    #
+    #    Input, Proposal PROPOSAL, the sampling density.
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, integer CHUNK, the number of points made at once.
+    #
+    #    Output, real INTEGRAL, the estimate.
+    #
+    #    Output, real ERROR, its standard error.
+    #
+    #    Output, dict DIAGNOSTIC, with ESS, W_MAX, ESS_UNIFORM and VOLUME.
+    #
+    #    Output, integer SEED, the updated seed.
+    #
+    s1 = 0.0
+    s2 = 0.0
+    a1 = 0.0
+    a_max = 0.0
+    v1 = 0.0
+    v2 = 0.0
+
+    for j0 in range(0, n, chunk):
+        k = min(chunk, n - j0)
+        x, seed = proposal.sample(k, seed)
+        v = np.exp(- proposal.log_density(x))
+        g = func(x) * v
+        s1 = s1 + np.sum(g)
+        s2 = s2 + np.sum(g * g)
+        a1 = a1 + np.sum(np.abs(g))
+        a_max = max(a_max, np.max(np.abs(g)))
+        v1 = v1 + np.sum(v)
+        v2 = v2 + np.sum(v * v)
+
+    integral = s1 / n
+    var = max(s2 / n - integral * integral, 0.0)
+    error = np.sqrt(var / max(n - 1, 1))
+
+    diagnostic = {
+        'ess': a1 * a1 / s2 if (0.0 < s2) else float(n),
+        'w_max': a_max / a1 if (0.0 < a1) else 0.0,
+        'ess_uniform': v1 * v1 / v2,
+        'volume': v1 / n,
+    }
+
+    return integral, error, diagnostic, seed
@@ -0,0 +1,168 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+import time
+
+sys.path.append(os.path.join('../'))
+
+
+def mlmc_integral(func, sample, volume, rmse, seed, level_min=2,
+                  level_max=10, n0=256, cost=None, alpha=None):
+
+    #
+    # MLMC_INTEGRAL estimates an integral by multilevel Monte Carlo.
+    #
+    #  Discussion:
+    #
+    #    FUNC(X, L) approximates the integrand at fidelity level L, and gets
+    #    better and more expensive as L grows.  The finest level estimate
+    #    is written as the telescoping sum
+    #
+    #      E [ F_L ] = E [ F_0 ] + sum ( 1 <= L' <= L ) E [ F_L' - F_L'-1 ]
+    #
+    #    and each term is estimated on its own sample.  The two levels in
+    #    a correction F_L' - F_L'-1 are evaluated at the SAME points, so the
+    #    correction has a small variance V(L') and needs few points where
+    #    points are dear.
+    #
+    #    After N0 pilot points per level, the variances V(L) and the costs
+    #    C(L) per point give the numbers of points
+    #
+    #      N(L) = 2 / RMSE^2 * sqrt ( V(L) / C(L) ) * sum ( sqrt ( V(K) C(K) ) )
+    #
+    #    which make the sampling variance RMSE^2 / 2 at the least cost.
+    #    When they are reached, a new level is added while the last
+    #    correction, extrapolated with rate ALPHA, leaves a bias above
+    #    RMSE / sqrt ( 2 ).
+    #
+    #    Costs are measured with the clock unless COST gives them.
+    #
+    #  Reference:
+    #
+    #    Michael Giles,
+    #    Multilevel Monte Carlo methods,
+    #    Acta Numerica,
+    #    Volume 24, 2015, pages 259-328.
+    #
+    #  Parameters:
+    #
+    #    Input, function FUNC(X(M,K), L) -> F(K), the level L integrand.
+    #
+    #    Input, function SAMPLE(K, SEED) -> (X(M,K), SEED), a uniform
+    #    sampler of the domain, such as HYPERCUBE01_SAMPLE with M bound.
+    #
+    #    Input, real VOLUME, the volume of the domain.
+    #
+    #    Input, real RMSE, the wanted root mean square error of the integral.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, integer LEVEL_MIN, LEVEL_MAX, the fewest and most levels
+    #    above level 0, with 1 <= LEVEL_MIN.
+    #
+    #    Input, integer N0, the number of pilot points on a new level.
+    #
+    #    Input, function COST(L), optional, the cost of a point on level L,
+    #    counting both fidelities of a correction.
+    #
+    #    Input, real ALPHA, optional, the weak convergence rate, so that
+    #    E [ F_L - F ] ~ 2^(-ALPHA L).  By default it is fitted.
+    #
+    #    Output, real INTEGRAL, the estimate.
+    #
+    #    Output, real ERROR, the standard error of INTEGRAL, not counting
+    #    the bias.
+    #
+    #    Output, dict INFO, the arrays N, MEAN, VARIANCE and COST of
+    #    the levels.
+    #
+    #    Output, integer SEED, the updated seed.
+    #
+    eps = rmse / volume
+    level = level_min
+
+    n = np.zeros(level_max + 1, dtype=np.int64)
+    s1 = np.zeros(level_max + 1)
+    s2 = np.zeros(level_max + 1)
+    c1 = np.zeros(level_max + 1)
+    dn = np.zeros(level_max + 1, dtype=np.int64)
+    dn[0:level + 1] = n0
+
+    while (0 < np.sum(dn)):
+
+        for l in range(0, level + 1):
+            if (dn[l] <= 0):
+                continue
+            x, seed = sample(int(dn[l]), seed)
+            t0 = time.perf_counter()
+            y = func(x, l)
+            if (0 < l):
+                y = y - func(x, l - 1)
+            t0 = time.perf_counter() - t0
+            n[l] = n[l] + dn[l]
+            s1[l] = s1[l] + np.sum(y)
+            s2[l] = s2[l] + np.sum(y * y)
+            if (cost is None):
+                c1[l] = c1[l] + t0
+            else:
+                c1[l] = c1[l] + dn[l] * cost(l)
+
+        k = level + 1
+        mean = s1[0:k] / n[0:k]
+        var = np.maximum(s2[0:k] / n[0:k] - mean * mean, 0.0)
+        c = np.maximum(c1[0:k] / n[0:k], 1.0E-300)
+        #
+        #  Keep the variance of a level off zero, so that it gets points.
+        #
+        var = np.maximum(var, 1.0E-30)
+
+        n_opt = np.ceil(2.0 / eps ** 2 * np.sqrt(var / c)
+                        * np.sum(np.sqrt(var * c)))
+        dn[0:k] = np.maximum(0, n_opt.astype(np.int64) - n[0:k])
+
+        if (np.all(dn[0:k] <= 0.01 * n[0:k])):
+            #
+            #  Extrapolate the bias from the last corrections.
+            #
+            a = alpha
+            if (a is None and 3 <= k):
+                ll = np.arange(1, k)
+                a = - np.polyfit(ll, np.log2(np.abs(mean[1:k]) + 1.0E-300), 1)[0]
+                a = max(a, 0.5)
+            elif (a is None):
+                a = 1.0
+            bias = np.abs(mean[k - 1])
+            if (3 <= k):
+                #
+                #  MEAN(0) is the coarse mean, not a correction.
+                #
+                bias = max(bias, np.abs(mean[k - 2]) * 2.0 ** (- a))
+            bias = bias / (2.0 ** a - 1.0)
+
+            if (eps / np.sqrt(2.0) < bias and level < level_max):
+                level = level + 1
+                dn[level] = n0
+            else:
+                dn[0:k] = 0
+
+    k = level + 1
+    mean = s1[0:k] / n[0:k]
+    var = np.maximum(s2[0:k] / n[0:k] - mean * mean, 0.0)
+
+    integral = volume * np.sum(mean)
+    error = volume * np.sqrt(np.sum(var / n[0:k]))
+
+    info = {
+        'n': n[0:k].copy(),
+        'mean': volume * mean,
+        'variance': volume ** 2 * var,
+        'cost': c1[0:k] / n[0:k],
+    }
+
+    return integral, error, info, seed
@@ -1,12 +1,12 @@
 #! /usr/bin/env python3
 #
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
 import os
 import time
 
 sys.path.append(os.path.join('../'))
+from math import comb, exp, lgamma
 
 
 def monomial_value(n, m, e, x):
@@ -34,13 +34,336 @@ def monomial_value(n, m, e, x):
     #
     #    Output, real V(N), the monomial values.
     #
-    import numpy as np
-
     v = np.ones(n)
 
     for i in range(0, m):
         if (0 != e[i]):
-            for j in range(0, n):
-                v[j] = v[j] * x[j, i] ** e[i]
+            v = v * x[0:n, i] ** e[i]
 
     return v
+
+
+def monomial_values(e, x):
+
+    #
+    # MONOMIAL_VALUES evaluates several monomials at many points.
+    #
+    #  Parameters:
+    #
+    #    Input, integer E(K,M), the exponents of K monomials.
+    #
+    #    Input, real X(M,N), the points.
+    #
+    #    Output, real V(N,K), the monomial values.
+    #
+    e = np.atleast_2d(np.asarray(e, dtype=np.int64))
+    k, m = e.shape
+    n = x.shape[1]
+
+    v = np.ones([n, k])
+    for i in range(0, m):
+        for p in np.unique(e[:, i]):
+            if (p != 0):
+                v[:, e[:, i] == p] *= (x[i, :] ** p)[:, None]
+
+    return v
+
+
+def monomial_exponents(m, degree_max, degree_min=1):
+
+    #
+    # MONOMIAL_EXPONENTS lists the exponents of all monomials up to a degree.
+    #
+    #  Discussion:
+    #
+    #    The monomials are in graded order, lowest total degree first.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer DEGREE_MAX, the largest total degree.
+    #
+    #    Input, integer DEGREE_MIN, the smallest total degree, by default
+    #    1, which leaves out the constant.
+    #
+    #    Output, integer E(K,M), the exponents.
+    #
+    from itertools import combinations_with_replacement
+
+    e = []
+    for d in range(degree_min, degree_max + 1):
+        for c in combinations_with_replacement(range(0, m), d):
+            row = [0] * m
+            for i in c:
+                row[i] = row[i] + 1
+            e.append(row)
+    e = np.array(e, dtype=np.int64).reshape(-1, m)
+
+    return e
+
+
+def monomial_exponent_check(name, e):
+
+    #
+    # MONOMIAL_EXPONENT_CHECK stops if an exponent is negative.
+    #
+    if (np.any(np.asarray(e) < 0)):
+        print('')
+        print('%s - Fatal error!' % (name))
+        print('  All exponents must be nonnegative.')
+        exit('%s - Fatal error!' % (name))
+
+
+def hypercube01_monomial_integral(m, e):
+
+    #
+    # HYPERCUBE01_MONOMIAL_INTEGRAL: integrals over the unit hypercube in M dimensions.
+    #
+    #  Discussion:
+    #
+    #    The integration region is 0 <= X(I) <= 1.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer E(M), the exponents.  Each exponent must be nonnegative.
+    #
+    #    Output, real INTEGRAL, the integral.
+    #
+    monomial_exponent_check('HYPERCUBE01_MONOMIAL_INTEGRAL', e)
+
+    integral = 1.0
+    for i in range(0, m):
+        integral = integral / float(e[i] + 1)
+
+    return integral
+
+
+def hypersphere01_monomial_integral(m, e):
+
+    #
+    # HYPERSPHERE01_MONOMIAL_INTEGRAL: monomial integrals on the unit hypersphere.
+    #
+    #  Discussion:
+    #
+    #    The integration region is
+    #
+    #      sum ( 1 <= I <= M ) X(I)^2 = 1.
+    #
+    #    The integral is zero unless every exponent is even, and then
+    #
+    #      2 * prod ( Gamma ( ( E(I) + 1 ) / 2 ) ) / Gamma ( sum ( E(I) + 1 ) / 2 ).
+    #
+    #  Reference:
+    #
+    #    Gerald Folland,
+    #    How to Integrate a Polynomial Over a Sphere,
+    #    American Mathematical Monthly,
+    #    Volume 108, Number 5, May 2001, pages 446-448.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer E(M), the exponents.  Each exponent must be nonnegative.
+    #
+    #    Output, real INTEGRAL, the integral.
+    #
+    monomial_exponent_check('HYPERSPHERE01_MONOMIAL_INTEGRAL', e)
+
+    for i in range(0, m):
+        if ((e[i] % 2) == 1):
+            return 0.0
+
+    log_integral = 0.0
+    s = 0.0
+    for i in range(0, m):
+        log_integral = log_integral + lgamma(0.5 * float(e[i] + 1))
+        s = s + float(e[i] + 1)
+    log_integral = log_integral - lgamma(0.5 * s)
+
+    return 2.0 * exp(log_integral)
+
+
+def hyperball01_monomial_integral(m, e):
+
+    #
+    # HYPERBALL01_MONOMIAL_INTEGRAL: integrals in the unit hyperball in M dimensions.
+    #
+    #  Discussion:
+    #
+    #    The integration region is
+    #
+    #      sum ( 1 <= I <= M ) X(I)^2 <= 1.
+    #
+    #    The surface integral is divided by sum ( E(I) ) + M to give the
+    #    volume integral.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer E(M), the exponents.  Each exponent must be nonnegative.
+    #
+    #    Output, real INTEGRAL, the integral.
+    #
+    integral = hypersphere01_monomial_integral(m, e)
+
+    return integral / float(np.sum(e[0:m]) + m)
+
+
+def ball01_monomial_integral(e):
+
+    #
+    # BALL01_MONOMIAL_INTEGRAL returns monomial integrals in the unit ball.
+    #
+    #  Parameters:
+    #
+    #    Input, integer E(3), the exponents of X, Y and Z.
+    #
+    #    Output, real INTEGRAL, the integral.
+    #
+    return hyperball01_monomial_integral(3, e)
+
+
+def disk01_monomial_integral(e):
+
+    #
+    # DISK01_MONOMIAL_INTEGRAL returns monomial integrals in the unit disk.
+    #
+    #  Parameters:
+    #
+    #    Input, integer E(2), the exponents of X and Y.
+    #
+    #    Output, real INTEGRAL, the integral.
+    #
+    return hyperball01_monomial_integral(2, e)
+
+
+def disk01_quarter_monomial_integral(e):
+
+    #
+    # DISK01_QUARTER_MONOMIAL_INTEGRAL: integrals in the unit quarter disk.
+    #
+    #  Discussion:
+    #
+    #    The integration region is X^2 + Y^2 <= 1, 0 <= X, 0 <= Y.
+    #
+    #  Parameters:
+    #
+    #    Input, integer E(2), the exponents of X and Y.
+    #
+    #    Output, real INTEGRAL, the integral.
+    #
+    monomial_exponent_check('DISK01_QUARTER_MONOMIAL_INTEGRAL', e)
+
+    integral = exp(lgamma((e[0] + 3) / 2.0) + lgamma((e[1] + 1) / 2.0)
+                   - lgamma((e[0] + e[1] + 4) / 2.0)) / 2.0 / (1.0 + e[0])
+
+    return integral
+
+
+def simplex_unit_monomial_integral(m, e):
+
+    #
+    # SIMPLEX_UNIT_MONOMIAL_INTEGRAL: integrals in the unit simplex in M dimensions.
+    #
+    #  Discussion:
+    #
+    #    The integration region is 0 <= X(I), sum ( X(I) ) <= 1, and
+    #
+    #      integral = prod ( E(I)! ) / ( M + sum ( E(I) ) )!
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer E(M), the exponents.  Each exponent must be nonnegative.
+    #
+    #    Output, real INTEGRAL, the integral.
+    #
+    monomial_exponent_check('SIMPLEX_UNIT_MONOMIAL_INTEGRAL', e)
+
+    k = 0
+    integral = 1.0
+
+    for i in range(0, m):
+        for j in range(1, e[i] + 1):
+            k = k + 1
+            integral = integral * float(j) / float(k)
+
+    for i in range(0, m):
+        k = k + 1
+        integral = integral / float(k)
+
+    return integral
+
+
+def pyramid01_integral(e):
+
+    #
+    # PYRAMID01_INTEGRAL: monomial integral in the unit pyramid.
+    #
+    #  Discussion:
+    #
+    #    The unit pyramid has the square base -1 <= X, Y <= 1 at Z = 0
+    #    and its apex at (0,0,1).
+    #
+    #  Reference:
+    #
+    #    Arthur Stroud,
+    #    Approximate Calculation of Multiple Integrals,
+    #    Prentice Hall, 1971,
+    #    ISBN: 0130438936,
+    #    LC: QA311.S85.
+    #
+    #  Parameters:
+    #
+    #    Input, integer E(3), the exponents.
+    #
+    #    Output, real VALUE, the integral of the monomial.
+    #
+    monomial_exponent_check('PYRAMID01_INTEGRAL', e)
+
+    if (((e[0] % 2) == 1) or ((e[1] % 2) == 1)):
+        return 0.0
+
+    i_hi = 2 + e[0] + e[1]
+
+    value = 0.0
+    for i in range(0, i_hi + 1):
+        value = value + (-1.0) ** i * comb(i_hi, i) / float(i + e[2] + 1)
+
+    value = value * 2.0 / float(e[0] + 1) * 2.0 / float(e[1] + 1)
+
+    return value
+
+
+def wedge01_monomial_integral(e):
+
+    #
+    # WEDGE01_MONOMIAL_INTEGRAL: integral of a monomial in the unit wedge in 3D.
+    #
+    #  Discussion:
+    #
+    #    The unit wedge is the unit triangle, 0 <= X, 0 <= Y, X + Y <= 1,
+    #    times -1 <= Z <= 1.
+    #
+    #  Parameters:
+    #
+    #    Input, integer E(3), the exponents.
+    #
+    #    Output, real VALUE, the integral of the monomial.
+    #
+    monomial_exponent_check('WEDGE01_MONOMIAL_INTEGRAL', e)
+
+    value = simplex_unit_monomial_integral(2, e[0:2])
+
+    if ((e[2] % 2) == 1):
+        value = 0.0
+    else:
+        value = value * 2.0 / float(e[2] + 1)
+
+    return value
@@ -4,13 +4,14 @@
 #    This code is distributed under the GNU LGPL license.
 #
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
 import os
 import time
 
 sys.path.append(os.path.join('../'))
-from rnd_uniform.triangle import diagonal
+from math import comb
+from rnd_uniform.triangle import diagonal, polygon_triangulate_monotone, polygon_contains_points
+from rnd_uniform.uniform import r8vec_uniform_01
 
 
 def polygon_area(n, x, y):
@@ -44,6 +45,322 @@ def polygon_area(n, x, y):
     return area
 
 
+def polygon_monomial_integral(n, x, y, e):
+
+    #
+    # POLYGON_MONOMIAL_INTEGRAL integrates a monomial over a polygon.
+    #
+    #  Discussion:
+    #
+    #    The monomial is F(X,Y) = X^E(1) * Y^E(2).  See
+    #    POLYGON_MONOMIAL_INTEGRALS, which does a whole table at once.
+    #
+    #  Parameters:
+    #
+    #    Input, integer N, the number of vertices.
+    #
+    #    Input, real X(N), Y(N), the vertex coordinates.
+    #
+    #    Input, integer E(2), the exponents.
+    #
+    #    Output, real VALUE, the integral of the monomial.
+    #
+    value = polygon_monomial_integrals(n, x, y, [e])[0]
+
+    return value
+
+
+def polygon_monomial_integrals(n, x, y, e):
+
+    #
+    # POLYGON_MONOMIAL_INTEGRALS integrates a table of monomials over a polygon.
+    #
+    #  Discussion:
+    #
+    #    The monomials are F(X,Y) = X^P * Y^Q for each row (P,Q) of E.
+    #    By Green's theorem each integral is a sum over the edges:
+    #
+    #      1 / ( (P+Q+2) (P+Q+1) C(P+Q,P) ) * sum ( edges (A,B) )
+    #        ( XA * YB - XB * YA ) * sum ( 0 <= K <= P, 0 <= L <= Q )
+    #          C(K+L,L) * C(P+Q-K-L,Q-L) * XB^K * XA^(P-K) * YB^L * YA^(Q-L)
+    #
+    #    so the cost is O(N) for each monomial.  All monomials and edges
+    #    are evaluated together; the edges are taken in chunks to bound
+    #    the memory.
+    #
+    #    The vertices should be listed in counter-clockwise order; for
+    #    clockwise order the sign of the result is reversed.
+    #
+    #  Reference:
+    #
+    #    Carsten Steger,
+    #    On the calculation of arbitrary moments of polygons,
+    #    Technical Report FGBV-96-05,
+    #    Forschungsgruppe Bildverstehen, Informatik IX,
+    #    Technische Universitaet Muenchen, October 1996.
+    #
+    #  Parameters:
+    #
+    #    Input, integer N, the number of vertices.
+    #
+    #    Input, real X(N), Y(N), the vertex coordinates.
+    #
+    #    Input, integer E(T,2), the exponents.
+    #
+    #    Output, real VALUE(T), the integrals of the monomials.
+    #
+    e = np.asarray(e, dtype=np.int64).reshape(-1, 2)
+    if (np.any(e < 0)):
+        print('')
+        print('POLYGON_MONOMIAL_INTEGRALS - Fatal error!')
+        print('  All exponents must be nonnegative.')
+        exit('POLYGON_MONOMIAL_INTEGRALS - Fatal error!')
+
+    if (e.shape[0] == 0):
+        return np.zeros(0)
+
+    p = e[:, 0]
+    q = e[:, 1]
+    pm = int(np.max(p))
+    qm = int(np.max(q))
+    k = np.arange(0, pm + 1)
+    l = np.arange(0, qm + 1)
+    #
+    #  COEF(T,K,L) = C(K+L,L) * C(P+Q-K-L,Q-L), zero outside K <= P, L <= Q.
+    #
+    choose = np.array([[comb(i, j) for j in range(0, pm + qm + 1)]
+                       for i in range(0, pm + qm + 1)], dtype=np.float64)
+    kk = k[None, :, None]
+    ll = l[None, None, :]
+    pp = p[:, None, None]
+    qq = q[:, None, None]
+    inside = (kk <= pp) & (ll <= qq)
+    coef = choose[kk + ll, ll] * \
+        choose[np.clip(pp + qq - kk - ll, 0, None), np.clip(qq - ll, 0, None)]
+    coef = np.where(inside, coef, 0.0)
+    pk = np.clip(p[:, None] - k[None, :], 0, None)
+    ql = np.clip(q[:, None] - l[None, :], 0, None)
+
+    xb = np.asarray(x[0:n], dtype=np.float64)
+    yb = np.asarray(y[0:n], dtype=np.float64)
+    xa = np.roll(xb, 1)
+    ya = np.roll(yb, 1)
+
+    value = np.zeros(e.shape[0])
+    chunk = max(1, 2**22 // (e.shape[0] * (pm + qm + 2)))
+    for i in range(0, n, chunk):
+        j = min(n, i + chunk)
+        xbp = xb[None, i:j] ** k[:, None]
+        xap = xa[None, i:j] ** k[:, None]
+        ybp = yb[None, i:j] ** l[:, None]
+        yap = ya[None, i:j] ** l[:, None]
+        a = xbp[None, :, :] * xap[pk]
+        b = ybp[None, :, :] * yap[ql]
+        s_pq = np.einsum('tkc,tkl,tlc->tc', a, coef, b)
+        value = value + s_pq @ (xa[i:j] * yb[i:j] - xb[i:j] * ya[i:j])
+
+    value = value / ((p + q + 2) * (p + q + 1) * choose[p + q, p])
+
+    return value
+
+
+def multipolygon_rings(parts):
+
+    #
+    # MULTIPOLYGON_RINGS collects the rings of a region with holes and parts.
+    #
+    #  Discussion:
+    #
+    #    A region is a list of parts.  Each part is a list of rings: the
+    #    outer boundary first, then its holes.  Each ring is a real
+    #    array V(NV,2) of distinct vertices, in either orientation.
+    #
+    #    The rings are stacked into one vertex list, outer boundaries
+    #    counterclockwise and holes clockwise, so that the interior always
+    #    lies to the left of NEXT_NODE.
+    #
+    #  Parameters:
+    #
+    #    Input, list PARTS, the parts of the region.
+    #
+    #    Output, real X(N), Y(N), the vertex coordinates.
+    #
+    #    Output, integer NEXT_NODE(N), the next vertex on the same ring.
+    #
+    #    Output, integer RING(R+1), the rings are X[RING(I):RING(I+1)].
+    #
+    xs = []
+    ys = []
+    ring = [0]
+
+    for part in parts:
+        for k, v in enumerate(part):
+            v = np.asarray(v, dtype=np.float64)
+            nv = v.shape[0]
+            if (nv < 3):
+                print('')
+                print('MULTIPOLYGON_RINGS - Fatal error!')
+                print('  A ring has fewer than 3 vertices.')
+                exit('MULTIPOLYGON_RINGS - Fatal error!')
+            area = polygon_area(nv, v[:, 0], v[:, 1])
+            if ((k == 0) == (area < 0.0)):
+                v = v[::-1]
+            xs.append(v[:, 0])
+            ys.append(v[:, 1])
+            ring.append(ring[-1] + nv)
+
+    x = np.concatenate(xs)
+    y = np.concatenate(ys)
+    next_node = np.arange(1, ring[-1] + 1)
+    for i in range(0, len(ring) - 1):
+        next_node[ring[i + 1] - 1] = ring[i]
+
+    return x, y, next_node, np.array(ring)
+
+
+def multipolygon_triangulate(parts):
+
+    #
+    # MULTIPOLYGON_TRIANGULATE triangulates a region with holes and parts.
+    #
+    #  Discussion:
+    #
+    #    All rings are triangulated together by POLYGON_TRIANGULATE_MONOTONE,
+    #    so the holes need no bridging.
+    #
+    #  Parameters:
+    #
+    #    Input, list PARTS, the parts of the region, as for MULTIPOLYGON_RINGS.
+    #
+    #    Output, real X(N), Y(N), the vertex coordinates.
+    #
+    #    Output, integer TRIANGLES(NT,3), the counterclockwise triangles.
+    #
+    x, y, next_node, ring = multipolygon_rings(parts)
+    triangles = polygon_triangulate_monotone(x.shape[0], x, y, next_node)
+
+    return x, y, triangles
+
+
+def multipolygon_area(parts):
+
+    #
+    # MULTIPOLYGON_AREA returns the area of a region with holes and parts.
+    #
+    #  Parameters:
+    #
+    #    Input, list PARTS, the parts of the region, as for MULTIPOLYGON_RINGS.
+    #
+    #    Output, real AREA, the area of the region.
+    #
+    x, y, next_node, ring = multipolygon_rings(parts)
+    area = 0.5 * np.sum(x * y[next_node] - x[next_node] * y)
+
+    return area
+
+
+def multipolygon_monomial_integral(parts, e):
+
+    #
+    # MULTIPOLYGON_MONOMIAL_INTEGRAL integrates a monomial over a region.
+    #
+    #  Discussion:
+    #
+    #    The region may have holes and several parts.  The holes are
+    #    clockwise, so their integrals enter with a negative sign.
+    #
+    #  Parameters:
+    #
+    #    Input, list PARTS, the parts of the region, as for MULTIPOLYGON_RINGS.
+    #
+    #    Input, integer E(2), the exponents.
+    #
+    #    Output, real VALUE, the integral of X^E(1) * Y^E(2).
+    #
+    x, y, next_node, ring = multipolygon_rings(parts)
+
+    value = 0.0
+    for i in range(0, ring.shape[0] - 1):
+        value = value + polygon_monomial_integral(
+            ring[i + 1] - ring[i], x[ring[i]:ring[i + 1]], y[ring[i]:ring[i + 1]], e)
+
+    return value
+
+
+def multipolygon_contains(parts, p):
+
+    #
+    # MULTIPOLYGON_CONTAINS tests which points lie inside a region.
+    #
+    #  Parameters:
+    #
+    #    Input, list PARTS, the parts of the region, as for MULTIPOLYGON_RINGS.
+    #
+    #    Input, real P(2,NP), the points to test.
+    #
+    #    Output, logical INSIDE(NP), is TRUE for the points inside.
+    #
+    x, y, next_node, ring = multipolygon_rings(parts)
+    inside = polygon_contains_points(x.shape[0], x, y, p, next_node)
+
+    return inside
+
+
+def multipolygon_sample(parts, n, seed, triangulation=None):
+
+    #
+    # MULTIPOLYGON_SAMPLE uniformly samples a region with holes and parts.
+    #
+    #  Discussion:
+    #
+    #    A triangle is chosen with probability proportional to its area,
+    #    and a point is placed uniformly in it.  All N points are made in
+    #    one vectorized pass, and no sample is wasted on the holes.
+    #
+    #    When sampling the same region repeatedly, pass the output of
+    #    MULTIPOLYGON_TRIANGULATE as TRIANGULATION to skip that step.
+    #
+    #  Parameters:
+    #
+    #    Input, list PARTS, the parts of the region, as for MULTIPOLYGON_RINGS.
+    #
+    #    Input, integer N, the number of points to create.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, tuple TRIANGULATION, optional, (X, Y, TRIANGLES).
+    #
+    #    Output, real S(2,N), the points.
+    #
+    if (triangulation is None):
+        triangulation = multipolygon_triangulate(parts)
+    x, y, triangles = triangulation
+
+    xt = x[triangles]
+    yt = y[triangles]
+    area = 0.5 * ((xt[:, 1] - xt[:, 0]) * (yt[:, 2] - yt[:, 0])
+                  - (xt[:, 2] - xt[:, 0]) * (yt[:, 1] - yt[:, 0]))
+    area_cumulative = np.cumsum(area)
+    area_cumulative = area_cumulative / area_cumulative[-1]
+
+    u, seed = r8vec_uniform_01(3 * n, seed)
+    i = np.minimum(np.searchsorted(area_cumulative, u[0:n]),
+                   triangles.shape[0] - 1)
+    r1 = u[n:2 * n]
+    r2 = u[2 * n:3 * n]
+    flip = (1.0 < r1 + r2)
+    r1[flip] = 1.0 - r1[flip]
+    r2[flip] = 1.0 - r2[flip]
+    r0 = 1.0 - r1 - r2
+
+    s = np.zeros([2, n])
+    s[0, :] = r0 * xt[i, 0] + r1 * xt[i, 1] + r2 * xt[i, 2]
+    s[1, :] = r0 * yt[i, 0] + r1 * yt[i, 1] + r2 * yt[i, 2]
+
+    return s, seed
+
+
 def triangle_area(xa, ya, xb, yb, xc, yc):
 
     #
@@ -0,0 +1,585 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.uniform import r8vec_uniform_01, r8mat_normal_01
+
+
+def polytope_chord_slack(slack, ad):
+
+    #
+    # POLYTOPE_CHORD_SLACK intersects lines with a polytope, given the slacks.
+    #
+    #  Discussion:
+    #
+    #    The polytope is { x : A x <= b }.  For K lines X(:,J) + t D(:,J),
+    #    with X(:,J) inside, the line stays inside for TMIN(J) <= t <= TMAX(J).
+    #
+    #    Only the slacks S = b - A X and the products A D are needed, so a
+    #    sampler that keeps S up to date never forms A X again.
+    #
+    #    A line along which the polytope is unbounded gets an infinite limit.
+    #
+    #  Parameters:
+    #
+    #    Input, real SLACK(P,K), the slacks b - A X of the K points.
+    #
+    #    Input, real AD(P,K), the products A D of the K directions.
+    #
+    #    Output, real TMIN(K), TMAX(K), the limits of the chords.
+    #
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = slack / ad
+    tmax = np.min(np.where(0.0 < ad, t, np.inf), axis=0)
+    tmin = np.max(np.where(ad < 0.0, t, -np.inf), axis=0)
+
+    return tmin, tmax
+
+
+def polytope_chord(a, b, x, d):
+
+    #
+    # POLYTOPE_CHORD intersects lines with a polytope.
+    #
+    #  Parameters:
+    #
+    #    Input, real A(P,M), B(P), the polytope { x : A x <= b }.
+    #
+    #    Input, real X(M,K), points inside the polytope.
+    #
+    #    Input, real D(M,K), directions.
+    #
+    #    Output, real TMIN(K), TMAX(K), the limits of the chords, so that
+    #    X + t D is in the polytope for TMIN <= t <= TMAX.
+    #
+    slack = b[:, None] - a @ x
+
+    return polytope_chord_slack(slack, a @ d)
+
+
+def polytope_chebyshev_center(a, b):
+
+    #
+    # POLYTOPE_CHEBYSHEV_CENTER finds the center of the largest inscribed ball.
+    #
+    #  Discussion:
+    #
+    #    The center C and radius R solve the linear program
+    #
+    #      maximize R  subject to  A C + R ||A(i,:)|| <= b,  R >= 0.
+    #
+    #    This needs SCIPY, which is only imported when the routine is called.
+    #
+    #  Parameters:
+    #
+    #    Input, real A(P,M), B(P), the polytope { x : A x <= b }.
+    #
+    #    Output, real C(M), the center.
+    #
+    #    Output, real R, the radius.
+    #
+    from scipy.optimize import linprog
+
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    p, m = a.shape
+
+    norm = np.sqrt(np.sum(a ** 2, axis=1))
+    a_ub = np.hstack([a, norm[:, None]])
+    cost = np.zeros(m + 1)
+    cost[m] = -1.0
+    bounds = [(None, None)] * m + [(0.0, None)]
+
+    result = linprog(cost, A_ub=a_ub, b_ub=b, bounds=bounds, method='highs')
+
+    if (result.status != 0 or result.x[m] <= 0.0):
+        print('')
+        print('POLYTOPE_CHEBYSHEV_CENTER - Fatal error!')
+        print('  The polytope is empty, flat or unbounded.')
+        print('  ' + result.message)
+        exit('POLYTOPE_CHEBYSHEV_CENTER - Fatal error!')
+
+    return result.x[0:m], result.x[m]
+
+
+def mcmc_ess(x):
+
+    #
+    # MCMC_ESS estimates the effective sample size of Markov chains.
+    #
+    #  Discussion:
+    #
+    #    The autocorrelations of each chain are found by FFT, combined
+    #    across chains with the between-chain variance, and summed by
+    #    Geyer's initial monotone positive sequence:
+    #
+    #      ESS = K * D / ( - 1 + 2 * sum ( pairs of autocorrelations ) )
+    #
+    #  Reference:
+    #
+    #    Charles Geyer,
+    #    Practical Markov Chain Monte Carlo,
+    #    Statistical Science,
+    #    Volume 7, Number 4, 1992, pages 473-483.
+    #
+    #    Andrew Gelman, John Carlin, Hal Stern, David Dunson,
+    #    Aki Vehtari, Donald Rubin,
+    #    Bayesian Data Analysis,
+    #    Third Edition,
+    #    CRC Press, 2013,
+    #    ISBN: 9781439840955.
+    #
+    #  Parameters:
+    #
+    #    Input, real X(M,K,D), D draws from each of K chains of an
+    #    M-dimensional quantity.  X(K,D) is also accepted.
+    #
+    #    Output, real ESS(M), the effective sample size of each component.
+    #
+    x = np.asarray(x, dtype=np.float64)
+    if (x.ndim == 2):
+        x = x[None, :, :]
+    m, k, d = x.shape
+
+    if (d < 4):
+        return np.full(m, float(k * d))
+
+    chain_mean = np.mean(x, axis=2)
+    xc = x - chain_mean[:, :, None]
+    f = np.fft.rfft(xc, n=2 * d, axis=2)
+    acov = np.fft.irfft(f * np.conj(f), n=2 * d, axis=2)[:, :, 0:d] / d
+
+    within = np.mean(acov[:, :, 0], axis=1) * d / (d - 1)
+    if (1 < k):
+        between = np.var(chain_mean, axis=1, ddof=1)
+    else:
+        between = np.zeros(m)
+    var_plus = within * (d - 1) / d + between
+
+    ess = np.full(m, float(k * d))
+    ok = (0.0 < var_plus)
+    rho = 1.0 - (within[ok, None] - np.mean(acov[ok], axis=1)) \
+        / var_plus[ok, None]
+    rho[:, 0] = 1.0
+    #
+    #  Sum the pairs RHO(2T) + RHO(2T+1) while they stay positive,
+    #  forcing them to decrease.
+    #
+    pair = rho[:, 0:2 * (d // 2):2] + rho[:, 1:2 * (d // 2):2]
+    positive = np.cumprod(0.0 < pair, axis=1).astype(bool)
+    pair = np.minimum.accumulate(np.where(positive, pair, 0.0), axis=1)
+    tau = - 1.0 + 2.0 * np.sum(pair, axis=1)
+    tau = np.maximum(tau, 1.0 / np.log10(float(k * d)))
+    ess[ok] = k * d / tau
+
+    return ess
+
+
+def polytope_sample(a, b, n, seed, method='hit_and_run', chain_num=None,
+                    burn_in=None, thin=1, x0=None):
+
+    #
+    # POLYTOPE_SAMPLE samples a convex polytope by hit-and-run.
+    #
+    #  Discussion:
+    #
+    #    The polytope is { x : A x <= b }, bounded, in M dimensions.
+    #
+    #    Rejection from a box fails in high dimension, because the volume
+    #    fraction of the polytope goes to zero.  Hit-and-run instead moves
+    #    each chain to a uniform point on the chord through its current
+    #    point in a random direction.  The direction is
+    #
+    #      'hit_and_run':  uniform on the unit sphere;
+    #      'coordinate':   a random coordinate axis, which costs O(P)
+    #                      rather than O(P*M) a step.
+    #
+    #    CHAIN_NUM chains run together as the columns of one matrix, and
+    #    their slacks b - A X are updated in place, so a step is a few
+    #    matrix operations whatever the number of chains.  The chains start
+    #    at X0, by default the Chebyshev center, run BURN_IN steps, then
+    #    keep every THIN-th point.
+    #
+    #    The samples are correlated, so the effective sample size ESS of
+    #    each coordinate is returned too.  Statistics of the sample have
+    #    standard errors about sigma / sqrt ( ESS ), not sigma / sqrt ( N ).
+    #
+    #  Reference:
+    #
+    #    Robert Smith,
+    #    Efficient Monte Carlo Procedures for Generating Points Uniformly
+    #    Distributed over Bounded Regions,
+    #    Operations Research,
+    #    Volume 32, Number 6, 1984, pages 1296-1308.
+    #
+    #    Laszlo Lovasz, Santosh Vempala,
+    #    Hit-and-run from a corner,
+    #    SIAM Journal on Computing,
+    #    Volume 35, Number 4, 2006, pages 985-1005.
+    #
+    #  Parameters:
+    #
+    #    Input, real A(P,M), B(P), the polytope.
+    #
+    #    Input, integer N, the number of points wanted.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, string METHOD, 'hit_and_run' or 'coordinate'.
+    #
+    #    Input, integer CHAIN_NUM, the number of chains, by default
+    #    min ( N, 32 ).
+    #
+    #    Input, integer BURN_IN, the steps discarded, by default 10 * M^2.
+    #
+    #    Input, integer THIN, the steps between kept points.
+    #
+    #    Input, real X0(M) or X0(M,CHAIN_NUM), optional, interior
+    #    starting points.
+    #
+    #    Output, real X(M,N), the points, chain by chain.
+    #
+    #    Output, real ESS(M), the effective sample size of each coordinate.
+    #
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    p, m = a.shape
+
+    if (method not in ('hit_and_run', 'coordinate')):
+        print('')
+        print('POLYTOPE_SAMPLE - Fatal error!')
+        print('  Unknown METHOD = "%s".' % (method))
+        exit('POLYTOPE_SAMPLE - Fatal error!')
+
+    if (chain_num is None):
+        chain_num = min(n, 32)
+    if (burn_in is None):
+        burn_in = 10 * m * m
+    thin = max(int(thin), 1)
+    draw_num = -(-n // chain_num)
+
+    if (x0 is None):
+        x0, r = polytope_chebyshev_center(a, b)
+    x = np.empty([m, chain_num])
+    x[:, :] = np.asarray(x0, dtype=np.float64).reshape(m, -1)
+
+    slack = b[:, None] - a @ x
+    if (np.any(slack <= 0.0)):
+        print('')
+        print('POLYTOPE_SAMPLE - Fatal error!')
+        print('  X0 is not strictly inside the polytope.')
+        exit('POLYTOPE_SAMPLE - Fatal error!')
+
+    step_num = burn_in + draw_num * thin
+    draws = np.zeros([m, chain_num, draw_num])
+    chain = np.arange(chain_num)
+    #
+    #  Random numbers are made for a block of steps at a time, and the
+    #  slacks are recomputed from scratch after each block to stop the
+    #  rounding errors of the updates from piling up.
+    #
+    block = max(1, min(step_num, 2**18 // (chain_num * (m + 1))))
+    step = 0
+
+    while (step < step_num):
+        nb = min(block, step_num - step)
+        u, seed = r8vec_uniform_01(nb * chain_num, seed)
+        u = u.reshape(nb, chain_num)
+        if (method == 'hit_and_run'):
+            z, seed = r8mat_normal_01(m, nb * chain_num, seed)
+            z = z.reshape(m, nb, chain_num)
+            z = z / np.sqrt(np.sum(z ** 2, axis=0))
+        else:
+            c, seed = r8vec_uniform_01(nb * chain_num, seed)
+            c = np.minimum((c * m).astype(int), m - 1).reshape(nb, chain_num)
+
+        for j in range(0, nb):
+            if (method == 'hit_and_run'):
+                d = z[:, j, :]
+                ad = a @ d
+            else:
+                ad = a[:, c[j]]
+            tmin, tmax = polytope_chord_slack(slack, ad)
+            if (not (np.all(np.isfinite(tmin)) and np.all(np.isfinite(tmax)))):
+                print('')
+                print('POLYTOPE_SAMPLE - Fatal error!')
+                print('  The polytope is unbounded.')
+                exit('POLYTOPE_SAMPLE - Fatal error!')
+            t = tmin + u[j] * (tmax - tmin)
+            if (method == 'hit_and_run'):
+                x = x + t * d
+            else:
+                x[c[j], chain] = x[c[j], chain] + t
+            slack = slack - t * ad
+
+            k = step + j - burn_in
+            if (0 <= k and (k + 1) % thin == 0):
+                draws[:, :, k // thin] = x
+
+        step = step + nb
+        slack = b[:, None] - a @ x
+
+    ess = mcmc_ess(draws)
+    x = draws.reshape(m, chain_num * draw_num)[:, 0:n]
+
+    return x, ess, seed
+
+
+def ball_chord(c, r, x, d):
+
+    #
+    # BALL_CHORD intersects lines with a ball.
+    #
+    #  Discussion:
+    #
+    #    The limits solve | X + t D - C |^2 = R^2.  Lines that miss the
+    #    ball get TMIN = TMAX = 0.
+    #
+    #  Parameters:
+    #
+    #    Input, real C(M), R, the center and radius of the ball.
+    #
+    #    Input, real X(M,K), points.
+    #
+    #    Input, real D(M,K), directions.
+    #
+    #    Output, real TMIN(K), TMAX(K), the limits of the chords.
+    #
+    y = x - np.reshape(c, (-1, 1))
+    dd = np.sum(d * d, axis=0)
+    yd = np.sum(y * d, axis=0)
+    yy = np.sum(y * y, axis=0)
+    disc = np.sqrt(np.maximum(yd * yd - dd * (yy - r * r), 0.0))
+    tmin = (- yd - disc) / dd
+    tmax = (- yd + disc) / dd
+
+    return tmin, tmax
+
+
+def polytope_from_hull(points):
+
+    #
+    # POLYTOPE_FROM_HULL writes the convex hull of points as A x <= b.
+    #
+    #  Discussion:
+    #
+    #    The facets come from the EQUATIONS of SCIPY's ConvexHull, which
+    #    are normal . x + offset <= 0 inside the hull.
+    #
+    #  Parameters:
+    #
+    #    Input, real POINTS(NP,M), the points.
+    #
+    #    Output, real A(P,M), B(P), the hull.
+    #
+    from scipy.spatial import ConvexHull
+
+    equations = ConvexHull(points).equations
+    a = equations[:, 0:-1].copy()
+    b = - equations[:, -1]
+
+    return a, b
+
+
+def convex_volume(m, chord, c, r_in, r_out, seed, sample_num=2048,
+                  chain_num=32, walk=None, burn_in=None):
+
+    #
+    # CONVEX_VOLUME estimates the volume of a convex body by multiphase Monte Carlo.
+    #
+    #  Discussion:
+    #
+    #    The body K contains the ball B(C,R_IN) and lies in B(C,R_OUT).
+    #    With the radii R(I) = R_IN * 2^(I/M), I = 0, ..., Q, and
+    #    Q = ceil ( M * log2 ( R_OUT / R_IN ) ), the bodies
+    #
+    #      K(I) = K intersect B(C,R(I))
+    #
+    #    grow from the ball K(0) to K(Q) = K, and each is at most twice the
+    #    one before.  So
+    #
+    #      vol(K) = vol(B(C,R_IN)) * prod ( 1 <= I <= Q ) vol(K(I)) / vol(K(I-1))
+    #
+    #    and each ratio is estimated by hit-and-run in K(I), as one over the
+    #    fraction of points that fall in B(C,R(I-1)).  The chains of one
+    #    phase start where the last one ended, already nearly uniform.
+    #
+    #    The work is polynomial in M, unlike box rejection.  VOLUME_ERROR
+    #    adds up the relative variances ( 1 - RHO ) / ( RHO * ESS ) of
+    #    the phases, with ESS the effective sample size of each phase.
+    #
+    #  Reference:
+    #
+    #    Martin Dyer, Alan Frieze, Ravi Kannan,
+    #    A random polynomial-time algorithm for approximating the volume
+    #    of convex bodies,
+    #    Journal of the ACM,
+    #    Volume 38, Number 1, 1991, pages 1-17.
+    #
+    #    Laszlo Lovasz, Santosh Vempala,
+    #    Simulated annealing in convex bodies and an O*(n^4) volume algorithm,
+    #    Journal of Computer and System Sciences,
+    #    Volume 72, Number 2, 2006, pages 392-417.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, function CHORD(X(M,K), D(M,K)) -> (TMIN(K), TMAX(K)), the
+    #    chords of K, such as POLYTOPE_CHORD with A and B bound.
+    #
+    #    Input, real C(M), the center.
+    #
+    #    Input, real R_IN, R_OUT, the radii of the inner and outer balls.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, integer SAMPLE_NUM, the points per phase.
+    #
+    #    Input, integer CHAIN_NUM, the number of chains.
+    #
+    #    Input, integer WALK, the steps between points, by default M.
+    #
+    #    Input, integer BURN_IN, the steps at the start of a phase,
+    #    by default 4 * WALK.
+    #
+    #    Output, real VOLUME, the estimate.
+    #
+    #    Output, real VOLUME_ERROR, its standard error.
+    #
+    #    Output, integer PHASE_NUM, the number of phases Q.
+    #
+    #    Output, integer SEED, the updated seed.
+    #
+    from math import lgamma, log, pi
+
+    c = np.asarray(c, dtype=np.float64).reshape(m)
+    if (walk is None):
+        walk = m
+    if (burn_in is None):
+        burn_in = 4 * walk
+    draw_num = -(-sample_num // chain_num)
+
+    if (not (0.0 < r_in and r_in <= r_out)):
+        print('')
+        print('CONVEX_VOLUME - Fatal error!')
+        print('  Need 0 < R_IN <= R_OUT.')
+        exit('CONVEX_VOLUME - Fatal error!')
+
+    phase_num = max(int(np.ceil(m * np.log2(r_out / r_in))), 0)
+    radius = r_in * 2.0 ** (np.arange(phase_num + 1) / m)
+    radius[phase_num] = r_out
+
+    log_volume = 0.5 * m * log(pi) - lgamma(0.5 * m + 1.0) + m * log(r_in)
+    var_log = 0.0
+
+    x = np.repeat(c[:, None], chain_num, axis=1)
+    step_num = burn_in + draw_num * walk
+
+    for i in range(1, phase_num + 1):
+
+        hit = np.zeros([chain_num, draw_num])
+        u, seed = r8vec_uniform_01(step_num * chain_num, seed)
+        u = u.reshape(step_num, chain_num)
+        z, seed = r8mat_normal_01(m, step_num * chain_num, seed)
+        z = z.reshape(m, step_num, chain_num)
+
+        for j in range(0, step_num):
+            tmin, tmax = chord(x, z[:, j, :])
+            smin, smax = ball_chord(c, radius[i], x, z[:, j, :])
+            tmin = np.maximum(tmin, smin)
+            tmax = np.minimum(tmax, smax)
+            x = x + (tmin + u[j] * (tmax - tmin)) * z[:, j, :]
+
+            k = j - burn_in
+            if (0 <= k and (k + 1) % walk == 0):
+                y = x - c[:, None]
+                hit[:, k // walk] = (np.sum(y * y, axis=0)
+                                     <= radius[i - 1] ** 2)
+
+        rho = np.mean(hit)
+        if (rho <= 0.0):
+            print('')
+            print('CONVEX_VOLUME - Fatal error!')
+            print('  No point of phase %d fell in the smaller ball.' % (i))
+            exit('CONVEX_VOLUME - Fatal error!')
+
+        ess = mcmc_ess(hit)[0]
+        log_volume = log_volume - log(rho)
+        var_log = var_log + (1.0 - rho) / (rho * ess)
+
+    volume = np.exp(log_volume)
+    volume_error = volume * np.sqrt(var_log)
+
+    return volume, volume_error, phase_num, seed
+
+
+def polytope_volume(a, b, seed, r_out=None, sample_num=2048, chain_num=32,
+                    walk=None, burn_in=None):
+
+    #
+    # POLYTOPE_VOLUME estimates the volume of a polytope by multiphase Monte Carlo.
+    #
+    #  Discussion:
+    #
+    #    The polytope { x : A x <= b } is handed to CONVEX_VOLUME, with the
+    #    Chebyshev ball as inner ball.  Unless R_OUT is given, the outer
+    #    radius is that of the bounding box, found by 2*M linear programs.
+    #
+    #  Parameters:
+    #
+    #    Input, real A(P,M), B(P), the polytope.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, real R_OUT, optional, the radius of a ball about the
+    #    Chebyshev center containing the polytope.
+    #
+    #    Input, SAMPLE_NUM, CHAIN_NUM, WALK, BURN_IN, as for CONVEX_VOLUME.
+    #
+    #    Output, real VOLUME, the estimate.
+    #
+    #    Output, real VOLUME_ERROR, its standard error.
+    #
+    #    Output, integer SEED, the updated seed.
+    #
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    p, m = a.shape
+
+    c, r_in = polytope_chebyshev_center(a, b)
+
+    if (r_out is None):
+        from scipy.optimize import linprog
+        far = np.zeros(m)
+        for i in range(0, m):
+            for sign in (-1.0, 1.0):
+                cost = np.zeros(m)
+                cost[i] = sign
+                result = linprog(cost, A_ub=a, b_ub=b,
+                                 bounds=[(None, None)] * m, method='highs')
+                if (result.status != 0):
+                    print('')
+                    print('POLYTOPE_VOLUME - Fatal error!')
+                    print('  The polytope is unbounded.')
+                    exit('POLYTOPE_VOLUME - Fatal error!')
+                far[i] = max(far[i], abs(result.x[i] - c[i]))
+        r_out = np.sqrt(np.sum(far ** 2))
+
+    def chord(x, d):
+        return polytope_chord(a, b, x, d)
+
+    volume, volume_error, phase_num, seed = convex_volume(
+        m, chord, c, r_in, r_out, seed, sample_num=sample_num,
+        chain_num=chain_num, walk=walk, burn_in=burn_in)
+
+    return volume, volume_error, seed
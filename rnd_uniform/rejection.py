@@ -0,0 +1,127 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.uniform import r8mat_uniform_01
+
+
+def rejection_sample(m, n, inside, seed, box=None, proposal=None,
+                     proposal_volume=None, batch_max=2**20, round_max=1000):
+
+    #
+    # REJECTION_SAMPLE samples a region given by a membership test.
+    #
+    #  Discussion:
+    #
+    #    Points are drawn from a proposal that covers the region, and
+    #    those for which INSIDE is TRUE are kept.  The proposal is either
+    #    the uniform distribution on the box BOX, or any uniform sampler
+    #    PROPOSAL(K, SEED) -> (X(M,K), SEED) of a domain of known volume
+    #    PROPOSAL_VOLUME, such as BALL01_SAMPLE.
+    #
+    #    The acceptance rate observed so far sizes the next batch, so
+    #    that usually one or two rounds return exactly N points.
+    #
+    #    Every proposed point is a hit-or-miss trial, so the volume of
+    #    the region comes for free:
+    #
+    #      VOLUME = PROPOSAL_VOLUME * HIT / TRIAL
+    #      ERROR  = PROPOSAL_VOLUME * sqrt ( RATE * ( 1 - RATE ) / TRIAL )
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer N, the number of points wanted, at least 1.
+    #
+    #    Input, function INSIDE(X(M,K)) -> logical(K), the membership test.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, real BOX(M,2), optional, the lower and upper bounds of a
+    #    box containing the region.
+    #
+    #    Input, function PROPOSAL(K, SEED), optional, a uniform sampler
+    #    of a domain containing the region, used instead of BOX.
+    #
+    #    Input, real PROPOSAL_VOLUME, the volume of the PROPOSAL domain.
+    #
+    #    Input, integer BATCH_MAX, the largest batch of proposals.
+    #
+    #    Input, integer ROUND_MAX, the largest number of batches.
+    #
+    #    Output, real X(M,N), the points.
+    #
+    #    Output, real VOLUME, the hit-or-miss estimate of the volume.
+    #
+    #    Output, real VOLUME_ERROR, the standard error of VOLUME.
+    #
+    if (n < 1):
+        print('')
+        print('REJECTION_SAMPLE - Fatal error!')
+        print('  N = %d, but at least one point is needed.' % (n))
+        exit('REJECTION_SAMPLE - Fatal error!')
+
+    if (box is not None):
+        box = np.asarray(box, dtype=np.float64).reshape(m, 2)
+        lo = box[:, 0:1]
+        width = box[:, 1:2] - box[:, 0:1]
+        proposal_volume = float(np.prod(width))
+
+        def proposal(k, seed):
+            u, seed = r8mat_uniform_01(m, k, seed)
+            return lo + width * u, seed
+
+    elif (proposal is None or proposal_volume is None):
+        print('')
+        print('REJECTION_SAMPLE - Fatal error!')
+        print('  Give either BOX, or PROPOSAL and PROPOSAL_VOLUME.')
+        exit('REJECTION_SAMPLE - Fatal error!')
+
+    x = np.zeros([m, n])
+    hit = 0
+    trial = 0
+    found = 0
+
+    for r in range(0, round_max):
+        if (n <= found):
+            break
+        #
+        #  Size the batch from the running acceptance rate, with a 10%
+        #  margin so that the last batch rarely comes up short.
+        #
+        if (hit == 0):
+            k = n if (trial == 0) else batch_max
+        else:
+            k = int(np.ceil(1.1 * (n - found) * trial / hit)) + 16
+        k = min(k, batch_max)
+
+        y, seed = proposal(k, seed)
+        keep = np.asarray(inside(y), dtype=bool)
+        y = y[:, keep]
+
+        trial = trial + k
+        hit = hit + y.shape[1]
+        take = min(y.shape[1], n - found)
+        x[:, found:found + take] = y[:, 0:take]
+        found = found + take
+
+    if (found < n):
+        print('')
+        print('REJECTION_SAMPLE - Fatal error!')
+        print('  Only %d of %d points accepted after %d trials.' %
+              (found, n, trial))
+        exit('REJECTION_SAMPLE - Fatal error!')
+
+    rate = hit / float(trial)
+    volume = proposal_volume * rate
+    volume_error = proposal_volume * np.sqrt(rate * (1.0 - rate) / trial)
+
+    return x, volume, volume_error, seed
@@ -5,17 +5,18 @@
 #
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
 import os
 import time
 
 sys.path.append(os.path.join('../'))
-from rnd_uniform.uniform import r8vec_uniform_01, r8mat_uniform_01, r8_uniform_01, r8_normal_01, r8po_fa, r8po_sl, uniform_in_sphere01_map
-from rnd_uniform.triangle import polygon_triangulate, triangle_area
+from rnd_uniform.uniform import r8vec_uniform_01, r8mat_uniform_01, r8_uniform_01, r8_normal_01, r8mat_normal_01, r8po_fa, uniform_in_sphere01_map
+from rnd_uniform.triangle import polygon_triangulate, polygon_triangulate_monotone, triangle_area
+from rnd_uniform.design import hypercube01_stratified, latin_hypercube, orthogonal_array_lhs, antithetic_uniform
 
 
-def hypercube01_sample(m, n, seed):
+def hypercube01_sample(m, n, seed, strata=None, strata_dim=None, lhs=False,
+                       antithetic=False):
 
     # *****************************************************************************80
     #
@@ -42,14 +43,82 @@ def hypercube01_sample(m, n, seed):
     #    Input/output, integer SEED, a seed for the random
     #    number generator.
     #
+    #    Input, integer STRATA, optional, stratify the sample into
+    #    STRATA^STRATA_DIM equal cells, as in HYPERCUBE01_STRATIFIED.
+    #    Use STRATIFIED_ESTIMATE for the error of such a sample.
+    #
+    #    Input, integer STRATA_DIM, the number of stratified leading
+    #    coordinates, by default M.
+    #
+    #    Input, LHS, optional, TRUE for a Latin hypercube sample, or
+    #    'orthogonal' for one built on a Bose orthogonal array, in which
+    #    case N must be the square of a prime P >= M - 1.
+    #
+    #    Input, logical ANTITHETIC, optional, TRUE to make the second half
+    #    of the points from the reflected uniforms of the first half, as
+    #    in ANTITHETIC_UNIFORM.  Use ANTITHETIC_ESTIMATE for the error.
+    #    It cannot be combined with STRATA or LHS.
+    #
     #    Output, real X(M,N), the points.
     #
+    if (antithetic and (strata is not None or lhs)):
+        print('')
+        print('HYPERCUBE01_SAMPLE - Fatal error!')
+        print('  ANTITHETIC cannot be combined with STRATA or LHS.')
+        exit('HYPERCUBE01_SAMPLE - Fatal error!')
+
+    if (strata is not None):
+        return hypercube01_stratified(m, n, seed, strata, strata_dim)
+
+    if (lhs == 'orthogonal'):
+        p = int(round(np.sqrt(n)))
+        if (p * p != n):
+            print('')
+            print('HYPERCUBE01_SAMPLE - Fatal error!')
+            print('  Orthogonal LHS needs N = P^2, not N = %d.' % (n))
+            exit('HYPERCUBE01_SAMPLE - Fatal error!')
+        return orthogonal_array_lhs(m, p, seed)
+
+    if (lhs):
+        return latin_hypercube(m, n, seed)
+
+    if (antithetic):
+        return antithetic_uniform(m, n, seed)
+
     x, seed = r8mat_uniform_01(m, n, seed)
 
     return x, seed
 
 
-def cube01_sample(n, seed):
+def square01_sample(n, seed, strata=None, antithetic=False):
+
+    #
+    # SQUARE01_SAMPLE samples points in the unit square in 2D.
+    #
+    #  Parameters:
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, integer STRATA, optional, stratify the sample into
+    #    STRATA^2 equal cells.
+    #
+    #    Input, logical ANTITHETIC, optional, TRUE to make the second half
+    #    of the points from the reflected uniforms of the first half, as
+    #    in ANTITHETIC_UNIFORM.  Use ANTITHETIC_ESTIMATE for the error.
+    #
+    #    Output, real X(2,N), the points.
+    #
+    m = 2
+
+    x, seed = hypercube01_sample(m, n, seed, strata, antithetic=antithetic)
+
+    return x, seed
+
+
+def cube01_sample(n, seed, strata=None, antithetic=False):
 
     #
     # CUBE01_SAMPLE samples points in the unit cube in 3D.
@@ -61,11 +130,120 @@ def cube01_sample(n, seed):
     #    Input/output, integer SEED, a seed for the random
     #    number generator.
     #
+    #    Input, integer STRATA, optional, stratify the sample into
+    #    STRATA^3 equal cells.
+    #
+    #    Input, logical ANTITHETIC, optional, TRUE to make the second half
+    #    of the points from the reflected uniforms of the first half, as
+    #    in ANTITHETIC_UNIFORM.  Use ANTITHETIC_ESTIMATE for the error.
+    #
     #    Output, real X(3,N), the points.
     #
     m = 3
 
-    x, seed = r8mat_uniform_01(m, n, seed)
+    x, seed = hypercube01_sample(m, n, seed, strata, antithetic=antithetic)
+
+    return x, seed
+
+
+def pyramid01_sample(n, seed, u=None, antithetic=False):
+
+    #
+    # PYRAMID01_SAMPLE: sample the unit pyramid.
+    #
+    #  Discussion:
+    #
+    #    The unit pyramid has the square base -1 <= X, Y <= 1 at Z = 0
+    #    and its apex at (0,0,1).
+    #
+    #    A uniform point of the unit cube is mapped by
+    #
+    #      Z = 1 - U3^(1/3),  X = ( 1 - Z ) ( 2 U1 - 1 ),  Y = ( 1 - Z ) ( 2 U2 - 1 ).
+    #
+    #  Parameters:
+    #
+    #    Input, integer N, the number of samples desired.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, real U(3,N), optional, uniforms to map instead of fresh
+    #    ones, for example a Latin hypercube.  SEED is then not used.
+    #
+    #    Input, logical ANTITHETIC, optional, TRUE to make the second half
+    #    of the points from the reflected uniforms of the first half, as
+    #    in ANTITHETIC_UNIFORM.  Use ANTITHETIC_ESTIMATE for the error.
+    #
+    #    Output, real X(3,N), the sample values.
+    #
+    one_third = 1.0 / 3.0
+
+    if (u is None and antithetic):
+        u, seed = antithetic_uniform(3, n, seed)
+    elif (u is None):
+        u, seed = r8mat_uniform_01(3, n, seed)
+
+    x = np.zeros([3, n])
+    x[2, :] = 1.0 - u[2, :] ** one_third
+    x[1, :] = (1.0 - x[2, :]) * (2.0 * u[1, :] - 1.0)
+    x[0, :] = (1.0 - x[2, :]) * (2.0 * u[0, :] - 1.0)
+
+    return x, seed
+
+
+def wedge01_sample(n, seed, u=None, antithetic=False):
+
+    #
+    # WEDGE01_SAMPLE samples points uniformly from the unit wedge in 3D.
+    #
+    #  Discussion:
+    #
+    #    The unit wedge is the unit triangle, 0 <= X, 0 <= Y, X + Y <= 1,
+    #    times -1 <= Z <= 1.
+    #
+    #    Three uniforms give a uniform point of the triangle through
+    #    exponentials, E = - log ( U ), X = E1 / sum ( E ), Y = E2 / sum ( E ),
+    #    and a fourth gives Z = 2 U4 - 1.
+    #
+    #  Reference:
+    #
+    #    Reuven Rubinstein,
+    #    Monte Carlo Optimization, Simulation, and Sensitivity
+    #    of Queueing Networks,
+    #    Krieger, 1992,
+    #    ISBN: 0894647644,
+    #    LC: QA298.R79.
+    #
+    #  Parameters:
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, real U(4,N), optional, uniforms to map instead of fresh
+    #    ones, for example a Latin hypercube.  SEED is then not used.
+    #
+    #    Input, logical ANTITHETIC, optional, TRUE to make the second half
+    #    of the points from the reflected uniforms of the first half, as
+    #    in ANTITHETIC_UNIFORM.  Use ANTITHETIC_ESTIMATE for the error.
+    #
+    #    Output, real X(3,N), the points.
+    #
+    m = 3
+
+    if (u is None and antithetic):
+        u, seed = antithetic_uniform(m + 1, n, seed)
+    elif (u is None):
+        u, seed = r8mat_uniform_01(m + 1, n, seed)
+
+    e = - np.log(u[0:m, :])
+    e_sum = np.sum(e, axis=0)
+
+    x = np.zeros([m, n])
+    x[0, :] = e[0, :] / e_sum
+    x[1, :] = e[1, :] / e_sum
+    x[2, :] = 2.0 * u[3, :] - 1.0
 
     return x, seed
 
@@ -100,20 +278,12 @@ def ball01_sample(n, seed):
     #    Output, real X(3,N), the points.
     #
 
-    x = np.random.normal(0.0, 1.0, [3, n])
-    for j in range(0, n):
-        norm = np.sqrt(x[0, j] ** 2 + x[1, j] ** 2 + x[2, j] ** 2)
-        for i in range(0, 3):
-            x[i, j] = x[i, j] / norm
-
-    for j in range(0, n):
-        r = np.random.random()
-        x[:, j] = x[:, j] * r ** (1.0 / 3.0)
+    x, seed = uniform_in_sphere01_map(3, n, seed)
 
     return x, seed
 
 
-def annulus_sample(pc, r1, r2, n, seed):
+def annulus_sample(pc, r1, r2, n, seed, u=None, antithetic=False):
 
     #
     # ANNULUS_SAMPLE samples a circular annulus.
@@ -146,6 +316,13 @@ def annulus_sample(pc, r1, r2, n, seed):
     #
     #    Input/output, integer SEED, a seed for the random number generator.
     #
+    #    Input, real U(2,N), optional, uniforms to map instead of fresh
+    #    ones, for example a Latin hypercube.  SEED is then not used.
+    #
+    #    Input, logical ANTITHETIC, optional, TRUE to make the second half
+    #    of the points from the reflected uniforms of the first half, as
+    #    in ANTITHETIC_UNIFORM.  Use ANTITHETIC_ESTIMATE for the error.
+    #
     #    Output, real P(2,N), sample points.
     #
 
@@ -161,8 +338,13 @@ def annulus_sample(pc, r1, r2, n, seed):
         print('  Outer radius R1 < R1 = inner radius.')
         exit('ANNULUS_SAMPLE - Fatal error!')
 
-    u, seed = r8vec_uniform_01(n, seed)
-    v, seed = r8vec_uniform_01(n, seed)
+    if (u is None and antithetic):
+        u, seed = antithetic_uniform(2, n, seed)
+    if (u is None):
+        u, seed = r8vec_uniform_01(n, seed)
+        v, seed = r8vec_uniform_01(n, seed)
+    else:
+        u, v = u[0], u[1]
 
     theta = u * 2.0 * np.pi
     r = np.sqrt((1.0 - v) * r1**2 + v * r2**2)
@@ -174,6 +356,33 @@ def annulus_sample(pc, r1, r2, n, seed):
     return p, seed
 
 
+def line01_sample_ergodic(n, shift):
+
+    #
+    # LINE01_SAMPLE_ERGODIC samples the unit line in 1D.
+    #
+    #  Parameters:
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input/output, real SHIFT, a value between 0 and 1.
+    #
+    #    Output, real X(1,N), the points.
+    #
+
+    golden = (1.0 + np.sqrt(5.0)) / 2.0
+
+    x = np.zeros([1, n])
+
+    shift = np.mod(shift, 1.0)
+
+    for j in range(0, n):
+        x[0, j] = shift
+        shift = np.mod(shift + golden, 1.0)
+
+    return x, shift
+
+
 def circle01_sample_ergodic(n, angle):
 
     #
@@ -205,7 +414,7 @@ def circle01_sample_ergodic(n, angle):
     return x, angle
 
 
-def circle01_sample_random(n, seed):
+def circle01_sample_random(n, seed, antithetic=False):
 
     #
     # CIRCLE01_SAMPLE_RANDOM samples points on the circumference of the unit circle in 2D.
@@ -232,19 +441,25 @@ def circle01_sample_random(n, seed):
     #    Input/output, integer SEED, a seed for the random
     #    number generator.
     #
+    #    Input, logical ANTITHETIC, optional, TRUE to make the second half
+    #    of the points from the reflected uniforms of the first half, as
+    #    in ANTITHETIC_UNIFORM.  Use ANTITHETIC_ESTIMATE for the error.
+    #
     #    Output, real X(2,N), the points.
     #
 
     r = 1.0
     c = np.zeros(2)
 
-    theta, seed = r8vec_uniform_01(n, seed)
+    if (antithetic):
+        theta, seed = antithetic_uniform(1, n, seed)
+        theta = theta[0]
+    else:
+        theta, seed = r8vec_uniform_01(n, seed)
 
     x = np.zeros([2, n])
-
-    for j in range(0, n):
-        x[0, j] = c[0] + r * np.cos(2.0 * np.pi * theta[j])
-        x[1, j] = c[1] + r * np.sin(2.0 * np.pi * theta[j])
+    x[0, :] = c[0] + r * np.cos(2.0 * np.pi * theta)
+    x[1, :] = c[1] + r * np.sin(2.0 * np.pi * theta)
 
     return x, seed
 
@@ -272,17 +487,75 @@ def triangle01_sample(n, seed):
     #
     #    Output, real XY(2,N), the points.
     #
-    m = 2
-
-    xy = np.zeros([m, n])
-    for j in range(0, n):
-        e, seed = r8vec_uniform_01(m + 1, seed)
-        e = - np.log(e)
-        d = np.sum(e)
-        xy[0:2, j] = e[0:2] / d
+    xy, seed = simplex_unit_sample(2, n, seed)
 
     return xy, seed
 
+
+def simplex_unit_sample(m, n, seed):
+
+    #
+    # SIMPLEX_UNIT_SAMPLE samples the unit simplex in M dimensions.
+    #
+    #  Discussion:
+    #
+    #    The unit simplex is 0 <= X(I), sum ( X(I) ) <= 1.  Each point
+    #    takes M + 1 uniforms U, and with E = - log ( U ),
+    #    X = E(1:M) / sum ( E ).
+    #
+    #  Reference:
+    #
+    #    Reuven Rubinstein,
+    #    Monte Carlo Optimization, Simulation, and Sensitivity
+    #    of Queueing Networks,
+    #    Krieger, 1992,
+    #    ISBN: 0894647644,
+    #    LC: QA298.R79.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Output, real X(M,N), the points.
+    #
+    e, seed = r8mat_uniform_01(m + 1, n, seed)
+    e = - np.log(e)
+    x = e[0:m, :] / np.sum(e, axis=0)
+
+    return x, seed
+
+
+def hypersphere01_sample(m, n, seed):
+
+    #
+    # HYPERSPHERE01_SAMPLE samples the surface of the unit hypersphere.
+    #
+    #  Discussion:
+    #
+    #    A vector of M normal values, scaled to unit length, is uniform on
+    #    the sphere.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Output, real X(M,N), the points.
+    #
+    x, seed = r8mat_normal_01(m, n, seed)
+    x = x / np.sqrt(np.sum(x * x, axis=0))
+
+    return x, seed
+
 def triangle02_sample(n, seed):
     m = 3
 
@@ -296,11 +569,18 @@ def triangle02_sample(n, seed):
     return xy, seed
 
 
-def polygon_sample(v, n, seed):
+def polygon_sample(v, n, seed, method="ear"):
 
     #
     # POLYGON_SAMPLE uniformly samples a polygon.
     #
+    #  Discussion:
+    #
+    #    METHOD selects the triangulation.  "ear" uses the ear clipping of
+    #    POLYGON_TRIANGULATE, which is fine for a few hundred vertices.
+    #    "monotone" uses POLYGON_TRIANGULATE_MONOTONE, which is O(NV log NV)
+    #    and should be used for large outlines.
+    #
     #  Parameters:
     #
     #    Input, integer NV, the number of vertices.
@@ -313,6 +593,8 @@ def polygon_sample(v, n, seed):
     #    Input/output, integer SEED, a seed for the random
     #    number generator.
     #
+    #    Input, string METHOD, the triangulation, "ear" or "monotone".
+    #
     #    Output, real S(2,N), the points.
     #
     #
@@ -326,10 +608,19 @@ def polygon_sample(v, n, seed):
         x[j] = v[j, 0]
         y[j] = v[j, 1]
 
+    if (method == "ear"):
+        triangles = polygon_triangulate(nv, x, y)
+    elif (method == "monotone"):
+        triangles = polygon_triangulate_monotone(nv, x, y)
+    else:
+        print('')
+        print('POLYGON_SAMPLE - Fatal error!')
+        print('  Unknown triangulation method "%s".' % (method))
+        exit('POLYGON_SAMPLE - Fatal error!')
+
     #
     #  Determine the areas of each triangle.
     #
-    triangles = polygon_triangulate(nv, x, y)
     area_triangle = np.zeros(nv - 2)
     area_polygon = 0.0
     for i in range(0, nv - 2):
@@ -440,7 +731,6 @@ def ellipsoid_sample(m, n, a, v, r, seed):
     #
     #    Output, real X(M,N), the points.
     #
-    import numpy as np
     #
     #  Get the Cholesky factor U.
     #
@@ -450,24 +740,46 @@ def ellipsoid_sample(m, n, a, v, r, seed):
     #
     y, seed = uniform_in_sphere01_map(m, n, seed)
     #
-    #  Get the points Y that satisfy Y' * Y <= R * R.
+    #  Solve U * X = R * Y, so that X' * A * X = R^2 Y' * Y <= R^2,
+    #  and shift by V.
     #
-    y = r * y
-    #
-    #  Solve U * X = Y.
-    #
-    x = np.zeros([m, n])
-    sol = np.zeros(m)
-    rhs = np.zeros(m)
-
-    for j in range(0, n):
-        rhs[0:m] = y[0:m, j]
-        sol = r8po_sl(m, u, rhs)
-        x[0:m, j] = sol[0:m]
-        #
-        #  X = X + V.
-        #
-    for i in range(0, m):
-        x[i, 0:n] = x[i, 0:n] + v[i]
+    x = np.linalg.solve(u, r * y) + np.reshape(v, [m, 1])
 
     return x, seed
+
+
+def sample_stream(sample, n, seed, chunk=2**20):
+
+    #
+    # SAMPLE_STREAM draws N points from a sampler in chunks.
+    #
+    #  Discussion:
+    #
+    #    SAMPLE is called as X, SEED = SAMPLE ( K, SEED ) with K <= CHUNK,
+    #    and the seed is passed on from one chunk to the next, so only one
+    #    chunk is in memory at a time.  For the samplers that take a fixed
+    #    number of uniforms per point, such as SQUARE01_SAMPLE,
+    #    CUBE01_SAMPLE or BALL01_SAMPLE, the chunks are exactly the
+    #    columns of a single call with N points.
+    #
+    #    Other arguments are bound beforehand, for example
+    #
+    #      sample_stream ( lambda k, s: annulus_sample ( c, r1, r2, k, s ), n, seed )
+    #
+    #  Parameters:
+    #
+    #    Input, function SAMPLE(K,SEED) -> X(M,K), SEED, the sampler.
+    #
+    #    Input, integer N, the number of points.
+    #
+    #    Input, integer SEED, a seed for the random number generator.
+    #
+    #    Input, integer CHUNK, the largest number of points per chunk.
+    #
+    #    Output, real X(M,K), one chunk per iteration.
+    #
+    while (0 < n):
+        k = min(n, chunk)
+        x, seed = sample(k, seed)
+        n = n - k
+        yield x
@@ -0,0 +1,437 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+import heapq
+from functools import lru_cache
+from itertools import product
+from math import pi
+
+sys.path.append(os.path.join('../'))
+
+#
+#  Nodes are merged through their position J / 2^LEVEL on a dyadic grid
+#  of 2^KEY_BITS cells, so that nested rules share them exactly.
+#
+KEY_BITS = 30
+
+
+@lru_cache(maxsize=None)
+def clenshaw_curtis_nested(level):
+
+    #
+    # CLENSHAW_CURTIS_NESTED is a nested Clenshaw-Curtis rule on [0,1].
+    #
+    #  Discussion:
+    #
+    #    Level 0 is the midpoint rule, and level L >= 1 has N = 2^L + 1
+    #    points
+    #
+    #      X(J) = ( 1 - cos ( PI * J / ( N - 1 ) ) ) / 2,  0 <= J < N,
+    #
+    #    and is exact for polynomials of degree N - 1.  Each level contains
+    #    the points of the one before.
+    #
+    #  Parameters:
+    #
+    #    Input, integer LEVEL, the level.
+    #
+    #    Output, real X(N), W(N), the rule.
+    #
+    #    Output, integer KEY(N), the dyadic positions of the points.
+    #
+    if (level == 0):
+        x = np.array([0.5])
+        w = np.array([1.0])
+        key = np.array([1 << (KEY_BITS - 1)], dtype=np.int64)
+        return x, w, key
+
+    n = (1 << level) + 1
+    j = np.arange(n)
+    theta = pi * j / (n - 1)
+    x = 0.5 * (1.0 - np.cos(theta))
+    x[(n - 1) // 2] = 0.5
+
+    k = np.arange(1, (n - 1) // 2 + 1)
+    b = np.full(k.shape[0], 2.0)
+    b[-1] = 1.0
+    w = 1.0 - np.sum(b[None, :] / (4.0 * k * k - 1.0)[None, :]
+                     * np.cos(2.0 * np.outer(theta, k)), axis=1)
+    w = w * 2.0 / (n - 1)
+    w[0] = 0.5 * w[0]
+    w[-1] = 0.5 * w[-1]
+    w = 0.5 * w
+
+    key = j.astype(np.int64) << (KEY_BITS - level)
+
+    return x, w, key
+
+
+@lru_cache(maxsize=None)
+def clenshaw_curtis_difference(level):
+
+    #
+    # CLENSHAW_CURTIS_DIFFERENCE is the difference of two nested levels.
+    #
+    #  Discussion:
+    #
+    #    The rule Q(LEVEL) - Q(LEVEL-1), on the points of Q(LEVEL), with
+    #    Q(-1) = 0.  It integrates to zero every polynomial that
+    #    Q(LEVEL-1) integrates exactly.
+    #
+    #  Parameters:
+    #
+    #    Input, integer LEVEL, the level.
+    #
+    #    Output, real X(N), D(N), the points and the weight differences.
+    #
+    #    Output, integer KEY(N), the dyadic positions of the points.
+    #
+    x, w, key = clenshaw_curtis_nested(level)
+    d = w.copy()
+
+    if (0 < level):
+        xo, wo, ko = clenshaw_curtis_nested(level - 1)
+        d[np.searchsorted(key, ko)] -= wo
+
+    return x, d, key
+
+
+def sparse_difference_rule(k):
+
+    #
+    # SPARSE_DIFFERENCE_RULE is the tensor product of difference rules.
+    #
+    #  Discussion:
+    #
+    #    For the multi-index K, the rule
+    #
+    #      DELTA(K) = ( Q(K1) - Q(K1-1) ) x ... x ( Q(KM) - Q(KM-1) ).
+    #
+    #    A Smolyak rule is the sum of DELTA(K) over a downward closed set
+    #    of multi-indices.
+    #
+    #  Parameters:
+    #
+    #    Input, integer K(M), the multi-index.
+    #
+    #    Output, real X(M,P), W(P), the points and weights.
+    #
+    #    Output, integer KEY(M,P), the dyadic positions of the points.
+    #
+    rules = [clenshaw_curtis_difference(int(ki)) for ki in k]
+
+    x = np.array(list(product(*[r[0] for r in rules]))).T
+    w = np.prod(np.array(list(product(*[r[1] for r in rules]))), axis=1)
+    key = np.array(list(product(*[r[2] for r in rules]))).T
+
+    return x, w, key
+
+
+def sparse_grid_indices(m, level):
+
+    #
+    # SPARSE_GRID_INDICES lists the multi-indices of a Smolyak rule.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer LEVEL, the level.
+    #
+    #    Output, integer K(P,M), the indices with sum ( K ) <= LEVEL.
+    #
+    k = [np.zeros(m, dtype=np.int64)]
+    frontier = [np.zeros(m, dtype=np.int64)]
+
+    for total in range(1, level + 1):
+        seen = set()
+        new = []
+        for old in frontier:
+            for i in range(0, m):
+                ki = old.copy()
+                ki[i] += 1
+                t = tuple(ki)
+                if (t not in seen):
+                    seen.add(t)
+                    new.append(ki)
+        k.extend(new)
+        frontier = new
+
+    return np.array(k)
+
+
+def sparse_grid_merge(x, w, key):
+
+    #
+    # SPARSE_GRID_MERGE adds the weights of repeated points.
+    #
+    #  Parameters:
+    #
+    #    Input, real X(M,P), W(P), the points and weights.
+    #
+    #    Input, integer KEY(M,P), the dyadic positions of the points.
+    #
+    #    Output, real X(M,Q), W(Q), the distinct points with nonzero weight.
+    #
+    key_u, first, inverse = np.unique(key, axis=1, return_index=True,
+                                      return_inverse=True)
+    inverse = inverse.ravel()
+    w_u = np.bincount(inverse, weights=w, minlength=key_u.shape[1])
+    x_u = x[:, first]
+    keep = (w_u != 0.0)
+
+    return x_u[:, keep], w_u[keep]
+
+
+def sparse_grid_cache_dir(cache_dir=None):
+
+    #
+    # SPARSE_GRID_CACHE_DIR returns the directory of the cached rules.
+    #
+    #  Discussion:
+    #
+    #    By default $RND_UNIFORM_CACHE, or ~/.cache/rnd_uniform.
+    #
+    if (cache_dir is None):
+        cache_dir = os.environ.get('RND_UNIFORM_CACHE',
+                                   os.path.join(os.path.expanduser('~'),
+                                                '.cache', 'rnd_uniform'))
+
+    return cache_dir
+
+
+@lru_cache(maxsize=None)
+def sparse_grid_rule_cached(m, level, cache_dir):
+
+    #
+    # SPARSE_GRID_RULE_CACHED returns a Smolyak rule from the caches.
+    #
+    #  Discussion:
+    #
+    #    The memory cache is keyed by ( M, LEVEL, CACHE_DIR ), so M and
+    #    LEVEL must be plain integers and CACHE_DIR an already resolved
+    #    path, as SPARSE_GRID_RULE passes them.
+    #
+    #    On disk, each rule is the file CACHE_DIR/sparse_cc_mMMM_lLL.npz,
+    #    with M and LEVEL written in 3 and 2 digits, holding the arrays
+    #    X(M,P) and W(P).  A missing file is computed and written under a
+    #    private name, then renamed into place.  A directory that cannot
+    #    be written only loses the disk cache.
+    #
+    #    The arrays returned are read only, since they are shared by
+    #    every caller.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer LEVEL, the level.
+    #
+    #    Input, string CACHE_DIR, the directory of the cache.
+    #
+    #    Output, real X(M,P), W(P), the rule.
+    #
+    filename = os.path.join(cache_dir,
+                            'sparse_cc_m%03d_l%02d.npz' % (m, level))
+
+    if (os.path.isfile(filename)):
+        data = np.load(filename)
+        x, w = data['x'], data['w']
+    else:
+        xs = []
+        ws = []
+        keys = []
+        for k in sparse_grid_indices(m, level):
+            xk, wk, keyk = sparse_difference_rule(k)
+            xs.append(xk)
+            ws.append(wk)
+            keys.append(keyk)
+        x, w = sparse_grid_merge(np.hstack(xs), np.concatenate(ws),
+                                 np.hstack(keys))
+        #
+        #  Write to a private name first, so that a reader never sees
+        #  half a file.
+        #
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmpname = filename + '.%d.tmp.npz' % (os.getpid())
+            np.savez(tmpname, x=x, w=w)
+            os.replace(tmpname, filename)
+        except OSError:
+            pass
+
+    x = np.ascontiguousarray(x)
+    w = np.ascontiguousarray(w)
+    x.setflags(write=False)
+    w.setflags(write=False)
+
+    return x, w
+
+
+def sparse_grid_rule(m, level, cache_dir=None):
+
+    #
+    # SPARSE_GRID_RULE is the Smolyak Clenshaw-Curtis rule for the unit hypercube.
+    #
+    #  Discussion:
+    #
+    #    The rule is the sum of the tensor difference rules DELTA(K) with
+    #    sum ( K ) <= LEVEL, merged on their shared points.  It is exact
+    #    for polynomials of total degree 2 LEVEL + 1, with about
+    #    2^LEVEL M^LEVEL / LEVEL! points instead of the ( 2^LEVEL + 1 )^M
+    #    of the full tensor rule.
+    #
+    #    Rules are kept in memory and, as X and W, in the file
+    #    sparse_cc_mMMM_lLL.npz of CACHE_DIR, and are read only.
+    #
+    #  Reference:
+    #
+    #    Sergey Smolyak,
+    #    Quadrature and interpolation formulas for tensor products of
+    #    certain classes of functions,
+    #    Doklady Akademii Nauk SSSR,
+    #    Volume 4, 1963, pages 240-243.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, integer LEVEL, the level.
+    #
+    #    Input, string CACHE_DIR, optional, the directory of the cache.
+    #
+    #    Output, real X(M,P), W(P), the rule.
+    #
+    return sparse_grid_rule_cached(int(m), int(level),
+                                   sparse_grid_cache_dir(cache_dir))
+
+
+def sparse_grid_integral(func, m, level, cache_dir=None):
+
+    #
+    # SPARSE_GRID_INTEGRAL applies a Smolyak rule to a function.
+    #
+    #  Parameters:
+    #
+    #    Input, function FUNC(X(M,P)) -> F(P), the integrand.
+    #
+    #    Input, integer M, LEVEL, the dimension and level.
+    #
+    #    Input, string CACHE_DIR, optional, the directory of the cache.
+    #
+    #    Output, real INTEGRAL, the estimate.
+    #
+    x, w = sparse_grid_rule(m, level, cache_dir)
+
+    return np.dot(w, func(x))
+
+
+def sparse_grid_adaptive(func, m, tol, eval_max=100000, level_max=12):
+
+    #
+    # SPARSE_GRID_ADAPTIVE integrates over the unit hypercube with a dimension adaptive sparse grid.
+    #
+    #  Discussion:
+    #
+    #    The rule grows one multi-index K at a time.  Its contribution
+    #    DELTA(K) F is the error indicator: the active index with the
+    #    largest | DELTA(K) F | is accepted, and its forward neighbours
+    #    K + E(I) whose backward neighbours are all accepted become active.
+    #    Directions in which F is smooth or constant so stop early, and
+    #    the grid is refined where the contributions are large.
+    #
+    #    The sum of | DELTA(K) F | over the active indices is the error
+    #    estimate; refinement stops once it is below TOL, or when
+    #    EVAL_MAX evaluations have been spent.
+    #
+    #    Only the points that are new to the grid are evaluated, in one
+    #    call to FUNC per index.
+    #
+    #  Reference:
+    #
+    #    Thomas Gerstner, Michael Griebel,
+    #    Dimension-adaptive tensor-product quadrature,
+    #    Computing,
+    #    Volume 71, Number 1, 2003, pages 65-87.
+    #
+    #  Parameters:
+    #
+    #    Input, function FUNC(X(M,P)) -> F(P), the integrand.
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input, real TOL, the wanted absolute error.
+    #
+    #    Input, integer EVAL_MAX, the most evaluations of FUNC.
+    #
+    #    Input, integer LEVEL_MAX, the highest level in any direction.
+    #
+    #    Output, real INTEGRAL, the estimate.
+    #
+    #    Output, real ERROR, the error estimate.
+    #
+    #    Output, dict INFO, with the number of evaluations EVAL_NUM and the
+    #    accepted indices OLD(P,M).
+    #
+    value = {}
+    eval_num = 0
+
+    def delta(k):
+        nonlocal eval_num
+        x, w, key = sparse_difference_rule(k)
+        rows = [tuple(r) for r in key.T.tolist()]
+        new = [j for j, r in enumerate(rows) if r not in value]
+        if (0 < len(new)):
+            fx = func(x[:, new])
+            for j, f in zip(new, fx):
+                value[rows[j]] = f
+            eval_num = eval_num + len(new)
+        return np.dot(w, np.array([value[r] for r in rows]))
+
+    k0 = (0,) * m
+    d0 = delta(k0)
+    integral = d0
+    old = set()
+    active = {k0: d0}
+    heap = [(- abs(d0), k0)]
+
+    while (0 < len(heap)):
+
+        error = sum(abs(d) for d in active.values())
+        if (error <= tol or eval_max <= eval_num):
+            break
+
+        dummy, k = heapq.heappop(heap)
+        del active[k]
+        old.add(k)
+
+        for i in range(0, m):
+            if (level_max <= k[i]):
+                continue
+            kn = k[0:i] + (k[i] + 1,) + k[i + 1:]
+            admissible = True
+            for j in range(0, m):
+                if (0 < kn[j]):
+                    kb = kn[0:j] + (kn[j] - 1,) + kn[j + 1:]
+                    if (kb not in old):
+                        admissible = False
+                        break
+            if (admissible):
+                d = delta(kn)
+                integral = integral + d
+                active[kn] = d
+                heapq.heappush(heap, (- abs(d), kn))
+
+    error = sum(abs(d) for d in active.values())
+
+    info = {
+        'eval_num': eval_num,
+        'old': np.array(sorted(old), dtype=np.int64).reshape(-1, m),
+    }
+
+    return integral, error, info
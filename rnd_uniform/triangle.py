@@ -5,7 +5,6 @@
 #
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
 import os
 import time
@@ -245,6 +244,212 @@ def intersect(xa, ya, xb, yb, xc, yc, xd, yd):
     return value
 
 
+def angle_degree_array(x1, y1, x2, y2, x3, y3):
+
+    #
+    # ANGLE_DEGREE_ARRAY is ANGLE_DEGREE for arrays of points.
+    #
+    #  Parameters:
+    #
+    #    Input, real X1(*), Y1(*), X2(*), Y2(*), X3(*), Y3(*), the
+    #    coordinates of the points P1, P2, P3.  The arrays broadcast.
+    #
+    #    Output, real VALUE(*), the angles in degrees, 0 <= VALUE < 360.
+    #
+    x = (x3 - x2) * (x1 - x2) + (y3 - y2) * (y1 - y2)
+    y = (x3 - x2) * (y1 - y2) - (y3 - y2) * (x1 - x2)
+
+    value = np.arctan2(y, x)
+    value = np.where(value < 0.0, value + 2.0 * np.pi, value)
+    value = np.where((x == 0.0) & (y == 0.0), 0.0, 180.0 * value / np.pi)
+    return value
+
+
+def collinear_array(xa, ya, xb, yb, xc, yc):
+
+    #
+    # COLLINEAR_ARRAY is COLLINEAR for arrays of points.
+    #
+    #  Parameters:
+    #
+    #    Input, real XA(*), YA(*), XB(*), YB(*), XC(*), YC(*), the
+    #    coordinates of the vertices.  The arrays broadcast.
+    #
+    #    Output, logical VALUE(*), is TRUE if the points are judged
+    #    to be collinear.
+    #
+    r8_eps = 2.220446049250313E-016
+
+    area = triangle_area(xa, ya, xb, yb, xc, yc)
+
+    side_max_sq = np.maximum(
+        (xa - xb) ** 2 + (ya - yb) ** 2,
+        np.maximum((xb - xc) ** 2 + (yb - yc) ** 2,
+                   (xc - xa) ** 2 + (yc - ya) ** 2))
+
+    value = (side_max_sq <= r8_eps) | (2.0 * np.abs(area) <= r8_eps * side_max_sq)
+    return value
+
+
+def between_array(xa, ya, xb, yb, xc, yc):
+
+    #
+    # BETWEEN_ARRAY is BETWEEN for arrays of points.
+    #
+    #  Parameters:
+    #
+    #    Input, real XA(*), YA(*), XB(*), YB(*), XC(*), YC(*), the
+    #    coordinates of the vertices.  The arrays broadcast.
+    #
+    #    Output, logical VALUE(*), is TRUE if C is between A and B.
+    #
+    in_x = (np.minimum(xa, xb) <= xc) & (xc <= np.maximum(xa, xb))
+    in_y = (np.minimum(ya, yb) <= yc) & (yc <= np.maximum(ya, yb))
+
+    value = collinear_array(xa, ya, xb, yb, xc, yc) & \
+        np.where(np.abs(ya - yb) < np.abs(xa - xb), in_x, in_y)
+    return value
+
+
+def intersect_prop_array(xa, ya, xb, yb, xc, yc, xd, yd):
+
+    #
+    # INTERSECT_PROP_ARRAY is INTERSECT_PROP for arrays of segments.
+    #
+    #  Parameters:
+    #
+    #    Input, real XA(*), YA(*), XB(*), YB(*), XC(*), YC(*), XD(*), YD(*),
+    #    the X and Y coordinates of the four vertices.  The arrays broadcast.
+    #
+    #    Output, logical VALUE(*), the result of the test.
+    #
+    degenerate = collinear_array(xa, ya, xb, yb, xc, yc) | \
+        collinear_array(xa, ya, xb, yb, xd, yd) | \
+        collinear_array(xc, yc, xd, yd, xa, ya) | \
+        collinear_array(xc, yc, xd, yd, xb, yb)
+
+    t1 = (0.0 < triangle_area(xa, ya, xb, yb, xc, yc))
+    t2 = (0.0 < triangle_area(xa, ya, xb, yb, xd, yd))
+    t3 = (0.0 < triangle_area(xc, yc, xd, yd, xa, ya))
+    t4 = (0.0 < triangle_area(xc, yc, xd, yd, xb, yb))
+
+    value = (~degenerate) & (t1 ^ t2) & (t3 ^ t4)
+    return value
+
+
+def intersect_array(xa, ya, xb, yb, xc, yc, xd, yd):
+
+    #
+    # INTERSECT_ARRAY is INTERSECT for arrays of segments.
+    #
+    #  Parameters:
+    #
+    #    Input, real XA(*), YA(*), XB(*), YB(*), XC(*), YC(*), XD(*), YD(*),
+    #    the X and Y coordinates of the four vertices.  The arrays broadcast.
+    #
+    #    Output, logical VALUE(*), the value of the test.
+    #
+    value = intersect_prop_array(xa, ya, xb, yb, xc, yc, xd, yd) | \
+        between_array(xa, ya, xb, yb, xc, yc) | \
+        between_array(xa, ya, xb, yb, xd, yd) | \
+        between_array(xc, yc, xd, yd, xa, ya) | \
+        between_array(xc, yc, xd, yd, xb, yb)
+    return value
+
+
+def polygon_contains_points(n, x, y, p, next_node=None, bucket_num=None):
+
+    #
+    # POLYGON_CONTAINS_POINTS tests which points lie inside a polygon.
+    #
+    #  Discussion:
+    #
+    #    The crossing number test counts the edges crossed by a ray from
+    #    each point in the +X direction; the point is inside when the
+    #    count is odd.  With NEXT_NODE describing several rings this is
+    #    the even-odd rule, so holes and separate parts are handled too.
+    #
+    #    The edges are sorted into BUCKET_NUM horizontal slabs, and each
+    #    point is only tested against the edges of its own slab.  The
+    #    (point, edge) pairs are formed in vectorized chunks, so there is
+    #    no Python loop over points or slabs.
+    #
+    #  Parameters:
+    #
+    #    Input, integer N, the number of vertices.
+    #
+    #    Input, real X(N), Y(N), the vertex coordinates.
+    #
+    #    Input, real P(2,NP), the points to test.
+    #
+    #    Input, integer NEXT_NODE(N), optional, the next vertex on the ring
+    #    of each vertex.  The default is a single ring 0, 1, ..., N-1.
+    #
+    #    Input, integer BUCKET_NUM, optional, the number of slabs.
+    #    The default is N.
+    #
+    #    Output, logical INSIDE(NP), is TRUE for the points inside.
+    #
+    if (next_node is None):
+        next_node = np.roll(np.arange(n), -1)
+    if (bucket_num is None):
+        bucket_num = n
+
+    xa = np.asarray(x[0:n], dtype=np.float64)
+    ya = np.asarray(y[0:n], dtype=np.float64)
+    xb = xa[next_node]
+    yb = ya[next_node]
+    px = np.asarray(p[0], dtype=np.float64)
+    py = np.asarray(p[1], dtype=np.float64)
+
+    ymin = np.min(ya)
+    ymax = np.max(ya)
+    h = max(ymax - ymin, np.finfo(float).tiny) / bucket_num
+    #
+    #  Slab lists of the edges: edge E covers slabs S0(E) to S1(E).
+    #
+    s0 = np.minimum(((np.minimum(ya, yb) - ymin) / h).astype(np.int64),
+                    bucket_num - 1)
+    s1 = np.minimum(((np.maximum(ya, yb) - ymin) / h).astype(np.int64),
+                    bucket_num - 1)
+    span = s1 - s0 + 1
+    edge = np.repeat(np.arange(n), span)
+    slab = np.repeat(s0 - np.cumsum(span) + span, span) + np.arange(np.sum(span))
+    order = np.argsort(slab, kind='stable')
+    edge = edge[order]
+    count = np.bincount(slab, minlength=bucket_num)
+    start = np.cumsum(count) - count
+
+    inside = np.zeros(px.shape[0], dtype=bool)
+    candidate = np.flatnonzero((ymin <= py) & (py <= ymax)
+                               & (px <= np.maximum(np.max(xa), np.max(xb))))
+    if (candidate.shape[0] == 0):
+        return inside
+
+    ps = np.minimum(((py[candidate] - ymin) / h).astype(np.int64), bucket_num - 1)
+    pairs = count[ps]
+    chunk = 2**22
+    i = 0
+    while (i < candidate.shape[0]):
+        #
+        #  Take as many points as fit in CHUNK pairs, and at least one.
+        #
+        j = i + max(1, int(np.searchsorted(np.cumsum(pairs[i:]), chunk)))
+        c = candidate[i:j]
+        k = pairs[i:j]
+        local = np.repeat(np.arange(j - i), k)
+        offset = np.arange(np.sum(k)) - np.repeat(np.cumsum(k) - k, k)
+        e = edge[start[ps[i:j]][local] + offset]
+        qx = px[c][local]
+        qy = py[c][local]
+        cross = ((ya[e] > qy) != (yb[e] > qy)) & \
+            (qx < xa[e] + (qy - ya[e]) * (xb[e] - xa[e]) / (yb[e] - ya[e] + (yb[e] == ya[e])))
+        inside[c] = (np.bincount(local, weights=cross, minlength=j - i) % 2) == 1
+        i = j
+
+    return inside
+
+
 def diagonalie(im1, ip1, n, next_node, x, y):
 
     #
@@ -576,3 +781,329 @@ def polygon_triangulate(n, x, y):
     triangle_num = triangle_num + 1
 
     return triangles
+
+
+def polygon_triangulate_monotone(n, x, y, next_node=None):
+
+    #
+    # POLYGON_TRIANGULATE_MONOTONE triangulates a polygon by monotone pieces.
+    #
+    #  Discussion:
+    #
+    #    This is an alternative to POLYGON_TRIANGULATE for polygons with
+    #    many vertices.  The output has the same form: N-2 triangles, each
+    #    listed counterclockwise.
+    #
+    #    A plane sweep from top to bottom adds the diagonals that split
+    #    the polygon into Y-monotone pieces, and each piece is then
+    #    triangulated in linear time with a stack.  The cost is
+    #    O(N log N), where the diagonal-based POLYGON_TRIANGULATE is
+    #    O(N^2) to O(N^3).
+    #
+    #    Ties in Y are broken by X, so horizontal edges need no special care.
+    #
+    #    NEXT_NODE may describe several rings at once: outer boundaries
+    #    listed counterclockwise and holes listed clockwise, so that the
+    #    interior always lies to the left.  The sweep connects each hole
+    #    to the rest of its region, and a region with NV vertices, H holes
+    #    and P parts yields NV + 2 H - 2 P triangles.
+    #
+    #  Reference:
+    #
+    #    Mark de Berg, Otfried Cheong, Marc van Kreveld, Mark Overmars,
+    #    Computational Geometry: Algorithms and Applications,
+    #    Third Edition,
+    #    Springer, 2008,
+    #    ISBN: 9783540779735,
+    #    Chapter 3.
+    #
+    #  Parameters:
+    #
+    #    Input, int N, the number of vertices.
+    #
+    #    Input, real X[N], Y[N], the coordinates of each vertex,
+    #    listed in counterclockwise order.
+    #
+    #    Input, int NEXT_NODE[N], optional, the next vertex on the ring of
+    #    each vertex.  The default is a single ring 0, 1, ..., N-1.
+    #
+    #    Output, int TRIANGLES[NT,3], the triangles.  NT = N-2 for a
+    #    single ring.
+    #
+    if (n < 3):
+        print('')
+        print('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+        print('  N < 3')
+        exit('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+
+    if (next_node is None):
+        next_node = np.roll(np.arange(n), -1)
+    next_node = np.asarray(next_node, dtype=np.int64)
+    prev_node = np.empty(n, dtype=np.int64)
+    prev_node[next_node] = np.arange(n)
+
+    xv = np.asarray(x[0:n], dtype=np.float64)
+    yv = np.asarray(y[0:n], dtype=np.float64)
+    xp = xv[prev_node]
+    yp = yv[prev_node]
+    #
+    #  Consecutive vertices cannot be equal.
+    #
+    if (np.any((xp == xv) & (yp == yv))):
+        print('')
+        print('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+        print('  Two consecutive nodes are identical.')
+        exit('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+    #
+    #  Area must be positive.
+    #
+    area = 0.5 * np.sum(xp * yv - xv * yp)
+
+    if (area <= 0.0):
+        print('')
+        print('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+        print('  Polygon has zero or negative area.')
+        exit('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+    #
+    #  RANK orders the vertices from top to bottom.  Vertex I is above
+    #  vertex J if RANK[I] < RANK[J].
+    #
+    order = np.lexsort((xv, -yv))
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+
+    xn = xv[next_node]
+    yn = yv[next_node]
+    reflex = ((xv - xp) * (yn - yv) - (yv - yp) * (xn - xv)) < 0.0
+    prev_below = rank[prev_node] > rank
+    next_below = rank[next_node] > rank
+    #
+    #  Vertex types: 0 regular, 1 start, 2 split, 3 end, 4 merge.
+    #
+    kind = np.zeros(n, dtype=np.int64)
+    kind[prev_below & next_below & ~reflex] = 1
+    kind[prev_below & next_below & reflex] = 2
+    kind[~prev_below & ~next_below & ~reflex] = 3
+    kind[~prev_below & ~next_below & reflex] = 4
+
+    x = xv.tolist()
+    y = yv.tolist()
+    kind = kind.tolist()
+    prev_below = prev_below.tolist()
+    prev_node = prev_node.tolist()
+    next_node = next_node.tolist()
+
+    def x_at(e, yy):
+        #
+        #  X coordinate of edge E = V(E):V(NEXT_NODE(E)) on the sweep line Y = YY.
+        #
+        xa, ya = x[e], y[e]
+        f = next_node[e]
+        xb, yb = x[f], y[f]
+        if (ya == yb):
+            return min(xa, xb)
+        return xa + (yy - ya) * (xb - xa) / (yb - ya)
+
+    def locate(xx, yy):
+        #
+        #  Number of status edges lying to the left of the point (XX,YY).
+        #
+        lo = 0
+        hi = len(status)
+        while (lo < hi):
+            mid = (lo + hi) // 2
+            if (x_at(status[mid], yy) < xx):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def crossing():
+        print('')
+        print('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+        print('  The rings are not simple, or they cross.')
+        exit('POLYGON_TRIANGULATE_MONOTONE - Fatal error!')
+
+    def remove(e, yy):
+        k = locate(x_at(e, yy), yy)
+        if (k < len(status) and status[k] == e):
+            del status[k]
+        elif (e in status):
+            status.remove(e)
+        else:
+            crossing()
+
+    def left_of(xx, yy):
+        #
+        #  The status edge directly to the left of the point (XX,YY).
+        #
+        k = locate(xx, yy)
+        if (k == 0):
+            crossing()
+        return k, status[k - 1]
+    #
+    #  STATUS holds the edges with the interior of the polygon on their
+    #  right, sorted by their X coordinate on the sweep line.
+    #
+    status = []
+    helper = [0] * n
+    diagonals = []
+
+    for i in order.tolist():
+        xi, yi = x[i], y[i]
+        im1 = prev_node[i]
+        t = kind[i]
+        if (t == 1):
+            status.insert(locate(xi, yi), i)
+            helper[i] = i
+        elif (t == 3):
+            if (kind[helper[im1]] == 4):
+                diagonals.append((i, helper[im1]))
+            remove(im1, yi)
+        elif (t == 2):
+            k, j = left_of(xi, yi)
+            diagonals.append((i, helper[j]))
+            helper[j] = i
+            status.insert(k, i)
+            helper[i] = i
+        elif (t == 4):
+            if (kind[helper[im1]] == 4):
+                diagonals.append((i, helper[im1]))
+            remove(im1, yi)
+            k, j = left_of(xi, yi)
+            if (kind[helper[j]] == 4):
+                diagonals.append((i, helper[j]))
+            helper[j] = i
+        elif (not prev_below[i]):
+            #
+            #  Regular vertex with the interior to its right.
+            #
+            if (kind[helper[im1]] == 4):
+                diagonals.append((i, helper[im1]))
+            remove(im1, yi)
+            status.insert(locate(xi, yi), i)
+            helper[i] = i
+        else:
+            k, j = left_of(xi, yi)
+            if (kind[helper[j]] == 4):
+                diagonals.append((i, helper[j]))
+            helper[j] = i
+    #
+    #  Split the polygon along the diagonals.  Walking a piece with the
+    #  interior on the left, the edge that follows U:V leaves V as the
+    #  first edge clockwise from V:U.
+    #
+    out = [[next_node[i]] for i in range(0, n)]
+    for (i, j) in diagonals:
+        out[i].append(j)
+        out[j].append(i)
+
+    def follow(u, v):
+        nbr = out[v]
+        if (len(nbr) == 1):
+            return nbr[0]
+        back = np.arctan2(y[u] - y[v], x[u] - x[v])
+        best = None
+        for w in nbr:
+            if (w == u):
+                continue
+            a = np.arctan2(y[w] - y[v], x[w] - x[v])
+            d = (back - a) % (2.0 * np.pi)
+            if (best is None or d < best[0]):
+                best = (d, w)
+        return best[1]
+
+    pieces = []
+    used = set()
+    for (a, b) in [(i, next_node[i]) for i in range(0, n)] + \
+            diagonals + [(j, i) for (i, j) in diagonals]:
+        if ((a, b) in used):
+            continue
+        piece = [a]
+        u, v = a, b
+        while ((u, v) not in used):
+            used.add((u, v))
+            if (v == a):
+                break
+            piece.append(v)
+            u, v = v, follow(u, v)
+        pieces.append(piece)
+
+    triangles = []
+
+    for piece in pieces:
+        #
+        #  Label each vertex by chain: walking counterclockwise from the
+        #  top, the left chain runs down to the bottom vertex.
+        #
+        m = len(piece)
+        top = min(range(0, m), key=lambda k: rank[piece[k]])
+        bot = max(range(0, m), key=lambda k: rank[piece[k]])
+        left = {}
+        k = top
+        while (True):
+            left[piece[k]] = True
+            if (k == bot):
+                break
+            k = (k + 1) % m
+        u = sorted(piece, key=lambda v: rank[v])
+
+        stack = [u[0], u[1]]
+        for j in range(2, m - 1):
+            uj = u[j]
+            if (left.get(uj, False) != left.get(stack[-1], False)):
+                while (1 < len(stack)):
+                    a = stack.pop()
+                    triangles.append((uj, a, stack[-1]))
+                stack = [u[j - 1], uj]
+            else:
+                on_left = left.get(uj, False)
+                last = stack.pop()
+                while (stack):
+                    q = stack[-1]
+                    o = (x[last] - x[q]) * (y[uj] - y[q]) \
+                        - (y[last] - y[q]) * (x[uj] - x[q])
+                    if ((0.0 < o) if on_left else (o < 0.0)):
+                        triangles.append((uj, last, q))
+                        last = stack.pop()
+                    else:
+                        break
+                stack.append(last)
+                stack.append(uj)
+        uj = u[m - 1]
+        while (1 < len(stack)):
+            a = stack.pop()
+            triangles.append((uj, a, stack[-1]))
+    #
+    #  A region with H holes and P parts has N + 2 H - 2 P triangles, and
+    #  their areas add up to the area of the region.  Anything else means
+    #  that the rings were not simple or crossed each other.
+    #
+    ring = np.full(n, -1, dtype=np.int64)
+    ring_num = 0
+    for i in range(0, n):
+        j = i
+        while (ring[j] < 0):
+            ring[j] = ring_num
+            j = next_node[j]
+        if (ring[i] == ring_num):
+            ring_num = ring_num + 1
+    ring_area = np.bincount(ring, weights=xp * yv - xv * yp,
+                            minlength=ring_num)
+    hole_num = int(np.sum(ring_area < 0.0))
+    part_num = ring_num - hole_num
+
+    t = np.array(triangles, dtype=np.int32).reshape(-1, 3)
+    o = (xv[t[:, 1]] - xv[t[:, 0]]) * (yv[t[:, 2]] - yv[t[:, 0]]) \
+        - (xv[t[:, 2]] - xv[t[:, 0]]) * (yv[t[:, 1]] - yv[t[:, 0]])
+
+    if (t.shape[0] != n + 2 * hole_num - 2 * part_num or
+            1.0E-8 * np.sum(np.abs(o)) < abs(0.5 * np.sum(np.abs(o)) - area)):
+        crossing()
+    #
+    #  List every triangle counterclockwise.
+    #
+    t[o < 0.0, 1:3] = t[o < 0.0, 2:0:-1]
+    triangles = t
+
+    return triangles
@@ -219,12 +219,34 @@ def r8vec_normal_01(n, seed):
     #
     #    Output, integer SEED, an updated seed for the random number generator.
     #
-    x = np.zeros(n)
-    for i in range(0, n):
-        x[i], seed = r8_normal_01(seed)
+    #
+    #  Each value uses two consecutive uniforms, as R8_NORMAL_01 does.
+    #
+    u, seed = r8vec_uniform_01(2 * n, seed)
+    x = np.sqrt(- 2.0 * np.log(u[0::2])) * np.cos(2.0 * np.pi * u[1::2])
     return x, seed
 
 
+def r8mat_normal_01(m, n, seed):
+
+    #
+    # R8MAT_NORMAL_01 returns a unit pseudonormal R8MAT.
+    #
+    #  Parameters:
+    #
+    #    Input, integer M, N, the number of rows and columns in the array.
+    #
+    #    Input, integer SEED, a seed for the random number generator.
+    #
+    #    Output, real R(M,N), the array of pseudonormal values.
+    #
+    #    Output, integer SEED, an updated seed for the random number generator.
+    #
+    r, seed = r8vec_normal_01(m * n, seed)
+    r = r.reshape(n, m).T.copy()
+    return r, seed
+
+
 def r8_uniform_01(seed):
 
     #
@@ -370,18 +392,11 @@ def r8mat_uniform_01(m, n, seed):
         print('R8MAT_UNIFORM_01 - Fatal error!')
         print('  Input SEED = 0!')
         exit('R8MAT_UNIFORM_01 - Fatal error!')
-
-    r = np.zeros((m, n))
-    for j in range(0, n):
-        for i in range(0, m):
-            k = (seed // 127773)
-            seed = 16807 * (seed - k * 127773) - k * 2836
-            seed = (seed % i4_huge)
-
-            if (seed < 0):
-                seed = seed + i4_huge
-
-            r[i, j] = seed * 4.656612875E-10
+    #
+    #  The matrix is filled column by column from one stream.
+    #
+    r, seed = r8vec_uniform_01(m * n, seed)
+    r = r.reshape(n, m).T.copy()
     return r, seed
 
 
@@ -460,16 +475,27 @@ def r8vec_uniform_01(n, seed):
         print('  Input SEED = 0!')
         exit('R8VEC_UNIFORM_01 - Fatal error!')
 
-    x = np.zeros(n)
-
-    for i in range(0, n):
-        k = (seed // 127773)
-        seed = 16807 * (seed - k * 127773) - k * 2836
+    #
+    #  The stream is generated in one pass: SEED(I) = A^I * SEED mod I4_HUGE,
+    #  with the powers of A built by repeated doubling.  The products stay
+    #  below 2^62, and the values are the same as those of the recursion.
+    #
+    n = int(n)
+    if (n <= 0):
+        return np.zeros(0), seed
 
-        if (seed < 0):
-            seed = seed + i4_huge
+    seed = seed % i4_huge
+    power = np.empty(n, dtype=np.int64)
+    power[0] = 16807
+    k = 1
+    while (k < n):
+        m = min(k, n - k)
+        power[k:k + m] = (power[k - 1] * power[0:m]) % i4_huge
+        k = k + m
 
-        x[i] = seed * 4.656612875E-10
+    s = (power * seed) % i4_huge
+    x = s * 4.656612875E-10
+    seed = int(s[-1])
     return x, seed
 
 
@@ -485,6 +511,10 @@ def uniform_in_sphere01_map(m, n, seed):
     #    We first generate a point ON the sphere, and then distribute it
     #    IN the sphere.
     #
+    #    Each point takes the 2 M uniforms of R8VEC_NORMAL_01 and then one
+    #    more for its radius, so all N points come from one block of the
+    #    stream.
+    #
     #  Reference:
     #
     #    Russell Cheng,
@@ -509,25 +539,17 @@ def uniform_in_sphere01_map(m, n, seed):
     #    Output, real X(M,N), the points.
     #
     exponent = 1.0 / float(m)
-    x = np.zeros([m, n])
-    for j in range(0, n):
-        #
-        #  Fill a vector with normally distributed values.
-        #
-        v, seed = r8vec_normal_01(m, seed)
-        #
-        #  Compute the length of the vector.
-        #
-        norm = np.linalg.norm(v)
-        #
-        #  Normalize the vector.
-        #
-        v[0:m] = v[0:m] / norm
-        #
-        #  Now compute a value to map the point ON the sphere INTO the sphere.
-        #
-        r, seed = r8_uniform_01(seed)
-
-        x[0:m, j] = r ** exponent * v[0:m]
+    u, seed = r8vec_uniform_01(n * (2 * m + 1), seed)
+    u = u.reshape(n, 2 * m + 1)
+    #
+    #  Normal values, as in R8VEC_NORMAL_01, normalized onto the sphere.
+    #
+    v = np.sqrt(- 2.0 * np.log(u[:, 0:2 * m:2])) \
+        * np.cos(2.0 * np.pi * u[:, 1:2 * m:2])
+    v = v / np.sqrt(np.sum(v * v, axis=1))[:, None]
+    #
+    #  Now map the point ON the sphere INTO the sphere.
+    #
+    x = (u[:, 2 * m][:, None] ** exponent * v).T.copy()
 
     return x, seed
@@ -0,0 +1,223 @@
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.uniform import r8mat_uniform_01
+
+
+def vegas_map(edge, u):
+
+    #
+    # VEGAS_MAP maps uniform points through a VEGAS grid.
+    #
+    #  Discussion:
+    #
+    #    Coordinate I of U falls in bin B = floor ( U * BIN_NUM ) and is
+    #    placed at the same fraction of the B-th interval of EDGE(I,:).
+    #    Every bin so gets the same share of points, and the Jacobian of
+    #    the map is prod ( BIN_NUM * width of the bin ).
+    #
+    #  Parameters:
+    #
+    #    Input, real EDGE(M,BIN_NUM+1), the grid, from 0 to 1 in each row.
+    #
+    #    Input, real U(M,N), uniform points.
+    #
+    #    Output, real X(M,N), the mapped points.
+    #
+    #    Output, real JAC(N), the Jacobian.
+    #
+    #    Output, integer BIN(M,N), the bin of each coordinate.
+    #
+    m, bin_num = edge.shape[0], edge.shape[1] - 1
+    t = u * bin_num
+    b = np.minimum(t.astype(np.int64), bin_num - 1)
+    frac = t - b
+    row = np.arange(m)[:, None]
+    width = edge[row, b + 1] - edge[row, b]
+    x = edge[row, b] + frac * width
+    jac = np.prod(bin_num * width, axis=0)
+
+    return x, jac, b
+
+
+def vegas_refine(edge, d, alpha):
+
+    #
+    # VEGAS_REFINE moves the grid so that each bin holds the same weight.
+    #
+    #  Discussion:
+    #
+    #    D(I,B) is the sum of | F * JAC | over the points whose coordinate
+    #    I fell in bin B.  It is smoothed over neighbours, normalized, and
+    #    damped by the usual VEGAS compression
+    #
+    #      R = ( ( 1 - D ) / log ( 1 / D ) )^ALPHA,
+    #
+    #    and the new edges split the cumulative R into equal parts.
+    #
+    #  Parameters:
+    #
+    #    Input, real EDGE(M,BIN_NUM+1), the grid.
+    #
+    #    Input, real D(M,BIN_NUM), the accumulated weights.
+    #
+    #    Input, real ALPHA, the damping, from 0 (no change) to about 2.
+    #
+    #    Output, real EDGE(M,BIN_NUM+1), the new grid.
+    #
+    m, bin_num = d.shape
+    new = np.empty_like(edge)
+
+    for i in range(0, m):
+        di = d[i, :]
+        if (np.sum(di) <= 0.0):
+            new[i, :] = edge[i, :]
+            continue
+        smooth = di.copy()
+        smooth[1:-1] = (di[0:-2] + di[1:-1] + di[2:]) / 3.0
+        smooth[0] = (di[0] + di[1]) / 2.0
+        smooth[-1] = (di[-2] + di[-1]) / 2.0
+        smooth = smooth / np.sum(smooth)
+
+        r = np.zeros(bin_num)
+        pos = (0.0 < smooth) & (smooth < 1.0)
+        r[pos] = ((1.0 - smooth[pos]) / np.log(1.0 / smooth[pos])) ** alpha
+        r[smooth >= 1.0] = 1.0
+        if (np.sum(r) <= 0.0):
+            new[i, :] = edge[i, :]
+            continue
+        #
+        #  The weight grows linearly across each old bin, so the new edges
+        #  are found by interpolating the cumulative weight.
+        #
+        cumulative = np.concatenate(([0.0], np.cumsum(r)))
+        target = np.linspace(0.0, cumulative[-1], bin_num + 1)
+        new[i, :] = np.interp(target, cumulative, edge[i, :])
+        new[i, 0] = 0.0
+        new[i, -1] = 1.0
+
+    return new
+
+
+def vegas_integral(func, m, seed, iter_num=10, n=100000, bin_num=50,
+                   alpha=1.5, warmup=1, chunk=2**18):
+
+    #
+    # VEGAS_INTEGRAL adaptively integrates a function over the unit hypercube.
+    #
+    #  Discussion:
+    #
+    #    VEGAS samples through a separable map of the hypercube, one grid
+    #    per coordinate.  After each iteration of N points, the grid is
+    #    refined so that its bins concentrate where | F * JAC | was large,
+    #    which moves the sampling density towards | F |.  Weighting by
+    #    | F * JAC | rather than its square keeps a few lucky points of the
+    #    first iterations from pulling the grid, which matters in high
+    #    dimension.  Localized peaks in 5 to 20 dimensions are found this
+    #    way, as long as they are roughly aligned with the axes.
+    #
+    #    The first WARMUP iterations only shape the grid.  The others are
+    #    combined by their inverse variances,
+    #
+    #      INTEGRAL = sum ( I(K) / S(K)^2 ) / sum ( 1 / S(K)^2 ),
+    #      ERROR    = 1 / sqrt ( sum ( 1 / S(K)^2 ) ),
+    #
+    #    and CHI2_DOF = sum ( ( I(K) - INTEGRAL )^2 / S(K)^2 ) / ( K - 1 )
+    #    checks that they agree.  A value much above 1 means the grid was
+    #    still changing or the errors are underestimated.
+    #
+    #  Reference:
+    #
+    #    Peter Lepage,
+    #    A new algorithm for adaptive multidimensional integration,
+    #    Journal of Computational Physics,
+    #    Volume 27, Number 2, 1978, pages 192-203.
+    #
+    #  Parameters:
+    #
+    #    Input, function FUNC(X(M,K)) -> F(K), the integrand.
+    #
+    #    Input, integer M, the spatial dimension.
+    #
+    #    Input/output, integer SEED, a seed for the random
+    #    number generator.
+    #
+    #    Input, integer ITER_NUM, the number of iterations.
+    #
+    #    Input, integer N, the points per iteration.
+    #
+    #    Input, integer BIN_NUM, the bins per coordinate.
+    #
+    #    Input, real ALPHA, the grid damping.
+    #
+    #    Input, integer WARMUP, the iterations that only adapt the grid,
+    #    fewer than ITER_NUM.
+    #
+    #    Input, integer CHUNK, the points evaluated at once.
+    #
+    #    Output, real INTEGRAL, the combined estimate.
+    #
+    #    Output, real ERROR, its standard error.
+    #
+    #    Output, real CHI2_DOF, the chi-square per degree of freedom.
+    #
+    #    Output, real EDGE(M,BIN_NUM+1), the final grid.
+    #
+    #    Output, integer SEED, the updated seed.
+    #
+    if (iter_num <= warmup):
+        print('')
+        print('VEGAS_INTEGRAL - Fatal error!')
+        print('  WARMUP = %d leaves none of the ITER_NUM = %d iterations.'
+              % (warmup, iter_num))
+        exit('VEGAS_INTEGRAL - Fatal error!')
+
+    edge = np.tile(np.linspace(0.0, 1.0, bin_num + 1), (m, 1))
+    estimate = []
+    variance = []
+
+    for it in range(0, iter_num):
+        s1 = 0.0
+        s2 = 0.0
+        d = np.zeros([m, bin_num])
+
+        for j0 in range(0, n, chunk):
+            k = min(chunk, n - j0)
+            u, seed = r8mat_uniform_01(m, k, seed)
+            x, jac, b = vegas_map(edge, u)
+            g = func(x) * jac
+            s1 = s1 + np.sum(g)
+            s2 = s2 + np.sum(g * g)
+            weight = np.abs(g)
+            for i in range(0, m):
+                d[i, :] += np.bincount(b[i], weights=weight,
+                                       minlength=bin_num)
+
+        mean = s1 / n
+        var = max(s2 / n - mean * mean, 0.0) / (n - 1)
+
+        if (warmup <= it):
+            estimate.append(mean)
+            variance.append(var)
+
+        edge = vegas_refine(edge, d, alpha)
+
+    estimate = np.array(estimate)
+    variance = np.maximum(np.array(variance), 1.0E-300)
+    w = 1.0 / variance
+    integral = np.sum(w * estimate) / np.sum(w)
+    error = 1.0 / np.sqrt(np.sum(w))
+    if (1 < estimate.shape[0]):
+        chi2_dof = np.sum(w * (estimate - integral) ** 2) \
+            / (estimate.shape[0] - 1)
+    else:
+        chi2_dof = 0.0
+
+    return integral, error, chi2_dof, edge, seed
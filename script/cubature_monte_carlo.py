@@ -0,0 +1,79 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.cubature import cubature_rule, cubature_integral
+from rnd_uniform.sample import hypercube01_sample, annulus_sample, ball01_sample
+
+
+def cubature_monte_carlo_test():
+
+    #
+    # CUBATURE_MONTE_CARLO_TEST compares cubature rules with Monte Carlo.
+    #
+    #  Discussion:
+    #
+    #    The integrand is exp ( x + y + z ), whose integrals over the unit
+    #    square and cube are ( e - 1 )^M.  Over the disk and ball the
+    #    reference value is the degree 30 rule.
+    #
+    print('')
+    print('CUBATURE_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Cached cubature rules against 65536 random samples.')
+    print('')
+    print('  Domain      Degree  Points     Cubature error   MC error    Seconds')
+    print('')
+
+    def f(x):
+        return np.exp(np.sum(x, axis=0))
+
+    n = 65536
+    seed = 123456789
+
+    cases = [
+        ('square01', (np.e - 1.0) ** 2, 1.0,
+         lambda n, seed: hypercube01_sample(2, n, seed)),
+        ('cube01', (np.e - 1.0) ** 3, 1.0,
+         lambda n, seed: hypercube01_sample(3, n, seed)),
+        ('disk01', cubature_integral(f, 'disk01', 30), np.pi,
+         lambda n, seed: annulus_sample([0.0, 0.0], 0.0, 1.0, n, seed)),
+        ('ball01', cubature_integral(f, 'ball01', 30), 4.0 * np.pi / 3.0,
+         lambda n, seed: ball01_sample(n, seed)),
+    ]
+
+    for domain, exact, volume, sample in cases:
+        x, seed = sample(n, seed)
+        mc = volume * np.mean(f(x))
+        for degree in [3, 7, 11]:
+            t0 = time.perf_counter()
+            q = cubature_integral(f, domain, degree)
+            t0 = time.perf_counter() - t0
+            k = cubature_rule(domain, degree)[1].shape[0]
+            print('  %-10s  %6d  %6d  %17.2e  %9.2e  %9.2e' %
+                  (domain, degree, k, abs(q - exact), abs(mc - exact), t0))
+
+    print('')
+    print('CUBATURE_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    cubature_monte_carlo_test()
+    timestamp()
@@ -0,0 +1,97 @@
+#! /usr/bin/env python3
+#
+import sys
+import os
+import subprocess
+import platform
+
+
+def import_time_bench():
+
+    #
+    # IMPORT_TIME_BENCH times the import of each module in a fresh interpreter.
+    #
+    #  Discussion:
+    #
+    #    Each module is imported REPEAT times in a new Python process, as a
+    #    pool worker or a command line call would, and the best time is
+    #    reported with the heavy packages that the import pulled in.  The
+    #    sampling and estimation modules of RND_UNIFORM should load NumPy
+    #    only.
+    #
+    repeat = 5
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+    modules = [
+        'numpy',
+        'rnd_uniform.uniform',
+        'rnd_uniform.sample',
+        'rnd_uniform.monomial',
+        'rnd_uniform.polygon',
+        'rnd_uniform.design',
+        'rnd_uniform.domain',
+        'rnd_uniform.polytope',
+        'rnd_uniform.cubature',
+        'rnd_uniform.sparse',
+        'rnd_uniform.vegas',
+        'base',
+    ]
+
+    heavy = ['matplotlib', 'scipy', 'mpl_toolkits']
+
+    code = \
+        'import time, sys\n' \
+        't0 = time.perf_counter()\n' \
+        'import %s\n' \
+        't0 = time.perf_counter() - t0\n' \
+        'print(t0, " ".join(p for p in %r if p in sys.modules))\n'
+
+    print('')
+    print('IMPORT_TIME_BENCH')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Best of %d imports in a fresh interpreter.' % (repeat))
+    print('')
+    print('  Module                     Seconds  Heavy packages loaded')
+    print('')
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = root + os.pathsep + env.get('PYTHONPATH', '')
+    env['MPLBACKEND'] = 'Agg'
+
+    for module in modules:
+        best = None
+        loaded = ''
+        for r in range(0, repeat):
+            out = subprocess.run([sys.executable, '-c', code % (module, heavy)],
+                                 cwd=root, env=env, capture_output=True,
+                                 text=True)
+            if (out.returncode != 0):
+                loaded = 'import failed'
+                break
+            t, loaded = (out.stdout.strip() + ' ').split(' ', 1)
+            if (best is None or float(t) < best):
+                best = float(t)
+        if (best is None):
+            print('  %-24s  %8s  %s' % (module, '-', loaded))
+        else:
+            print('  %-24s  %8.3f  %s' % (module, best, loaded.strip()))
+
+    print('')
+    print('IMPORT_TIME_BENCH')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    import_time_bench()
+    timestamp()
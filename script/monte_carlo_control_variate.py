@@ -0,0 +1,86 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.sample import ball01_sample, pyramid01_sample, wedge01_sample
+from rnd_uniform.monomial import monomial_exponents, ball01_monomial_integral, \
+    pyramid01_integral, wedge01_monomial_integral
+from rnd_uniform.control import control_variate_integral
+
+
+def control_variate_monte_carlo_test():
+
+    #
+    # CONTROL_VARIATE_MONTE_CARLO_TEST compares plain and control variate estimates.
+    #
+    #  Discussion:
+    #
+    #    The integrand f(x,y,z) = exp ( 0.7 x - 0.3 y + 0.2 z ) / ( 1 + x^2 )
+    #    is integrated over the unit ball, pyramid and wedge, with the
+    #    monomials of degree 1 to DEGREE as control variates.
+    #
+    #    The RMS spread of REP_NUM runs is shown for both estimates, with
+    #    the mean reported error of the control variate one.
+    #
+    print('')
+    print('CONTROL_VARIATE_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Monomial control variates with exactly known integrals.')
+    print('')
+    print('  Domain    Degree      N      Plain spread   CV spread    CV error')
+    print('')
+
+    def f(x):
+        return np.exp(0.7 * x[0] - 0.3 * x[1] + 0.2 * x[2]) / (1.0 + x[0] ** 2)
+
+    domain = [
+        ('ball', ball01_sample, ball01_monomial_integral, 4.0 * np.pi / 3.0),
+        ('pyramid', pyramid01_sample, pyramid01_integral, 4.0 / 3.0),
+        ('wedge', wedge01_sample, wedge01_monomial_integral, 1.0),
+    ]
+
+    seed = 123456789
+    rep_num = 20
+    n = 4096
+
+    for name, sample, integral, volume in domain:
+        for degree in [1, 2, 4]:
+            e = monomial_exponents(3, degree)
+            exact = np.array([integral(row) for row in e])
+            plain = np.zeros(rep_num)
+            cv = np.zeros(rep_num)
+            error = np.zeros(rep_num)
+            for r in range(0, rep_num):
+                x, seed = sample(n, seed)
+                fx = f(x)
+                plain[r] = volume * np.mean(fx)
+                cv[r], error[r], beta = control_variate_integral(
+                    fx, x, e, exact, volume)
+            print('  %-8s  %6d  %6d  %14.2e  %10.2e  %10.2e' %
+                  (name, degree, n, np.std(plain), np.std(cv),
+                   np.sqrt(np.mean(error ** 2))))
+
+    print('')
+    print('CONTROL_VARIATE_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    control_variate_monte_carlo_test()
+    timestamp()
@@ -0,0 +1,129 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from base import plot3d
+from convex_simplex import ConvexHullDomain
+from rnd_uniform.domain import domain_get
+from rnd_uniform.monomial import monomial_value
+from rnd_uniform.uniform import r8mat_uniform_01
+
+
+def convex_hull_monte_carlo_test():
+
+    #
+    # CONVEX_HULL_MONTE_CARLO_TEST estimates integrals over a convex hull.
+    #
+    #  Discussion:
+    #
+    #    The point cloud is the 8 corners of the unit cube and 200 random
+    #    points inside it, so its convex hull is the unit cube, and the
+    #    hull volume and the monomial integrals are known exactly.
+    #
+    m = 3
+
+    e_test = np.array([
+        [0, 0, 0],
+        [0, 0, 1],
+        [2, 0, 0],
+        [1, 1, 0],
+        [0, 1, 1],
+        [0, 0, 2],
+        [2, 2, 0],
+        [0, 0, 4]])
+
+    print('')
+    print('CONVEX_HULL_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Use ConvexHullDomain to estimate integrals over the convex')
+    print('  hull of a point cloud whose hull is the unit cube in 3D.')
+
+    seed = 123456789
+    corner = np.array([[i, j, k] for i in (0.0, 1.0)
+                       for j in (0.0, 1.0) for k in (0.0, 1.0)])
+    inner, seed = r8mat_uniform_01(m, 200, seed)
+    hull = ConvexHullDomain(np.concatenate((corner, inner.T)))
+    cube = domain_get('cube01')
+
+    print('')
+    print('  Hull volume %14.6g, exact %14.6g' % (hull.volume, cube.measure))
+
+    obj = plot3d()
+    obj.create_tempdir(-1)
+
+    print('')
+    txt = "\tN"
+    for e in e_test:
+        txt += "\t\tX^{:d} Y^{:d} Z^{:d}".format(*e)
+    print(txt)
+    print('')
+
+    n = 1
+    while (n <= 65536):
+        x, seed = hull.sample(n, seed)
+        print('  %8d' % (n), end='')
+        for e in e_test:
+            value = monomial_value(n, m, e, x.T)
+            result = hull.volume * np.sum(value[0:n]) / float(n)
+            print('  %14.6g' % (result), end='')
+        print('')
+
+        obj.scatter_frame(x, "n={:d}".format(n))
+
+        n = 2 * n
+
+    print('')
+    print('     Exact', end='')
+    for result in cube.exact_monomial_integrals(e_test):
+        print('  %14.6g' % (result), end='')
+    print('')
+    #
+    #  All samples lie in the hull, and points of a larger box lie in
+    #  it in proportion to their volumes.
+    #
+    x, seed = r8mat_uniform_01(m, 65536, seed)
+    x = 2.0 * x - 0.5
+    print('')
+    print('  Samples inside the hull:      %s' % (hull.contains(
+        hull.sample(65536, seed)[0]).all()))
+    print('  Fraction of [-0.5,1.5]^3 inside: %10.6f, exact %10.6f'
+          % (np.mean(hull.contains(x)), cube.measure / 8.0))
+
+    return
+
+
+def convex_hull_monte_carlo_test_main():
+
+    #
+    # CONVEX_HULL_MONTE_CARLO_TEST_MAIN tests ConvexHullDomain.
+    #
+    print('')
+    print('CONVEX_HULL_MONTE_CARLO_TEST_MAIN')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Test ConvexHullDomain.')
+    convex_hull_monte_carlo_test()
+    #
+    #  Terminate.
+    #
+    print('')
+    print('CONVEX_HULL_MONTE_CARLO_TEST_MAIN:')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    convex_hull_monte_carlo_test_main()
+    timestamp()
@@ -0,0 +1,91 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+from optparse import OptionParser
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.sample import square01_sample, ball01_sample, annulus_sample
+from rnd_uniform.sample import sample_stream
+from base import plot2d, density_count, set_headless
+
+
+def monte_carlo_density_test(obj, n, chunk):
+
+    #
+    # MONTE_CARLO_DENSITY_TEST plots the uniformity of large samples.
+    #
+    #  Discussion:
+    #
+    #    Each sampler is streamed in chunks of CHUNK points into a
+    #    512 x 512 density image per coordinate plane, so N = 10^8 takes
+    #    seconds and little memory, where a scatter plot would not finish.
+    #    For a uniform sample the image is flat, up to a relative noise of
+    #    about 1 / sqrt ( N / 512^2 ) per bin.
+    #
+    print('')
+    print('MONTE_CARLO_DENSITY_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Density images of N = %d sampled points.' % (n))
+    print('')
+    print('  Domain        Time (s)   Bin mean   Bin rel. std')
+    print('')
+
+    seed = 123456789
+
+    tests = [
+        ('square01', square01_sample, [0.0, 1.0, 0.0, 1.0]),
+        ('annulus', lambda k, s: annulus_sample([0.0, 0.0], 0.5, 1.0, k, s),
+         [-1.0, 1.0, -1.0, 1.0]),
+        ('ball01', ball01_sample, [-1.0, 1.0, -1.0, 1.0, -1.0, 1.0]),
+    ]
+
+    for name, sample, lim in tests:
+        t0 = time.time()
+        pngname = obj.tmpdir + name + ".png"
+        obj.density_frame(sample_stream(sample, n, seed, chunk),
+                          "{} n={:d}".format(name, n), pngname, lim)
+        t1 = time.time() - t0
+
+        if (name == 'square01'):
+            c, lim, planes, m = density_count(
+                sample_stream(sample, n, seed, chunk), lim)
+            c = c[0]
+            print('  %-10s  %9.2f  %9.2f  %13.4f' %
+                  (name, t1, np.mean(c), np.std(c) / np.mean(c)))
+        else:
+            print('  %-10s  %9.2f' % (name, t1))
+
+    print('')
+    print('MONTE_CARLO_DENSITY_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    parser = OptionParser()
+    parser.add_option("--n", dest="n", type="int", default=10**7,
+                      help="number of points, 10^8 is fine")
+    parser.add_option("--chunk", dest="chunk", type="int", default=2**20)
+    parser.add_option("--headless", dest="headless", action="store_true",
+                      default=False)
+    opt, argc = parser.parse_args()
+    if opt.headless:
+        set_headless()
+
+    timestamp()
+    obj = plot2d()
+    obj.create_tempdir(-1)
+    monte_carlo_density_test(obj, opt.n, opt.chunk)
+    timestamp()
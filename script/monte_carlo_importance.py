@@ -0,0 +1,76 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.importance import hyperball01_radial_proposal, importance_integral
+
+
+def importance_monte_carlo_test():
+
+    #
+    # IMPORTANCE_MONTE_CARLO_TEST uses radial proposals for peaked integrands.
+    #
+    #  Discussion:
+    #
+    #    In the unit disk, f = r^(-3/2) is nearly singular at the center,
+    #    with integral 4 PI.  Plain sampling (ALPHA = 2) has infinite
+    #    variance, and ALPHA = 1/2 makes f / q constant.
+    #
+    #    In the unit ball, f = exp ( 30 ( r - 1 ) ) sits at the surface,
+    #    with integral 4 PI ( 1/30 - 2/30^2 + 2/30^3 - 2 exp(-30)/30^3 ).
+    #
+    print('')
+    print('IMPORTANCE_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Radial power law proposals R = U^(1/ALPHA).')
+
+    c = 30.0
+    test = [
+        ('disk', 2, lambda x: np.sum(x * x, axis=0) ** (-0.75),
+         4.0 * np.pi, [2.0, 1.0, 0.5]),
+        ('ball', 3, lambda x: np.exp(c * (np.sqrt(np.sum(x * x, axis=0)) - 1.0)),
+         4.0 * np.pi * (1.0 / c - 2.0 / c ** 2 + 2.0 / c ** 3
+                        - 2.0 * np.exp(- c) / c ** 3), [3.0, 10.0, 30.0]),
+    ]
+
+    seed = 123456789
+    n = 100000
+
+    for name, m, f, exact, alphas in test:
+        print('')
+        print('  %s, exact integral %g, N = %d' % (name, exact, n))
+        print('')
+        print('   ALPHA      Estimate     Error   |Est-Exact|       ESS    W_MAX')
+        print('')
+        for alpha in alphas:
+            proposal = hyperball01_radial_proposal(m, alpha)
+            integral, error, diagnostic, seed = importance_integral(
+                f, proposal, n, seed)
+            print('  %6.2f  %12.6g  %8.2e  %12.2e  %8.0f  %7.1e' %
+                  (alpha, integral, error, abs(integral - exact),
+                   diagnostic['ess'], diagnostic['w_max']))
+
+    print('')
+    print('IMPORTANCE_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    importance_monte_carlo_test()
+    timestamp()
@@ -0,0 +1,86 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.sample import hypercube01_sample, pyramid01_sample
+from rnd_uniform.design import latin_hypercube
+
+
+def lhs_monte_carlo_test():
+
+    #
+    # LHS_MONTE_CARLO_TEST compares plain and Latin hypercube samples.
+    #
+    #  Discussion:
+    #
+    #    The integrand f(x) = sum ( exp ( x(i) ) ) + x(1) x(2) is nearly
+    #    additive, with integral M ( e - 1 ) + 1/4 over the unit hypercube.
+    #
+    #    The same Latin hypercube is also pushed through PYRAMID01_SAMPLE,
+    #    where the integral of z is 1/3 over a pyramid of volume 4/3.
+    #
+    print('')
+    print('LHS_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  RMS errors over %d runs of plain, LHS and orthogonal LHS.' % (20))
+    print('')
+    print('   M       N       Plain         LHS   Orthogonal')
+    print('')
+
+    seed = 123456789
+    rep_num = 20
+    p = 53
+    n = p * p
+
+    for m in [10, 30, 50]:
+        exact = m * (np.e - 1.0) + 0.25
+        error = np.zeros([3, rep_num])
+        for r in range(0, rep_num):
+            for k, lhs in enumerate([False, True, 'orthogonal']):
+                x, seed = hypercube01_sample(m, n, seed, lhs=lhs)
+                f = np.sum(np.exp(x), axis=0) + x[0, :] * x[1, :]
+                error[k, r] = np.mean(f) - exact
+        rms = np.sqrt(np.mean(error ** 2, axis=1))
+        print('  %2d  %6d  %10.2e  %10.2e  %11.2e' %
+              (m, n, rms[0], rms[1], rms[2]))
+
+    print('')
+    print('  Pyramid, integral of z:')
+    print('')
+    print('        N       Plain         LHS')
+    print('')
+    n = 10000
+    error = np.zeros([2, rep_num])
+    for r in range(0, rep_num):
+        x, seed = pyramid01_sample(n, seed)
+        error[0, r] = 4.0 / 3.0 * np.mean(x[2, :]) - 1.0 / 3.0
+        u, seed = latin_hypercube(3, n, seed)
+        x, seed = pyramid01_sample(n, seed, u)
+        error[1, r] = 4.0 / 3.0 * np.mean(x[2, :]) - 1.0 / 3.0
+    rms = np.sqrt(np.mean(error ** 2, axis=1))
+    print('  %7d  %10.2e  %10.2e' % (n, rms[0], rms[1]))
+
+    print('')
+    print('LHS_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    lhs_monte_carlo_test()
+    timestamp()
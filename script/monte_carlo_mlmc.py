@@ -0,0 +1,88 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.sample import square01_sample
+from rnd_uniform.mlmc import mlmc_integral
+
+
+def mlmc_monte_carlo_test():
+
+    #
+    # MLMC_MONTE_CARLO_TEST applies multilevel Monte Carlo to a quadrature integrand.
+    #
+    #  Discussion:
+    #
+    #    The integrand over the unit square is
+    #
+    #      F(X,Y) = integral ( 0 <= T <= 1 ) exp ( T ( X + Y ) ) dT,
+    #
+    #    and at level L it is approximated by the trapezoid rule with 2^(L+1)
+    #    panels, at a cost of 2^L.  Its exact integral is
+    #
+    #      integral ( 0 <= S <= 2 ) ( exp ( S ) - 1 ) / S * min ( S, 2 - S ) dS.
+    #
+    #    The MLMC cost is compared with that of plain Monte Carlo on the
+    #    finest level used, with the same variance.
+    #
+    print('')
+    print('MLMC_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Multilevel Monte Carlo with trapezoid rule levels.')
+
+    def f(x, level):
+        k = 2 ** (level + 1)
+        t = np.linspace(0.0, 1.0, k + 1)
+        w = np.full(k + 1, 1.0 / k)
+        w[0] = 0.5 / k
+        w[k] = 0.5 / k
+        return w @ np.exp(np.outer(t, x[0, :] + x[1, :]))
+
+    s = np.linspace(0.0, 2.0, 200001)[1:]
+    g = np.expm1(s) / s * np.minimum(s, 2.0 - s)
+    exact = np.sum(0.5 * (g[1:] + g[:-1]) * np.diff(s)) + 0.5 * g[0] * s[0]
+
+    seed = 123456789
+    print('')
+    print('  Exact integral %.8f' % (exact))
+    print('')
+    print('      RMSE      Estimate     Error   |Est-Exact|  Levels   MLMC cost   MC cost')
+    print('')
+
+    for rmse in [1.0E-02, 3.0E-03, 1.0E-03, 3.0E-04]:
+        integral, error, info, seed = mlmc_integral(
+            f, square01_sample, 1.0, rmse, seed, cost=lambda l: 2.0 ** l)
+        level = info['n'].shape[0] - 1
+        cost = np.sum(info['n'] * info['cost'])
+        #
+        #  var ( F_L ) is close to var ( F_0 ), the level 0 variance.
+        #
+        mc_cost = 2.0 * info['variance'][0] / rmse ** 2 * 2.0 ** level
+        print('  %8.1e  %12.8f  %8.2e  %12.2e  %6d  %10.0f  %8.0f' %
+              (rmse, integral, error, abs(integral - exact), level, cost,
+               mc_cost))
+
+    print('')
+    print('MLMC_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    mlmc_monte_carlo_test()
+    timestamp()
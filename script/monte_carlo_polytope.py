@@ -0,0 +1,88 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+from math import factorial
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.polytope import polytope_sample
+
+
+def polytope_monte_carlo_test():
+
+    #
+    # POLYTOPE_MONTE_CARLO_TEST estimates integrals over a polytope by hit-and-run.
+    #
+    #  Discussion:
+    #
+    #    The polytope is the unit simplex in M = 20 dimensions,
+    #    x >= 0, sum ( x ) <= 1, written as A x <= b.  A box of side 1
+    #    around it would accept one point in 20! ~ 2.4E+18.
+    #
+    #    The exact integral of x^e is prod ( e(i)! ) / ( M + sum ( e ) )!.
+    #
+    m = 20
+    a = np.vstack([-np.eye(m), np.ones([1, m])])
+    b = np.zeros(m + 1)
+    b[m] = 1.0
+    volume = 1.0 / factorial(m)
+
+    e_test = np.array([
+        [0] * m,
+        [1] + [0] * (m - 1),
+        [2] + [0] * (m - 1),
+        [1, 1] + [0] * (m - 2),
+        [1, 1, 1, 1] + [0] * (m - 4),
+        [3, 0, 2] + [0] * (m - 3)])
+
+    print('')
+    print('POLYTOPE_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Use POLYTOPE_SAMPLE to estimate integrals of monomials')
+    print('  over the unit simplex in %d dimensions.' % (m))
+
+    seed = 123456789
+
+    for method in ['hit_and_run', 'coordinate']:
+        print('')
+        print('  Method "%s", thinned every %d steps.' % (method, m))
+        print('')
+        print('         N   min ESS     Seconds   Relative error of each monomial')
+        print('')
+        n = 2**10
+        while (n <= 2**16):
+            t0 = time.time()
+            x, ess, seed = polytope_sample(a, b, n, seed, method=method,
+                                           thin=m)
+            t0 = time.time() - t0
+            line = '  %8d  %8.0f  %10.3f' % (n, np.min(ess), t0)
+            for e in e_test:
+                exact = np.prod([factorial(k) for k in e]) \
+                    / factorial(m + int(np.sum(e)))
+                result = volume * np.mean(np.prod(x ** e[:, None], axis=0))
+                line = line + '  %8.1e' % (abs(result - exact) / exact)
+            print(line)
+            n = 4 * n
+
+    print('')
+    print('POLYTOPE_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    polytope_monte_carlo_test()
+    timestamp()
@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+import itertools
+from math import factorial
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.polytope import polytope_volume, polytope_from_hull
+
+
+def polytope_volume_test():
+
+    #
+    # POLYTOPE_VOLUME_TEST estimates polytope volumes by multiphase Monte Carlo.
+    #
+    #  Discussion:
+    #
+    #    The test bodies, in dimension M, with their exact volumes:
+    #
+    #      cube:     0 <= x <= 1,              volume 1;
+    #      simplex:  x >= 0, sum ( x ) <= 1,   volume 1 / M!;
+    #      cross:    sum ( |x| ) <= 1,         volume 2^M / M!,
+    #                given as the hull of its 2*M vertices.
+    #
+    print('')
+    print('POLYTOPE_VOLUME_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  POLYTOPE_VOLUME estimates the volume of { x : A x <= b }')
+    print('  by a chain of nested balls and hit-and-run.')
+    print('')
+    print('  Body       M        Volume         Error      Exact  Seconds')
+    print('')
+
+    seed = 123456789
+
+    for m in [2, 4, 6, 8, 10]:
+        test = []
+
+        a = np.vstack([-np.eye(m), np.eye(m)])
+        b = np.concatenate([np.zeros(m), np.ones(m)])
+        test.append(('cube', a, b, 1.0))
+
+        a = np.vstack([-np.eye(m), np.ones([1, m])])
+        b = np.zeros(m + 1)
+        b[m] = 1.0
+        test.append(('simplex', a, b, 1.0 / factorial(m)))
+
+        if (m <= 6):
+            a, b = polytope_from_hull(np.vstack([np.eye(m), -np.eye(m)]))
+        else:
+            a = np.array(list(itertools.product([-1.0, 1.0], repeat=m)))
+            b = np.ones(a.shape[0])
+        test.append(('cross', a, b, 2.0 ** m / factorial(m)))
+
+        for name, a, b, exact in test:
+            t0 = time.time()
+            volume, volume_error, seed = polytope_volume(a, b, seed)
+            t0 = time.time() - t0
+            print('  %-8s  %2d  %12.6g  %12.2e  %9.4g  %7.2f' %
+                  (name, m, volume, volume_error, exact, t0))
+
+    print('')
+    print('POLYTOPE_VOLUME_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    polytope_volume_test()
+    timestamp()
@@ -0,0 +1,98 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+from math import gamma
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.rejection import rejection_sample
+from rnd_uniform.polygon import multipolygon_contains, multipolygon_area
+
+
+def rejection_monte_carlo_test():
+
+    #
+    # REJECTION_MONTE_CARLO_TEST samples regions given by membership tests.
+    #
+    #  Discussion:
+    #
+    #    Each region is sampled with REJECTION_SAMPLE from its bounding box,
+    #    and the hit-or-miss volume is compared with the exact one.
+    #
+    #      lens:    intersection of two unit balls with centers 1 apart,
+    #               volume pi (4 r + d) (2 r - d)^2 / 12.
+    #      super:   superellipsoid |x|^4 + |y|^4 + |z|^4 <= 1,
+    #               volume 8 Gamma(1+1/4)^3 / Gamma(1+3/4).
+    #      holes:   a square of side 4 with two square holes.
+    #
+    print('')
+    print('REJECTION_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Use REJECTION_SAMPLE to sample regions given by a')
+    print('  vectorized membership test, and estimate their volume.')
+
+    def square(c, h):
+        return np.array([
+            [c[0] - h, c[1] - h],
+            [c[0] + h, c[1] - h],
+            [c[0] + h, c[1] + h],
+            [c[0] - h, c[1] + h]])
+
+    parts = [[square([0.0, 0.0], 2.0), square([-1.0, -1.0], 0.5),
+              square([1.0, 1.0], 0.75)]]
+
+    test = [
+        ('lens', 3,
+         lambda x: (np.sum(x ** 2, axis=0) <= 1.0)
+         & ((x[0] - 1.0) ** 2 + x[1] ** 2 + x[2] ** 2 <= 1.0),
+         [[0.0, 1.0], [-1.0, 1.0], [-1.0, 1.0]],
+         np.pi * 5.0 / 12.0),
+        ('super', 3,
+         lambda x: np.sum(x ** 4, axis=0) <= 1.0,
+         [[-1.0, 1.0], [-1.0, 1.0], [-1.0, 1.0]],
+         8.0 * gamma(1.25) ** 3 / gamma(1.75)),
+        ('holes', 2,
+         lambda x: multipolygon_contains(parts, x),
+         [[-2.0, 2.0], [-2.0, 2.0]],
+         multipolygon_area(parts)),
+    ]
+
+    seed = 123456789
+
+    for name, m, inside, box, exact in test:
+        print('')
+        print('  Region "%s", exact volume %g' % (name, exact))
+        print('')
+        print('         N        Volume         Error     |V-Exact|   Mean |x|^2')
+        print('')
+        n = 2**10
+        while (n <= 2**20):
+            x, volume, volume_error, seed = rejection_sample(
+                m, n, inside, seed, box=box)
+            print('  %8d  %12.6g  %12.2e  %12.2e  %12.6g' %
+                  (n, volume, volume_error, abs(volume - exact),
+                   np.mean(np.sum(x ** 2, axis=0))))
+            n = 4 * n
+
+    print('')
+    print('REJECTION_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    rejection_monte_carlo_test()
+    timestamp()
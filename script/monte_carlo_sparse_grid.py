@@ -0,0 +1,76 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.sample import hypercube01_sample
+from rnd_uniform.sparse import sparse_grid_rule, sparse_grid_integral, \
+    sparse_grid_adaptive
+
+
+def sparse_grid_monte_carlo_test():
+
+    #
+    # SPARSE_GRID_MONTE_CARLO_TEST compares sparse grids with sampling in the hypercube.
+    #
+    #  Discussion:
+    #
+    #    The integrand is the anisotropic exponential
+    #
+    #      F(X) = exp ( sum ( C(I) * X(I) ) ),  C(I) = 2^(-I),
+    #
+    #    whose integral is prod ( ( exp ( C(I) ) - 1 ) / C(I) ).  Monte
+    #    Carlo uses as many points as the Smolyak rule.
+    #
+    print('')
+    print('SPARSE_GRID_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Smolyak Clenshaw-Curtis rules against HYPERCUBE01_SAMPLE.')
+    print('')
+    print('   M  Level  Points   Smolyak error   MC error   Adaptive error  Points')
+    print('')
+
+    seed = 123456789
+
+    for m in [5, 10, 15]:
+
+        c = 0.5 ** np.arange(m)
+
+        def f(x):
+            return np.exp(np.dot(c, x))
+
+        exact = np.prod((np.exp(c) - 1.0) / c)
+
+        for level in [2, 3, 4]:
+            p = sparse_grid_rule(m, level)[1].shape[0]
+            q = sparse_grid_integral(f, m, level)
+            x, seed = hypercube01_sample(m, p, seed)
+            mc = np.mean(f(x))
+            a, a_error, info = sparse_grid_adaptive(f, m, 1.0E-10,
+                                                    eval_max=p)
+            print('  %2d  %5d  %6d  %14.2e  %9.2e  %15.2e  %6d' %
+                  (m, level, p, abs(q - exact), abs(mc - exact),
+                   abs(a - exact), info['eval_num']))
+
+    print('')
+    print('SPARSE_GRID_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    sparse_grid_monte_carlo_test()
+    timestamp()
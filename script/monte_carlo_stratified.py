@@ -0,0 +1,77 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.sample import hypercube01_sample
+from rnd_uniform.design import stratified_estimate
+
+
+def stratified_monte_carlo_test():
+
+    #
+    # STRATIFIED_MONTE_CARLO_TEST compares plain and stratified hypercube samples.
+    #
+    #  Discussion:
+    #
+    #    The integrand is exp ( sum ( x ) / 2 ), whose integral over the
+    #    unit hypercube is ( 2 ( exp ( 1/2 ) - 1 ) )^M.
+    #
+    #    For each case, the estimated error of one run is compared with the
+    #    spread over repeated runs.
+    #
+    print('')
+    print('STRATIFIED_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Compare plain and stratified samples of the unit hypercube.')
+    print('')
+    print('   M  STRATA  SDIM       N    Plain err   Strat err   Strat spread')
+    print('')
+
+    seed = 123456789
+    rep_num = 50
+
+    for m, strata, strata_dim, j in [(2, 32, 2, 4), (3, 8, 3, 4),
+                                     (6, 4, 3, 8), (20, 2, 10, 4)]:
+        n = j * strata ** strata_dim
+        exact = (2.0 * (np.exp(0.5) - 1.0)) ** m
+
+        plain = np.zeros(rep_num)
+        strat = np.zeros(rep_num)
+        error = np.zeros(rep_num)
+        for r in range(0, rep_num):
+            x, seed = hypercube01_sample(m, n, seed)
+            plain[r] = np.mean(np.exp(0.5 * np.sum(x, axis=0)))
+            x, seed = hypercube01_sample(m, n, seed, strata, strata_dim)
+            f = np.exp(0.5 * np.sum(x, axis=0))
+            strat[r], error[r] = stratified_estimate(f, x, strata, strata_dim)
+
+        print('  %2d  %6d  %4d  %6d  %11.2e  %10.2e  %13.2e' %
+              (m, strata, strata_dim, n,
+               np.sqrt(np.mean((plain - exact) ** 2)),
+               np.sqrt(np.mean(error ** 2)),
+               np.sqrt(np.mean((strat - exact) ** 2))))
+
+    print('')
+    print('STRATIFIED_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    stratified_monte_carlo_test()
+    timestamp()
@@ -0,0 +1,85 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+from math import erf
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.sample import hypercube01_sample
+from rnd_uniform.vegas import vegas_integral
+
+
+def vegas_monte_carlo_test():
+
+    #
+    # VEGAS_MONTE_CARLO_TEST compares VEGAS with plain sampling on a peak.
+    #
+    #  Discussion:
+    #
+    #    The integrand is a product of Gaussian peaks of width A at the
+    #    center of the unit hypercube, normalized so that its integral is
+    #    erf ( 1 / ( 2 A ) )^M, essentially 1.
+    #
+    #    Both methods use ITER_NUM * N points.
+    #
+    print('')
+    print('VEGAS_MONTE_CARLO_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Adaptive VEGAS integration of a Gaussian peak.')
+    print('')
+    print('   M     A      Plain     Plain err      VEGAS     VEGAS err  chi2/dof')
+    print('')
+
+    seed = 123456789
+    iter_num = 20
+    n = 50000
+
+    for m, a in [(5, 0.05), (10, 0.1), (20, 0.1)]:
+
+        def f(x):
+            return np.prod(np.exp(- ((x - 0.5) / a) ** 2)
+                           / (a * np.sqrt(np.pi)), axis=0)
+
+        exact = erf(0.5 / a) ** m
+
+        s1 = 0.0
+        s2 = 0.0
+        for it in range(0, iter_num):
+            x, seed = hypercube01_sample(m, n, seed)
+            fx = f(x)
+            s1 = s1 + np.sum(fx)
+            s2 = s2 + np.sum(fx * fx)
+        plain = s1 / (iter_num * n)
+        plain_error = np.sqrt((s2 / (iter_num * n) - plain ** 2)
+                              / (iter_num * n))
+
+        integral, error, chi2_dof, edge, seed = vegas_integral(
+            f, m, seed, iter_num=iter_num, n=n, warmup=iter_num // 2)
+
+        print('  %2d  %4.2f  %9.5f  %10.2e  %9.5f  %10.2e  %8.2f' %
+              (m, a, plain, plain_error, integral, error, chi2_dof))
+
+    print('')
+    print('  The exact integrals are all 1 to within 1.0E-10.')
+    print('')
+    print('VEGAS_MONTE_CARLO_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    vegas_monte_carlo_test()
+    timestamp()
@@ -0,0 +1,117 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.polygon import multipolygon_triangulate, multipolygon_area
+
+
+def star_ring(center, r_min, r_max, k, seed):
+
+    #
+    # STAR_RING returns a random simple ring, star shaped about its center.
+    #
+    #  Discussion:
+    #
+    #    Four evenly spaced angles are always used, so that no angular gap
+    #    reaches PI, and the ring stays simple for any radii.
+    #
+    rng = np.random.default_rng(seed)
+    t = np.concatenate((rng.uniform(0.0, 2.0 * np.pi, k),
+                        0.5 * np.pi * np.arange(4)))
+    t = np.sort(t)
+    r = rng.uniform(r_min, r_max, t.shape[0])
+
+    return np.column_stack((center[0] + r * np.cos(t),
+                            center[1] + r * np.sin(t)))
+
+
+def multipolygon_triangulate_test(case_num=500):
+
+    #
+    # MULTIPOLYGON_TRIANGULATE_TEST checks random regions with holes.
+    #
+    #  Discussion:
+    #
+    #    The outer ring has radius between 8 and 12, and its angular gaps
+    #    are below PI/12, so it contains the disk of radius 7.9.  Holes of
+    #    radius at most 1 sit in separate cells of a 4 by 4 grid of spacing
+    #    2.4 centered at the origin, so the rings never touch or cross.
+    #
+    #    A region with NV vertices and H holes must have NV + 2 H - 2
+    #    triangles, each of positive area, whose areas add up to the area
+    #    of the region.
+    #
+    print('')
+    print('MULTIPOLYGON_TRIANGULATE_TEST')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Triangulate %d random regions with holes.' % (case_num))
+
+    rng = np.random.default_rng(123456789)
+    centers = np.arange(-3.6, 3.61, 2.4)
+    fail_num = 0
+
+    for case in range(0, case_num):
+        k = int(rng.integers(20, 200))
+        t = np.sort(np.concatenate((rng.uniform(0.0, 2.0 * np.pi, k),
+                                    np.linspace(0.0, 2.0 * np.pi, 24,
+                                                endpoint=False))))
+        r = rng.uniform(8.0, 12.0, t.shape[0])
+        rings = [np.column_stack((r * np.cos(t), r * np.sin(t)))]
+
+        for cx in centers:
+            for cy in centers:
+                if (rng.random() < 0.5):
+                    center = (cx + rng.uniform(-0.1, 0.1),
+                              cy + rng.uniform(-0.1, 0.1))
+                    rings.append(star_ring(center, 0.2, 1.0,
+                                           int(rng.integers(0, 12)),
+                                           int(rng.integers(0, 2**31))))
+
+        x, y, triangles = multipolygon_triangulate([rings])
+
+        n = x.shape[0]
+        h = len(rings) - 1
+        xt = x[triangles]
+        yt = y[triangles]
+        area_t = 0.5 * ((xt[:, 1] - xt[:, 0]) * (yt[:, 2] - yt[:, 0])
+                        - (xt[:, 2] - xt[:, 0]) * (yt[:, 1] - yt[:, 0]))
+        area = multipolygon_area([rings])
+
+        if (triangles.shape[0] != n + 2 * h - 2 or np.any(area_t <= 0.0)
+                or 1.0E-10 * area < abs(np.sum(area_t) - area)):
+            fail_num = fail_num + 1
+            print('  Case %d: NV = %d, H = %d, NT = %d, area %g vs %g'
+                  % (case, n, h, triangles.shape[0], np.sum(area_t), area))
+
+    print('')
+    print('  %d failures in %d cases.' % (fail_num, case_num))
+
+    if (0 < fail_num):
+        print('')
+        print('MULTIPOLYGON_TRIANGULATE_TEST - Fatal error!')
+        print('  Some triangulations were wrong.')
+        exit('MULTIPOLYGON_TRIANGULATE_TEST - Fatal error!')
+
+    print('')
+    print('MULTIPOLYGON_TRIANGULATE_TEST')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    multipolygon_triangulate_test()
+    timestamp()
@@ -0,0 +1,85 @@
+#! /usr/bin/env python3
+#
+import numpy as np
+import sys
+import os
+import time
+import platform
+
+sys.path.append(os.path.join('../'))
+from rnd_uniform.triangle import polygon_triangulate, polygon_triangulate_monotone
+
+
+def polygon_triangulate_bench():
+
+    #
+    # POLYGON_TRIANGULATE_BENCH times the polygon triangulations.
+    #
+    #  Discussion:
+    #
+    #    The test polygon is a wavy outline, r = 0.7 + 0.25 sin(9t) + 0.04 cos(97t),
+    #    which has long runs of reflex vertices like a digitized coastline.
+    #
+    #    The ear clipping of POLYGON_TRIANGULATE is only timed up to
+    #    NV_EAR vertices, because it grows like NV^2 to NV^3.
+    #
+    nv_ear = 512
+    nv_max = 2**17
+
+    print('')
+    print('POLYGON_TRIANGULATE_BENCH')
+    print('  Python version: %s' % (platform.python_version()))
+    print('  Compare the run time of POLYGON_TRIANGULATE (ear clipping)')
+    print('  and POLYGON_TRIANGULATE_MONOTONE (monotone pieces).')
+    print('')
+    print('        NV         Ear(s)    Monotone(s)        Area error')
+    print('')
+
+    nv = 64
+    while (nv <= nv_max):
+        t = np.linspace(0.0, 2.0 * np.pi, nv, endpoint=False)
+        r = 0.7 + 0.25 * np.sin(9.0 * t) + 0.04 * np.cos(97.0 * t)
+        x = r * np.cos(t)
+        y = r * np.sin(t)
+        area = 0.5 * np.sum(np.roll(x, 1) * y - x * np.roll(y, 1))
+
+        if (nv <= nv_ear):
+            t0 = time.time()
+            polygon_triangulate(nv, x, y)
+            t_ear = '%14.4f' % (time.time() - t0)
+        else:
+            t_ear = '%14s' % ('-')
+
+        t0 = time.time()
+        triangles = polygon_triangulate_monotone(nv, x, y)
+        t_mon = time.time() - t0
+
+        xt = x[triangles]
+        yt = y[triangles]
+        area_t = 0.5 * np.sum((xt[:, 1] - xt[:, 0]) * (yt[:, 2] - yt[:, 0])
+                              - (xt[:, 2] - xt[:, 0]) * (yt[:, 1] - yt[:, 0]))
+
+        print('  %8d  %s  %14.4f  %16.2e' %
+              (nv, t_ear, t_mon, abs(area_t - area)))
+
+        nv = 2 * nv
+
+    print('')
+    print('POLYGON_TRIANGULATE_BENCH')
+    print('  Normal end of execution.')
+    return
+
+
+def timestamp():
+    import time
+
+    t = time.time()
+    print(time.ctime(t))
+
+    return None
+
+
+if (__name__ == '__main__'):
+    timestamp()
+    polygon_triangulate_bench()
+    timestamp()
@@ -67,25 +67,14 @@ def triangle_monte_carlo_test():
         p1 = reference_to_physical_t3(t1, n, p0)
         p2 = reference_to_physical_t3(t2, n, p0)
 
-        obj.new_fig()
-        obj.axs.scatter(*p0, s=0.5)
-        obj.axs.set_title("n={:d}".format(n))
-        obj.SavePng_Serial(obj.tempname + "-p0.png")
-
-        obj.new_fig()
-        obj.axs.scatter(*p1, s=0.5)
-        obj.axs.set_title("n={:d}".format(n))
-        obj.SavePng_Serial(obj.tempname + "-p1.png")
-        plt.close()
-
-        obj.new_fig()
-        obj.axs.scatter(*p2, s=0.5)
-        obj.axs.set_title("n={:d}".format(n))
-        obj.SavePng_Serial(obj.tempname + "-p2.png")
-        plt.close()
+        title = "n={:d}".format(n)
+        obj.scatter_frame(p0, title, pngname=obj.tempname + "-p0.png")
+        obj.scatter_frame(p1, title, pngname=obj.tempname + "-p1.png")
+        obj.scatter_frame(p2, title, pngname=obj.tempname + "-p2.png")
 
         n = 2 * n
 
+    obj.render_wait()
     #
     #  Terminate.
     #